@@ -0,0 +1,2 @@
+#the direction enums bind their relationships to each other (e.g. Axis.directions, CardinalDirection.diagonals) at import time, so they must all be imported before any of them are used.
+import geometry.direction.diagonal
@@ -1,5 +1,4 @@
-from functools import cache
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Final, TypeVar
 
 from geometry.orientation import Orientation
 from utility.enum_data import EnumDataclass
@@ -10,22 +9,25 @@ if TYPE_CHECKING:
 T = TypeVar('T')
 
 class Axis(Orientation):
-    @property
-    @cache
-    def perpendicular(self) -> 'Axis':
-        return Axis(not self.value)
-
-    @property
-    @cache
-    def directions(self) -> tuple['CardinalDirection', 'CardinalDirection']:
-        from geometry.direction.cardinal import CardinalDirection
-        return CardinalDirection((self, False)), CardinalDirection((self, True))
+    """
+    Direction relationships (perpendicular, directions) are plain member attributes bound once at import time, rather than computed properties, since they are evaluated in the inner loops of every manipulation.
+    The same relationships are also available as ordinal tables (e.g. AXIS_PERPENDICULARS) for code which indexes compact storage by ordinal.
+    """
+    perpendicular: Final['Axis']
+    directions: Final[tuple['CardinalDirection', 'CardinalDirection']]
 
     HORIZONTAL = False
     VERTICAL = True
 
+for _each in Axis:
+    _each.perpendicular = Axis(not _each.value)
+del _each
+
+#ordinal -> ordinal of the perpendicular axis
+AXIS_PERPENDICULARS: Final[tuple[int, ...]] = tuple(each.perpendicular.ordinal for each in Axis)
+
 class AxisDataclass(EnumDataclass[Axis, T]):
-    ...
+    __slots__ = ()
 
 if TYPE_CHECKING:
     from typing import type_check_only
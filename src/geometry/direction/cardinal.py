@@ -1,4 +1,3 @@
-from functools import cache
 from typing import TYPE_CHECKING, TypeVar, Final, NamedTuple
 
 from geometry.axis import Axis
@@ -24,9 +23,13 @@ class CardinalDirection(CardinalValue, Direction):
     Negative/positive refers to the sign of unit vectors along the relevant axis. I.e. North and West are negative directions, whilst South and East are positive directions.
 
     Booleans also used as part of internal logic in this file for accessing enum members by value on demand, but this should not be used outside this file - all relevant logic should be covered by helper properties and stored object members
+
+    As with Axis, opposite and diagonals are plain member attributes bound at import time (diagonals by geometry.direction.diagonal), with ordinal tables alongside.
     """
 
     unit_vector: Final[Vector[int]]
+    opposite: Final['CardinalDirection']
+    diagonals: Final[tuple['DiagonalDirection', 'DiagonalDirection']]
 
     def tmp(self, *args, **kwargs):
         print(args, kwargs)
@@ -38,20 +41,6 @@ class CardinalDirection(CardinalValue, Direction):
             self.axis.perpendicular: 0
         })
 
-    @property
-    @cache
-    def opposite(self) -> 'CardinalDirection':
-        return CardinalDirection((self.axis, not self.is_positive))
-
-    @property
-    @cache
-    def diagonals(self) -> tuple['DiagonalDirection', 'DiagonalDirection']:
-        from geometry.direction.diagonal import DiagonalDirection
-        return tuple(
-            DiagonalDirection._make({self.axis: self,self.axis.perpendicular: other})
-            for other in self.axis.perpendicular.directions
-        )
-
     @classmethod
     def _make(cls, *args, **kwargs) -> 'CardinalDirection':
         return cls(CardinalValue._make(*args, **kwargs))
@@ -66,8 +55,21 @@ class CardinalDirection(CardinalValue, Direction):
     #     return CardinalDirection(CardinalValue._make(data))
 
 
+for _each in CardinalDirection:
+    _each.opposite = CardinalDirection((_each.axis, not _each.is_positive))
+for _each in Axis:
+    _each.directions = (CardinalDirection((_each, False)), CardinalDirection((_each, True)))
+del _each
+
+#ordinal -> ordinal of the opposite direction
+CARDINAL_OPPOSITES: Final[tuple[int, ...]] = tuple(each.opposite.ordinal for each in CardinalDirection)
+#axis ordinal -> (negative, positive) direction ordinals
+AXIS_DIRECTIONS: Final[tuple[tuple[int, int], ...]] = tuple(tuple(each.ordinal for each in each_axis.directions) for each_axis in Axis)
+#ordinal -> ordinal of the axis
+CARDINAL_AXES: Final[tuple[int, ...]] = tuple(each.axis.ordinal for each in CardinalDirection)
+
 class CardinalDataclass(EnumDataclass[CardinalDirection, T]):
-    ...
+    __slots__ = ()
 
 
 if TYPE_CHECKING:
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import collections
-from functools import cache, singledispatchmethod
-from typing import TYPE_CHECKING, TypeVar
+from functools import singledispatchmethod
+from typing import TYPE_CHECKING, Final, TypeVar
 
 from geometry.axis import Axis
 from geometry.direction.cardinal import CardinalDirection, CardinalValue
@@ -44,12 +44,10 @@ class DiagonalValue(collections.namedtuple('_DiagonalValue', _tuplearg)):
 class DiagonalDirection(DiagonalValue, Direction):
     """
     Allows construction with a dict[Axis, CardinalDirection] by overriding _make
-    """
 
-    @property
-    @cache
-    def opposite(self):
-        return DiagonalDirection._make((self.horizontal.opposite, self.vertical.opposite))
+    opposite is a plain member attribute bound at import time, as with the other direction relationships.
+    """
+    opposite: Final['DiagonalDirection']
 
     NORTH_WEST = (CardinalDirection.WEST, CardinalDirection.NORTH)
     NORTH_EAST = (CardinalDirection.EAST, CardinalDirection.NORTH)
@@ -61,8 +59,22 @@ class DiagonalDirection(DiagonalValue, Direction):
         return cls(DiagonalValue._make(*args, **kwargs))
 
 
+for _each in DiagonalDirection:
+    _each.opposite = DiagonalDirection._make((_each.horizontal.opposite, _each.vertical.opposite))
+for _each in CardinalDirection:
+    _each.diagonals = tuple(
+        DiagonalDirection._make({_each.axis: _each, _each.axis.perpendicular: other})
+        for other in _each.axis.perpendicular.directions
+    )
+del _each
+
+#ordinal -> ordinal of the opposite direction
+DIAGONAL_OPPOSITES: Final[tuple[int, ...]] = tuple(each.opposite.ordinal for each in DiagonalDirection)
+#cardinal ordinal -> ordinals of the (negative, positive) diagonals on that side
+CARDINAL_DIAGONALS: Final[tuple[tuple[int, int], ...]] = tuple(tuple(each.ordinal for each in each_cardinal.diagonals) for each_cardinal in CardinalDirection)
+
 class DiagonalDataclass(EnumDataclass[DiagonalDirection, T]):
-    ...
+    __slots__ = ()
 
 if TYPE_CHECKING:
     from typing import type_check_only
@@ -0,0 +1,217 @@
+import bisect
+from typing import MutableMapping, MutableSequence, Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from geometry.axis import Axis
+from geometry.direction.diagonal import DiagonalDirection
+from geometry.graph.coordinates import CoordinateStore
+
+if TYPE_CHECKING:
+    from geometry.graph.vertex import Vertex
+
+
+class _AxisBuckets:
+    """
+    The slots of the vertices at each coordinate along one axis, and the distinct coordinates in ascending order.
+    The slots on each line which has been looked up are also cached in order along the line, with their positions, until any vertex moves.
+    """
+    __slots__ = ('by_value', 'values', 'indexed', 'ordered')
+
+    by_value: MutableMapping[int, set[int]]
+    values: MutableSequence[int]
+    indexed: np.ndarray
+    ordered: MutableMapping[int, tuple[np.ndarray, np.ndarray]]
+
+    def __init__(self):
+        self.by_value = {}
+        self.values = []
+        self.indexed = np.zeros(0, dtype=np.int32)
+        self.ordered = {}
+
+    def add(self, slot: int, value: int):
+        bucket = self.by_value.get(value)
+        if bucket is None:
+            bucket = self.by_value[value] = set()
+            bisect.insort(self.values, value)
+        bucket.add(slot)
+        self.indexed[slot] = value
+
+    def remove(self, slot: int):
+        value = int(self.indexed[slot])
+        bucket = self.by_value[value]
+        bucket.discard(slot)
+        if len(bucket) == 0:
+            del self.by_value[value]
+            del self.values[bisect.bisect_left(self.values, value)]
+
+    def rebuild(self, slots: np.ndarray, values: np.ndarray):
+        """
+        Re-buckets the given slots from scratch, grouping them with a single sort rather than inserting them one at a time.
+        :param slots: every slot which is indexed.
+        :param values: the current value of each slot.
+        """
+        order = np.argsort(values, kind='stable')
+        (slots, values) = (slots[order], values[order])
+        boundaries = np.flatnonzero(values[1:] != values[:-1]) + 1
+        distinct = values[np.concatenate(([0], boundaries))] if len(values) > 0 else values
+        (ordered, starts) = (slots.tolist(), [0, *boundaries.tolist()])
+        ends = [*starts[1:], len(ordered)]
+        self.by_value = {each_value: set(ordered[each_start:each_end]) for (each_value, each_start, each_end) in zip(distinct.tolist(), starts, ends)}
+        self.values = distinct.tolist()
+        self.indexed[slots] = values
+
+
+class AlignmentIndex:
+    """
+    Finds the vertices which lie on a line, i.e. which share the same coordinate along an axis, in order along the perpendicular axis.
+    Where vertices on a line share a location, those at the ends of their tiles come before those at the starts (e.g. where one tile ends at the same location as the next begins), so the order is also a valid walk along the line in the negative direction once reversed.
+
+    For each axis, the slots of all vertices are bucketed by their coordinate, and the distinct coordinates are kept sorted so that the lines within a range can be found by bisection.
+    - Vertices are added and removed along with their tiles (see TileRegistry.create_tile).
+    - Moves are reconciled lazily, since many are vectorised writes directly to the CoordinateStore (e.g. by a ResizePlan). The first lookup after the store has been written to (see CoordinateStore.version) compares the coordinates that each slot was indexed at with the store in a single vectorised pass, then re-buckets only the slots that differ (or regroups every slot with a single sort, if many have moved).
+
+    The index spans the whole registry, so lines may continue across canvases. Since canvases do not overlap, a lookup restricted to a range within a canvas only finds vertices of that canvas.
+    """
+    __slots__ = ('_coordinates', '_vertices', '_present', '_ends', '_axes', '_version')
+
+    _coordinates: CoordinateStore
+    _vertices: MutableSequence[Optional['Vertex']]
+    _present: np.ndarray
+    _ends: tuple[np.ndarray, np.ndarray]
+    _axes: tuple[_AxisBuckets, _AxisBuckets]
+    _version: int
+
+    def __init__(self, coordinates: CoordinateStore):
+        self._coordinates = coordinates
+        self._vertices = []
+        self._present = np.zeros(0, dtype=bool)
+        self._ends = (np.zeros(0, dtype=bool), np.zeros(0, dtype=bool))
+        self._axes = (_AxisBuckets(), _AxisBuckets())
+        self._version = coordinates.version
+
+    def __len__(self) -> int:
+        return int(self._present.sum())
+
+    def add(self, vertex: 'Vertex'):
+        #each slot is always in the bucket for the coordinate it was indexed at, so adding and removing slots does not require reconciling the rest.
+        slot = vertex.slot
+        if slot >= len(self._vertices):
+            self._grow(slot + 1)
+        self._vertices[slot] = vertex
+        self._present[slot] = True
+        for (each_axis, each_buckets) in zip(Axis, self._axes):
+            each_buckets.add(slot, self._coordinates.component(slot, each_axis))
+            each_buckets.ordered.clear()
+            self._ends[each_axis.value][slot] = each_axis.directions[1] in vertex.role
+
+    def extend(self, vertices: Sequence['Vertex']):
+        """
+        Adds many vertices at once, regrouping every slot with a single sort per axis rather than inserting them one at a time (e.g. to load a snapshot, see read_snapshot).
+        Vertices are still added one at a time if there are few of them compared to the rest (e.g. to rehydrate a small canvas, see TileRegistry.rehydrate).
+        """
+        if len(vertices) <= len(self) // 8:
+            for each in vertices:
+                self.add(each)
+            return
+        slots = np.fromiter((each.slot for each in vertices), dtype=np.intp, count=len(vertices))
+        if len(slots) == 0:
+            return
+        if slots.max() >= len(self._vertices):
+            self._grow(int(slots.max()) + 1)
+        for (each_vertex, each_slot) in zip(vertices, slots.tolist()):
+            self._vertices[each_slot] = each_vertex
+        self._present[slots] = True
+        roles = np.fromiter((each.role.ordinal for each in vertices), dtype=np.intp, count=len(vertices))
+        for (each_axis, each_buckets) in zip(Axis, self._axes):
+            self._ends[each_axis.value][slots] = np.array([each_axis.directions[1] in each_role for each_role in DiagonalDirection])[roles]
+            present = np.flatnonzero(self._present)
+            each_buckets.rebuild(present, self._coordinates.components(each_axis)[present])
+            each_buckets.ordered.clear()
+        #every slot has just been bucketed at its current coordinates.
+        self._version = self._coordinates.version
+
+    def remove(self, vertex: 'Vertex'):
+        slot = vertex.slot
+        self._vertices[slot] = None
+        self._present[slot] = False
+        for each_buckets in self._axes:
+            each_buckets.remove(slot)
+            each_buckets.ordered.clear()
+
+    def compact(self):
+        """
+        Regroups every slot with a single sort per axis, which also releases the storage of buckets that have shrunk, since sets do not shrink as slots are discarded (e.g. after the windows of a canvas have been dropped, see TileRegistry.hibernate).
+        """
+        present = np.flatnonzero(self._present)
+        for (each_axis, each_buckets) in zip(Axis, self._axes):
+            each_buckets.rebuild(present, self._coordinates.components(each_axis)[present])
+            each_buckets.ordered.clear()
+        self._version = self._coordinates.version
+
+    def _grow(self, size: int):
+        size = max(size, 2 * len(self._vertices))
+        self._vertices += [None] * (size - len(self._vertices))
+        self._present = np.concatenate((self._present, np.zeros(size - len(self._present), dtype=bool)))
+        self._ends = tuple(np.concatenate((each, np.zeros(size - len(each), dtype=bool))) for each in self._ends)
+        for each_buckets in self._axes:
+            each_buckets.indexed = np.concatenate((each_buckets.indexed, np.zeros(size - len(each_buckets.indexed), dtype=np.int32)))
+
+    def _reconcile(self):
+        """
+        Re-buckets every slot whose coordinates have changed since it was indexed.
+        """
+        if self._version == self._coordinates.version:
+            return
+        self._version = self._coordinates.version
+        count = len(self._vertices)
+        for (each_axis, each_buckets) in zip(Axis, self._axes):
+            #slots beyond the vertices indexed so far have never been added, so cannot have moved.
+            current = self._coordinates.components(each_axis)[:count]
+            present = self._present[:len(current)]
+            moved = np.flatnonzero(present & (each_buckets.indexed[:len(current)] != current))
+            if len(moved) > len(current) // 8:
+                #e.g. after a whole row has been resized, it is cheaper to regroup everything at once.
+                slots = np.flatnonzero(present)
+                each_buckets.rebuild(slots, current[slots])
+            else:
+                for each_slot in moved.tolist():
+                    each_buckets.remove(each_slot)
+                    each_buckets.add(each_slot, int(current[each_slot]))
+            #the order along each line also changes when vertices move along it, without changing buckets.
+            each_buckets.ordered.clear()
+
+    def aligned(self, axis: Axis, value: int, start: Optional[int] = None, end: Optional[int] = None) -> Sequence['Vertex']:
+        """
+        :param axis: the axis along which the vertices share a coordinate.
+        :param value: the shared coordinate.
+        :param start: if given, only vertices at or after this coordinate along the perpendicular axis are included.
+        :param end: if given, only vertices at or before this coordinate along the perpendicular axis are included.
+        :return: the vertices on the line, in ascending order along the perpendicular axis.
+        """
+        self._reconcile()
+        buckets = self._axes[axis.value]
+        entry = buckets.ordered.get(value)
+        if entry is None:
+            bucket = buckets.by_value.get(value)
+            if bucket is None:
+                return []
+            slots = np.fromiter(bucket, dtype=np.intp, count=len(bucket))
+            positions = self._coordinates.components(axis.perpendicular)[slots]
+            order = np.lexsort((~self._ends[axis.perpendicular.value][slots], positions))
+            entry = buckets.ordered[value] = (slots[order], positions[order])
+
+        (ordered, positions) = entry
+        (first, last) = (
+            0 if start is None else int(np.searchsorted(positions, start, side='left')),
+            len(ordered) if end is None else int(np.searchsorted(positions, end, side='right'))
+        )
+        return [self._vertices[each] for each in ordered[first:last].tolist()]
+
+    def lines(self, axis: Axis, start: int, end: int) -> Sequence[int]:
+        """
+        :return: the coordinates along an axis within [start, end] at which any vertices lie, in ascending order.
+        """
+        self._reconcile()
+        values = self._axes[axis.value].values
+        return values[bisect.bisect_left(values, start):bisect.bisect_right(values, end)]
@@ -0,0 +1,64 @@
+from typing import Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from geometry.axis import Axis
+from geometry.direction.cardinal import CardinalDirection
+from geometry.graph.canvas import Canvas
+from geometry.graph.tile import Tile
+from geometry.graph.vertex import Vertex
+from geometry.graph.window import Window
+
+if TYPE_CHECKING:
+    from geometry.graph.registry import TileRegistry
+
+
+class GraphArrays:
+    """
+    A snapshot of the whole graph of a TileRegistry, encoded as flat arrays so that it can be inspected with vectorised operations (e.g. by audit) rather than one object at a time.
+
+    Vertices are numbered in the order of the tiles that own them (canvases first, then windows), four per tile in the order of DiagonalDirection, so the corners of tile t are vertices 4t to 4t+3.
+    - locations: (vertices, axes) coordinates, indexed by Axis.ordinal.
+    - roles: the DiagonalDirection ordinal of each vertex.
+    - owners: the tile number of each vertex.
+    - neighbours: (directions, vertices, 2) vertex numbers of the neighbours on each side, indexed by CardinalDirection.ordinal and padded with -1. Neighbours which are not owned by any tile of the registry (i.e. links to erased tiles) are encoded as -2.
+    - counts: (directions, vertices) number of neighbours on each side.
+    - is_sentinel: whether each tile is a canvas.
+
+    The tiles and vertices are kept alongside, so that results can be reported in terms of graph objects.
+    """
+    __slots__ = ('tiles', 'vertices', 'locations', 'roles', 'owners', 'neighbours', 'counts', 'is_sentinel')
+
+    tiles: Sequence[Tile]
+    vertices: Sequence[Vertex]
+    locations: np.ndarray
+    roles: np.ndarray
+    owners: np.ndarray
+    neighbours: np.ndarray
+    counts: np.ndarray
+    is_sentinel: np.ndarray
+
+    def __init__(self, registry: 'TileRegistry'):
+        self.tiles = [*registry.by_type[Canvas].values(), *registry.by_type[Window].values()]
+        self.vertices = [each_corner for each_tile in self.tiles for each_corner in each_tile.corners]
+        self.is_sentinel = np.fromiter((each.is_sentinel for each in self.tiles), dtype=bool, count=len(self.tiles))
+        self.owners = np.repeat(np.arange(len(self.tiles), dtype=np.int32), 4)
+        self.roles = np.tile(np.arange(4, dtype=np.int8), len(self.tiles))
+
+        slots = np.fromiter((each.slot for each in self.vertices), dtype=np.intp, count=len(self.vertices))
+        self.locations = np.stack([registry.coordinates.components(each_axis)[slots] for each_axis in Axis], axis=-1) if len(slots) > 0 else np.zeros((0, len(Axis)), dtype=np.int32)
+
+        #vertices are numbered by identity, since links may lead anywhere (including to vertices of erased tiles, whose slots may have been recycled).
+        numbers = {id(each): i for (i, each) in enumerate(self.vertices)}
+        #unused entries are None, which is numbered as padding.
+        numbers[id(None)] = -1
+        entries = [numbers.get(id(each), -2) for each_vertex in self.vertices for each in each_vertex.neighbours.entries]
+        table = np.array(entries, dtype=np.int32).reshape(len(self.vertices), len(CardinalDirection), 2).transpose(1, 0, 2).copy()
+        self.neighbours = table
+        self.counts = (table != -1).sum(axis=-1)
+
+    def __len__(self) -> int:
+        """
+        :return: the number of vertices.
+        """
+        return len(self.vertices)
@@ -16,7 +16,9 @@ class Box(TaggableElement):
 
     Boxes are allowed to cover multiple tiles and partial tiles in principle, although subclasses tend to have more specific rules.
     """
-    @enum_dataclass
+    __slots__ = ('corners',)
+
+    @enum_dataclass(compiled=True)
     class Corners(DiagonalDataclass[Vertex]):
         ...
 
@@ -24,6 +26,7 @@ class Box(TaggableElement):
         """
         Syntactic sugar over generating an edge corresponding to a side of the box.
         """
+        __slots__ = ('_owner',)
         _owner: Final['Box']
         def __init__(self, owner: 'Box'):
             self._owner = owner
@@ -19,8 +19,19 @@ class Canvas(Tile):
 
     Note:
         Canvass may have neighbours for the purpose of navigation (e.g. across monitors), but their vertices are still sentinels. o None.
+
+    Each canvas counts the windows placed within it. The count is maintained by its registry as procedures place windows within it (see TileRegistry.place_window), so that whether the canvas is divided can usually be checked without inspecting its sides (see is_divided).
+    Invariant: window_count is the number of windows placed within the canvas through its registry that have not been erased since, including those packed away while it hibernates (see TileRegistry.hibernate). A positive count therefore means the canvas is divided, but a count of 0 does not mean it is undivided, since windows may also be linked to its corners directly without being placed (e.g. by establish_connections_along_injection_axis).
     """
 
+    __slots__ = ('window_count',)
+
+    window_count: int
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.window_count = 0
+
     # def __init__(self, id: TileId, north_west: Vector, north_east: Vector, south_east: Vector, south_west: Vector):
     #     super().__init__(id, north_west, north_east, south_east, south_west)
 
@@ -33,3 +44,5 @@ class Canvas(Tile):
 
 class CanvasTag(TileTag, Tag[Canvas]):
     ...
+
+CanvasTag.Element = Canvas
@@ -0,0 +1,176 @@
+from typing import ClassVar, MutableSequence, Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from geometry.axis import Axis
+from geometry.vector import Vector
+
+if TYPE_CHECKING:
+    from geometry.graph.journal import Journal
+
+
+class CoordinateStore:
+    """
+    Struct-of-arrays storage for the locations of all vertices owned by a TileRegistry.
+
+    Each vertex is assigned a compact integer slot, and its coordinates live at that index of one int32 array per axis. Vertex.location reads and writes through to these arrays, so the arrays are always the source of truth.
+    This allows whole groups of vertices (e.g. every vertex on a canvas) to be translated, scaled or compared with vectorised operations, and stores 8 bytes per vertex rather than a Vector object each.
+
+    Slots are recycled once released, so a released slot must not be read through a Vertex of an erased tile.
+
+    Reading a location (e.g. through Vertex.location) is by far the most common access, so the Vector of each slot is cached once read, until the slot is next written to. This keeps reads as cheap as reading an attribute, at the cost of a Vector for each vertex which has been read since it last moved.
+
+    The version counts writes to the store, so that anything derived from the coordinates (see AlignmentIndex) can tell whether it needs to be reconciled.
+    While the journal of the registry is active, the coordinates of the slots about to be written to are recorded before each write (see Journal).
+    """
+    _INITIAL_CAPACITY: ClassVar[int] = 64
+
+    _components: tuple[np.ndarray, np.ndarray]
+    _locations: MutableSequence[Optional[Vector[int]]]
+    _free_slots: MutableSequence[int]
+    _size: int
+    version: int
+    journal: Optional['Journal']
+
+    def __init__(self, journal: Optional['Journal'] = None):
+        self._components = tuple(np.zeros(self._INITIAL_CAPACITY, dtype=np.int32) for _ in Axis)
+        self._locations = [None] * self._INITIAL_CAPACITY
+        self._free_slots = []
+        self._size = 0
+        self.version = 0
+        self.journal = journal
+
+    def _record(self, slots: np.ndarray):
+        if self.journal is not None and self.journal.active:
+            self.journal.record_coordinates(slots, tuple(each[slots] for each in self._components))
+
+    def _forget(self, slots: np.ndarray):
+        """
+        Drops the cached locations of slots which are about to be written to in bulk.
+        """
+        locations = self._locations
+        for each in slots.tolist():
+            locations[each] = None
+
+    def __len__(self) -> int:
+        """
+        :return: the number of slots currently allocated.
+        """
+        return self._size - len(self._free_slots)
+
+    @property
+    def capacity(self) -> int:
+        return len(self._components[0])
+
+    def allocate(self, location: Vector[int]) -> int:
+        if len(self._free_slots) > 0:
+            slot = self._free_slots.pop()
+        else:
+            if self._size == self.capacity:
+                self._components = tuple(np.concatenate((each, np.zeros(len(each), dtype=np.int32))) for each in self._components)
+                self._locations += [None] * len(self._locations)
+            slot = self._size
+            self._size += 1
+        self[slot] = location
+        return slot
+
+    def extend(self, components: tuple[np.ndarray, np.ndarray]) -> Sequence[int]:
+        """
+        Allocates many slots at once, writing their coordinates in a single vectorised pass rather than one slot at a time (e.g. to load a snapshot, see read_snapshot). Released slots are reused first, then a contiguous run is allocated at the end of the store.
+        :param components: the coordinates along each axis of the new slots.
+        :return: the new slots.
+        """
+        count = len(components[0])
+        reused = self._free_slots[max(len(self._free_slots) - count, 0):]
+        del self._free_slots[len(self._free_slots) - len(reused):]
+        (first, fresh) = (self._size, count - len(reused))
+        if first + fresh > self.capacity:
+            capacity = max(first + fresh, 2 * self.capacity)
+            self._components = tuple(np.concatenate((each, np.zeros(capacity - len(each), dtype=np.int32))) for each in self._components)
+            self._locations += [None] * (capacity - len(self._locations))
+        slots = [*reversed(reused), *range(first, first + fresh)]
+        indices = np.array(slots, dtype=np.intp)
+        self._forget(indices)
+        for (each_components, each_values) in zip(self._components, components):
+            each_components[indices] = each_values
+        self._size += fresh
+        self.version += 1
+        return slots
+
+    def release(self, slot: int):
+        self._free_slots.append(slot)
+
+    def __getitem__(self, slot: int) -> Vector[int]:
+        result = self._locations[slot]
+        if result is None:
+            result = self._locations[slot] = Vector(int(self._components[0][slot]), int(self._components[1][slot]))
+        return result
+
+    def __setitem__(self, slot: int, location: Vector[int]):
+        if self.journal is not None and self.journal.active:
+            self._record(np.array([slot], dtype=np.intp))
+        self._components[0][slot] = location.horizontal
+        self._components[1][slot] = location.vertical
+        self._locations[slot] = None
+        self.version += 1
+
+    def component(self, slot: int, axis: Axis) -> int:
+        """
+        Reads a single coordinate without building a Vector.
+        """
+        return int(self._components[axis.value][slot])
+
+    def components(self, axis: Axis) -> np.ndarray:
+        """
+        :return: a view of the coordinates along an axis for every slot below the high-water mark (including released slots). It should not be written to, since writes would not be counted by the version, nor drop the cached locations.
+        """
+        return self._components[axis.value][:self._size]
+
+    def translate(self, slots: Sequence[int], offset: Vector[int]):
+        """
+        Moves every given slot by the same offset.
+        """
+        slots = np.asarray(slots, dtype=np.intp)
+        self._record(slots)
+        self._forget(slots)
+        for each_axis in Axis:
+            self._components[each_axis.value][slots] += offset[each_axis]
+        self.version += 1
+
+    def assign(self, slots: Sequence[int], axis: Axis, values: Sequence[int]):
+        """
+        Sets the coordinate along an axis of each given slot to the corresponding value.
+        """
+        slots = np.asarray(slots, dtype=np.intp)
+        self._record(slots)
+        self._forget(slots)
+        self._components[axis.value][slots] = values
+        self.version += 1
+
+    def scale(self, slots: Sequence[int], origin: Vector[int], numerator: int, denominator: int):
+        """
+        Scales the given slots about an origin by the exact ratio numerator/denominator, rounding towards negative infinity so that results remain integers.
+        """
+        slots = np.asarray(slots, dtype=np.intp)
+        self._record(slots)
+        self._forget(slots)
+        for each_axis in Axis:
+            each_components = self._components[each_axis.value]
+            offsets = each_components[slots].astype(np.int64) - origin[each_axis]
+            each_components[slots] = origin[each_axis] + (offsets * numerator) // denominator
+        self.version += 1
+
+    def restore(self, slots: np.ndarray, components: tuple[np.ndarray, np.ndarray]):
+        """
+        Writes back coordinates previously read from the given slots, e.g. to roll back a Journal. This is not recorded.
+        """
+        self._forget(slots)
+        for (each_components, each_values) in zip(self._components, components):
+            each_components[slots] = each_values
+        self.version += 1
+
+    def aligned(self, slots: Sequence[int], axis: Axis, value: int) -> np.ndarray:
+        """
+        :return: a boolean mask over the given slots, true where the coordinate along the axis equals the value.
+        """
+        return self._components[axis.value][np.asarray(slots, dtype=np.intp)] == value
@@ -0,0 +1,58 @@
+from typing import Iterator, MutableMapping, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from geometry.graph.tile import Tile
+
+
+class DirtyTracker:
+    """
+    Records the tiles which have been created or modified (see Tile.touch) since they were last validated, so that validation can be restricted to the region that changed (see validate_dirty).
+
+    Procedures already touch every tile whose vertices they modify, so tiles record themselves here when touched rather than each procedure recording them separately.
+    Erased tiles are forgotten (see TileRegistry._erase_tile).
+    """
+    __slots__ = ('_tiles',)
+
+    _tiles: MutableMapping['Tile', None]
+
+    def __init__(self):
+        #a dict rather than a set, so that tiles are validated in the order they were first modified.
+        self._tiles = {}
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def __contains__(self, target: 'Tile') -> bool:
+        return target in self._tiles
+
+    def __iter__(self) -> Iterator['Tile']:
+        return iter(self._tiles)
+
+    def mark(self, target: 'Tile'):
+        self._tiles[target] = None
+
+    def discard(self, target: 'Tile'):
+        self._tiles.pop(target, None)
+
+    def take(self) -> Sequence['Tile']:
+        """
+        :return: the dirty tiles, which are then no longer considered dirty.
+        """
+        result = list(self._tiles)
+        self._tiles = {}
+        return result
+
+    def stash(self) -> MutableMapping['Tile', None]:
+        """
+        Sets the dirty tiles aside, so that any tiles marked from now on can be told apart from them, e.g. while previewing a manipulation which is then rolled back (see preview).
+        :return: the tiles set aside, to be restored with unstash.
+        """
+        result = self._tiles
+        self._tiles = {}
+        return result
+
+    def unstash(self, stashed: MutableMapping['Tile', None]):
+        """
+        Restores the tiles set aside by stash, forgetting any marked since.
+        """
+        self._tiles = stashed
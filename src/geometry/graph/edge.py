@@ -1,12 +1,22 @@
 from dataclasses import dataclass
-from functools import cache
-from typing import NamedTuple
+from typing import Final, NamedTuple, Optional
 
 from geometry.axis import Axis
+from geometry.direction.diagonal import DiagonalDirection
 from geometry.graph.helpers import parse_tag
 from geometry.graph.tag import Tag
 from geometry.graph.vertex import Vertex, VertexTag
 
+#(role ordinal of a, role ordinal of b) -> the axis along which an edge between them runs, or None if the roles are not on a common side.
+#Derived properties of Edges are computed from tables like this instead of being cached, since a cache would keep every Edge (and through it every Vertex and Tile) alive.
+_AXES_BY_ROLES: Final[tuple[tuple[Optional[Axis], ...], ...]] = tuple(
+    tuple(
+        Axis.HORIZONTAL if each_a.vertical == each_b.vertical else Axis.VERTICAL if each_a.horizontal == each_b.horizontal else None
+        for each_b in DiagonalDirection
+    )
+    for each_a in DiagonalDirection
+)
+
 
 class Edge(NamedTuple):
     """
@@ -42,17 +52,18 @@ class Edge(NamedTuple):
         return str(self)
 
     @property
-    @cache
     def axis(self) -> Axis:
-        assert self.a.role.vertical == self.b.role.vertical or self.a.role.horizontal == self.b.role.horizontal
-        return Axis.HORIZONTAL if self.a.role.vertical == self.b.role.vertical else Axis.VERTICAL
+        result = _AXES_BY_ROLES[self.a.role.ordinal][self.b.role.ordinal]
+        assert result is not None
+        return result
 
     def distance(self):
         """
         Since edges are axis-aligned, take the values along that axis
         :return:
         """
-        return self.b.location[self.axis] - self.a.location[self.axis]
+        axis = self.axis
+        return self.b.location[axis] - self.a.location[axis]
 
 
 @dataclass
@@ -0,0 +1,107 @@
+from typing import Mapping, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from geometry.axis import Axis
+from geometry.direction.cardinal import CardinalDirection
+from geometry.direction.diagonal import DiagonalDirection
+from geometry.graph.canvas import Canvas
+from geometry.graph.spatial import Bounds
+from geometry.graph.tile import TileId
+from geometry.graph.window import Window
+
+if TYPE_CHECKING:
+    from geometry.graph.coordinates import CoordinateStore
+    from geometry.graph.dirty import DirtyTracker
+    from geometry.graph.journal import Journal
+
+#diagonal ordinal, entry -> whether the entry of a canvas corner with that role is on a side facing into the canvas.
+_INWARD: np.ndarray = np.array([[each_direction not in each_role for each_direction in CardinalDirection for _ in range(2)] for each_role in DiagonalDirection])
+
+
+class HibernatedCanvas:
+    """
+    The windows of a hibernating canvas, packed into arrays in place of their tile, vertex and neighbourhood objects (see TileRegistry.hibernate). This costs under 200 bytes per window.
+
+    Vertices are numbered four per window in the order the windows were placed, in the order of DiagonalDirection, followed by the four corners of the canvas.
+    - ids: the TileId number of each window.
+    - names: the name of each named window, by window number.
+    - dirty: whether each window was dirty (see DirtyTracker), and canvas_dirty whether the canvas was.
+    - locations: (window vertices, axes) coordinates, indexed by Axis.ordinal.
+    - neighbours: (window vertices, entries) the vertex numbers of the neighbourhood entries of each window vertex (see VertexNeighbourhood.entries), with unused entries as -1.
+    - corner_neighbours: (corners, entries) the same for the corners of the canvas. Entries on the sides facing out of the canvas are -1, since they are left as they are (e.g. links to other canvases).
+    """
+    __slots__ = ('canvas', 'ids', 'names', 'dirty', 'canvas_dirty', 'locations', 'neighbours', 'corner_neighbours')
+
+    canvas: Canvas
+    ids: np.ndarray
+    names: Mapping[int, str]
+    dirty: np.ndarray
+    canvas_dirty: bool
+    locations: np.ndarray
+    neighbours: np.ndarray
+    corner_neighbours: np.ndarray
+
+    def __init__(self, canvas: Canvas, windows: Sequence[Window], coordinates: 'CoordinateStore', dirty: 'DirtyTracker'):
+        """
+        :param canvas:
+        :param windows: every window placed within the canvas (see TileRegistry.windows_in).
+        :param coordinates: the store that the vertices of the windows were allocated in.
+        :param dirty:
+        """
+        self.canvas = canvas
+        self.ids = np.fromiter((each.id.number for each in windows), dtype=np.int64, count=len(windows))
+        self.names = {i: each.name for (i, each) in enumerate(windows) if each.name is not None}
+        self.dirty = np.fromiter((each in dirty for each in windows), dtype=bool, count=len(windows))
+        self.canvas_dirty = canvas in dirty
+
+        vertices = [each_corner for each in windows for each_corner in each.corners]
+        slots = np.fromiter((each.slot for each in vertices), dtype=np.intp, count=len(vertices))
+        self.locations = np.stack([coordinates.components(each_axis)[slots] for each_axis in Axis], axis=-1) if len(slots) > 0 else np.zeros((0, len(Axis)), dtype=np.int32)
+
+        #vertices are numbered by identity, and anything else is numbered -2 so that links leaving the canvas can be found.
+        numbers = {id(each): i for (i, each) in enumerate((*vertices, *canvas.corners))}
+        numbers[id(None)] = -1
+        entry_count = 2 * len(CardinalDirection)
+        self.neighbours = np.array([numbers.get(id(each), -2) for each_vertex in vertices for each in each_vertex.neighbours.entries], dtype=np.int32).reshape(len(vertices), entry_count)
+        self.corner_neighbours = np.where(_INWARD, np.array([numbers.get(id(each), -2) for each_corner in canvas.corners for each in each_corner.neighbours.entries], dtype=np.int32).reshape(len(_INWARD), entry_count), -1)
+        if (self.neighbours == -2).any() or (self.corner_neighbours == -2).any():
+            raise ValueError(f"Cannot hibernate canvas {canvas.generate_tag()}, since its windows are linked to tiles outside of it.")
+
+    def __len__(self) -> int:
+        """
+        :return: the number of windows.
+        """
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The size of the arrays, which is most of the memory used while the canvas hibernates.
+        """
+        return sum(each.nbytes for each in (self.ids, self.dirty, self.locations, self.neighbours, self.corner_neighbours))
+
+    def restore(self, coordinates: 'CoordinateStore', dirty: 'DirtyTracker', journal: 'Journal') -> tuple[Sequence[Window], Sequence[Bounds]]:
+        """
+        Recreates the windows, with the same ids, in newly allocated slots (reusing those released when it hibernated), and links them to each other and to the corners of the canvas as they were.
+        The windows are not indexed, named or placed, which is left to the registry (see TileRegistry.rehydrate).
+        :return: the windows in the order they were placed, and the bounds of each.
+        """
+        slots = coordinates.extend((self.locations[:, 0], self.locations[:, 1]))
+        windows = [
+            Window(TileId(each_id), None, None, None, None, coordinates=coordinates, dirty=dirty, journal=journal, slots=slots[4 * i:4 * i + 4])
+            for (i, each_id) in enumerate(self.ids.tolist())
+        ]
+        window_vertices = [each_corner for each in windows for each_corner in each.corners]
+        vertices = [*window_vertices, *self.canvas.corners]
+
+        #index the vertices with the tables directly, with the padding (-1) selecting the None after the last vertex.
+        objects = np.empty(len(vertices) + 1, dtype=object)
+        objects[:len(vertices)] = vertices
+        for (each_vertex, each_entries) in zip(window_vertices, objects[self.neighbours].tolist()):
+            each_vertex.neighbours.restore(each_entries)
+        for (each_corner, each_inward, each_entries) in zip(self.canvas.corners, _INWARD.tolist(), objects[self.corner_neighbours].tolist()):
+            each_corner.neighbours.restore([each_entry if each_is_inward else each_kept for (each_is_inward, each_entry, each_kept) in zip(each_inward, each_entries, each_corner.neighbours.entries)])
+
+        corners = np.concatenate((self.locations[0::4], self.locations[2::4]), axis=1)
+        return (windows, [Bounds(*each) for each in corners.tolist()])
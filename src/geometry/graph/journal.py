@@ -0,0 +1,258 @@
+import sys
+from typing import Final, MutableMapping, MutableSequence, Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from geometry.axis import Axis
+
+if TYPE_CHECKING:
+    from geometry.graph.canvas import Canvas
+    from geometry.graph.neighbourhood import VertexNeighbourhood
+    from geometry.graph.registry import TileRegistry
+    from geometry.graph.tile import Tile
+    from geometry.graph.vertex import Vertex
+
+#rough sizes of what a delta keeps alive, for budgeting (see Delta.nbytes): the entries of a neighbourhood before and after, and a detached tile with its vertices and their neighbourhoods.
+_NEIGHBOURHOOD_BYTES: Final[int] = 2 * sys.getsizeof((None,) * 8) + 64
+_TILE_BYTES: Final[int] = 1024
+
+
+class Delta:
+    """
+    The modifications made to the graph of a TileRegistry within a transaction, stored compactly enough to be kept for undo and redo (see UndoHistory).
+    - The coordinates of each slot written to, before and after, as arrays.
+    - The entries of each neighbourhood written to, before and after.
+    - The tiles created and erased, which are detached from the registry rather than released while the delta can still restore them (see TileRegistry._detach_tile).
+    - The tiles touched, which are re-indexed and touched again whenever the delta is applied, and the generation each had before. Until the delta is kept (see UndoHistory.record), also the values derived from each tile before (see Tile.derive), in case it is reverted (see Journal.revert).
+    - The number of the first tile id taken, if any tiles were created.
+    Applying a delta costs time in proportion to its size, not to the size of the layout.
+    """
+    __slots__ = ('created', 'erased', 'canvases', 'touched', 'generations', 'derived', 'first_id', 'neighbours', 'slots', 'before', 'after', 'undone')
+
+    created: Sequence['Tile']
+    erased: Sequence['Tile']
+    canvases: MutableMapping['Tile', Optional['Canvas']]
+    touched: Sequence['Tile']
+    generations: Sequence[int]
+    derived: Optional[Sequence[Optional[dict]]]
+    first_id: Optional[int]
+    neighbours: Sequence[tuple['VertexNeighbourhood', Sequence[Optional['Vertex']], Sequence[Optional['Vertex']]]]
+    slots: np.ndarray
+    before: tuple[np.ndarray, np.ndarray]
+    after: tuple[np.ndarray, np.ndarray]
+    undone: bool
+
+    def __init__(self, created: Sequence['Tile'], erased: Sequence['Tile'], canvases: MutableMapping['Tile', Optional['Canvas']], touched: Sequence['Tile'], generations: Sequence[int], derived: Optional[Sequence[Optional[dict]]], first_id: Optional[int], neighbours, slots: np.ndarray, before: tuple[np.ndarray, np.ndarray], after: tuple[np.ndarray, np.ndarray]):
+        self.created = created
+        self.erased = erased
+        self.canvases = canvases
+        self.touched = touched
+        self.generations = generations
+        self.derived = derived
+        self.first_id = first_id
+        self.neighbours = neighbours
+        self.slots = slots
+        self.before = before
+        self.after = after
+        self.undone = False
+
+    @property
+    def tiles(self) -> Sequence['Tile']:
+        """
+        The tiles which were created or touched, i.e. which may have changed.
+        """
+        return list(dict.fromkeys((*self.created, *self.touched)))
+
+    @property
+    def nbytes(self) -> int:
+        """
+        An estimate of the memory kept by the delta.
+        """
+        return (
+            self.slots.nbytes + sum(each.nbytes for each in (*self.before, *self.after))
+            + _NEIGHBOURHOOD_BYTES * len(self.neighbours)
+            + _TILE_BYTES * (len(self.created) + len(self.erased))
+            + 16 * len(self.touched)
+        )
+
+    def apply(self, registry: 'TileRegistry', forward: bool):
+        """
+        Restores the graph to its state after the modifications (forward, i.e. redo) or before them (i.e. undo).
+        The graph must be in the opposite state, i.e. every later delta must have been undone first.
+        :param registry:
+        :param forward:
+        :return:
+        """
+        (attached, detached) = (self.created, self.erased) if forward else (self.erased, self.created)
+        #tiles are detached before their coordinates change, and attached after, since both read the coordinates to index them.
+        for each_tile in reversed(detached):
+            registry._detach_tile(each_tile)
+        for (each_neighbourhood, each_before, each_after) in self.neighbours:
+            each_neighbourhood.restore(each_after if forward else each_before)
+        if len(self.slots) > 0:
+            registry.coordinates.restore(self.slots, self.after if forward else self.before)
+        for each_tile in attached:
+            registry._attach_tile(each_tile, self.canvases.get(each_tile))
+        for each_tile in self.touched:
+            if registry.by_type[each_tile.__class__].get(each_tile.id) is each_tile:
+                registry.reindex_tile(each_tile)
+                each_tile.touch()
+        self.undone = not forward
+
+    def matches(self, registry: 'TileRegistry') -> bool:
+        """
+        Whether the tiles which the delta refers to are still those in the registry (or held detached by the delta), as they were when it was last applied, i.e. none of them have been dropped or replaced since (e.g. by hibernating their canvas, see TileRegistry.hibernate).
+        :param registry:
+        :return:
+        """
+        (attached, detached) = (self.erased, self.created) if self.undone else (self.created, self.erased)
+        detached = set(detached)
+        for each_tile in (*attached, *self.touched, *filter(None, self.canvases.values())):
+            if each_tile not in detached and registry.by_type[each_tile.__class__].get(each_tile.id) is not each_tile:
+                return False
+        return True
+
+    def release(self, registry: 'TileRegistry'):
+        """
+        Releases the slots of the tiles which the delta holds detached (the created tiles if it has been undone, otherwise the erased ones), once it will no longer be applied.
+        """
+        for each_tile in (self.created if self.undone else self.erased):
+            registry._release_tile(each_tile)
+
+
+class Journal:
+    """
+    Records how the graph of a TileRegistry is modified while it is active, so that a group of modifications can be rolled back without copying the graph (see Transaction), or kept as a Delta for undo (see UndoHistory).
+
+    Procedures do not record anything themselves, the graph records the state it is about to overwrite:
+    - The neighbours of each vertex, the first time they are modified (see VertexNeighbourhood).
+    - The coordinates of the slots written to, before every write (see CoordinateStore).
+    - The tiles which are created and erased, and those which are touched. Erased tiles are only detached from the registry, so that their slots cannot be reused while they may still be restored (see TileRegistry._erase_tile).
+
+    While it is not active, it counts the tiles touched instead (see unrecorded), i.e. the manipulations made outside of a transaction, which are not recorded anywhere.
+    """
+    __slots__ = ('active', 'unrecorded', '_neighbours', '_coordinates', '_created', '_erased', '_touched', '_first_id')
+
+    active: bool
+    unrecorded: int
+    _neighbours: MutableMapping['VertexNeighbourhood', Sequence[Optional['Vertex']]]
+    _coordinates: MutableSequence[tuple[np.ndarray, tuple[np.ndarray, np.ndarray]]]
+    _created: MutableMapping['Tile', None]
+    _erased: MutableMapping['Tile', Optional['Canvas']]
+    _touched: MutableMapping['Tile', tuple[int, Optional[dict]]]
+    _first_id: Optional[int]
+
+    def __init__(self):
+        self.active = False
+        self.unrecorded = 0
+        self._clear()
+
+    def _clear(self):
+        self._neighbours = {}
+        self._coordinates = []
+        #dicts rather than sets, so that tiles are listed in the order they were first recorded.
+        self._created = {}
+        self._erased = {}
+        self._touched = {}
+        self._first_id = None
+
+    def begin(self):
+        if self.active:
+            raise ValueError("A journal cannot be nested, it is already recording.")
+        self._clear()
+        self.active = True
+
+    def record_neighbours(self, target: 'VertexNeighbourhood'):
+        if target not in self._neighbours:
+            self._neighbours[target] = target.entries
+
+    def record_coordinates(self, slots: np.ndarray, components: tuple[np.ndarray, np.ndarray]):
+        """
+        :param slots: the slots about to be written to.
+        :param components: copies of their current coordinates along each axis.
+        """
+        self._coordinates.append((slots, components))
+
+    def record_creation(self, target: 'Tile'):
+        if self._first_id is None:
+            self._first_id = target.id.number
+        self._created[target] = None
+
+    def record_erasure(self, target: 'Tile', canvas: Optional['Canvas']):
+        """
+        :param target: a tile which has been detached from the registry.
+        :param canvas: the canvas it was placed within, if any.
+        """
+        self._erased[target] = canvas
+
+    def record_touch(self, target: 'Tile', generation: int, derived: Optional[dict]):
+        """
+        :param target:
+        :param generation: the generation of the tile before it was touched.
+        :param derived: the values derived from the tile before it was touched.
+        """
+        if target not in self._touched:
+            self._touched[target] = (generation, derived)
+
+    def finish(self, registry: 'TileRegistry') -> Delta:
+        """
+        Stops recording.
+        :param registry: the registry whose graph was recorded.
+        :return: the modifications made since the journal began.
+        """
+        self.active = False
+        #tiles which were both created and erased leave nothing to restore.
+        discarded = [each for each in self._created if each in self._erased]
+        for each_tile in discarded:
+            registry._release_tile(each_tile)
+        created = [each for each in self._created if each not in self._erased]
+        erased = [each for each in self._erased if each not in self._created]
+        canvases = {**{each: registry.canvas_of(each) for each in created}, **{each: self._erased[each] for each in erased}}
+
+        if len(self._coordinates) > 0:
+            recorded = np.concatenate([each_slots for (each_slots, _) in self._coordinates])
+            #the first value recorded for each slot is its value before any writes.
+            (slots, first) = np.unique(recorded, return_index=True)
+            kept = ~np.isin(slots, [each_corner.slot for each_tile in discarded for each_corner in each_tile.corners])
+            (slots, first) = (slots[kept], first[kept])
+            before = tuple(np.concatenate([each_components[each_axis.value] for (_, each_components) in self._coordinates])[first] for each_axis in Axis)
+            after = tuple(registry.coordinates.components(each_axis)[slots] for each_axis in Axis)
+        else:
+            slots = np.zeros(0, dtype=np.intp)
+            before = after = (np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32))
+
+        touched = [each for each in self._touched if each not in discarded]
+        result = Delta(
+            created, erased, canvases,
+            touched, [self._touched[each][0] for each in touched], [self._touched[each][1] for each in touched], self._first_id,
+            [(each_neighbourhood, each_before, each_neighbourhood.entries) for (each_neighbourhood, each_before) in self._neighbours.items()],
+            slots, before, after
+        )
+        self._clear()
+        return result
+
+    def rollback(self, registry: 'TileRegistry'):
+        """
+        Stops recording and restores the graph to its state when the journal began.
+        :param registry: the registry whose graph was recorded.
+        """
+        self.revert(registry, self.finish(registry))
+
+    def revert(self, registry: 'TileRegistry', target: Delta):
+        """
+        Restores the graph to its state before a delta which has just been finished, and will not be kept (e.g. once a preview has been read, see preview).
+        Since the graph is left exactly as it was, this is as if the delta had never been made:
+        - The touched tiles are given back their generations and derived values from before, so that anything derived from them beforehand (e.g. entries of a FocusTable) remains valid. Anything derived in the meantime was derived from other generations, which are never given out again.
+        - The ids taken by the created tiles are given back, to be taken again by the next tiles created.
+        - It is not counted as a manipulation outside of a transaction (see unrecorded).
+        :param registry: the registry whose graph was recorded.
+        :param target:
+        """
+        unrecorded = self.unrecorded
+        target.apply(registry, False)
+        target.release(registry)
+        for (each_tile, each_generation, each_derived) in zip(target.touched, target.generations, target.derived):
+            (each_tile.generation, each_tile._derived) = (each_generation, each_derived)
+        if target.first_id is not None:
+            registry._reuse_ids(target.first_id)
+        self.unrecorded = unrecorded
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-from typing import ClassVar, Sequence, Final, MutableSequence
+from abc import ABC, abstractmethod
+from typing import ClassVar, Hashable, Iterator, Optional, Sequence, Final, MutableSequence, TYPE_CHECKING
 
-from geometry.direction.cardinal import CardinalDataclass, CardinalDirection
+from geometry.direction.cardinal import CardinalDirection
 from geometry.graph.canvas import Canvas
 from geometry.graph.tile import Tile
-from utility.enum_data import enum_dataclass
 
+if TYPE_CHECKING:
+    from geometry.graph.journal import Journal
+    from geometry.graph.vertex import Vertex
 
-@enum_dataclass
-class VertexNeighbourhood(CardinalDataclass[MutableSequence['Vertex']]):
+
+class VertexNeighbourhood:
     """
     Slightly different from ordinary definitions, neighbourhoods here are directionally subdivided as they must be axis aligned, ordered, and we need to know the neighbours in both directions if a point lies between two neighbours along an axis.
     Neighbourhoods, unlike boxes, are often subject to updates and do not need to be treated as immutable.
@@ -20,24 +23,123 @@ class VertexNeighbourhood(CardinalDataclass[MutableSequence['Vertex']]):
     Note: After proper population, the neighbours may be ONLY be None for the outgoing directions of a Canvas.
 
     Note: the possible lengths on each side for vertex neighbours must be in the range [0,2], where 0 is only possible for the outward sides of a Canvas and 2 is only possible if the vertex is between the corners of two corners of the associated neighbouring tile(s)
+
+    Storage:
+    - Since each side has a fixed arity of at most 2, all sides share a single preallocated list of 2 entries per CardinalDirection (indexed by ordinal), with unused entries set to None.
+    - Accordingly, each side is read as an immutable tuple snapshot. Sides are updated by assigning a whole sequence, or a single entry via replace().
+    - Updates are recorded in the journal of the registry, if it is active (see Journal).
     """
+    __slots__ = ('_entries', '_journal')
+    #read once, since the length of an enum is slow to compute and a neighbourhood is created for every vertex.
+    _ENTRY_COUNT: ClassVar[int] = 2 * len(CardinalDirection)
+
+    _entries: Final[MutableSequence[Optional['Vertex']]]
+    _journal: Final[Optional['Journal']]
+
+    def __init__(self, journal: Optional['Journal'] = None):
+        self._entries = [None] * self._ENTRY_COUNT
+        self._journal = journal
+
+    def __getitem__(self, direction: CardinalDirection) -> Sequence['Vertex']:
+        offset = 2 * direction.ordinal
+        first = self._entries[offset]
+        if first is None:
+            return ()
+        second = self._entries[offset + 1]
+        return (first,) if second is None else (first, second)
+
+    def __setitem__(self, direction: CardinalDirection, neighbours: Sequence['Vertex']):
+        assert len(neighbours) <= 2
+        if self._journal is not None and self._journal.active:
+            self._journal.record_neighbours(self)
+        offset = 2 * direction.ordinal
+        self._entries[offset] = neighbours[0] if len(neighbours) > 0 else None
+        self._entries[offset + 1] = neighbours[1] if len(neighbours) > 1 else None
+
+    def replace(self, direction: CardinalDirection, index: int, neighbour: 'Vertex'):
+        """
+        Replaces a single existing neighbour on one side, e.g. neighbours.replace(EAST, -1, vertex) replaces the last neighbour to the east.
+        :param direction:
+        :param index: may be negative, as with sequences.
+        :param neighbour:
+        :return:
+        """
+        count = len(self[direction])
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError(f'No neighbour at index {index} on side {direction}')
+        if self._journal is not None and self._journal.active:
+            self._journal.record_neighbours(self)
+        self._entries[2 * direction.ordinal + index] = neighbour
+
+    def restore(self, entries: Sequence[Optional['Vertex']]):
+        """
+        Overwrites the storage with entries previously read from it (see entries), e.g. to roll back a Journal. This is not recorded.
+        """
+        self._entries[:] = entries
+
+    def __iter__(self) -> Iterator[Sequence['Vertex']]:
+        return iter(map(self.__getitem__, CardinalDirection))
+
+    @property
+    def entries(self) -> Sequence[Optional['Vertex']]:
+        """
+        A read-only view of the storage: 2 entries per CardinalDirection (in ordinal order), with unused entries set to None, e.g. for exporting the whole graph at once (see GraphArrays).
+        """
+        return tuple(self._entries)
+
+    @property
+    def north(self) -> Sequence['Vertex']:
+        return self[CardinalDirection.NORTH]
+
+    @property
+    def east(self) -> Sequence['Vertex']:
+        return self[CardinalDirection.EAST]
+
+    @property
+    def south(self) -> Sequence['Vertex']:
+        return self[CardinalDirection.SOUTH]
+
+    @property
+    def west(self) -> Sequence['Vertex']:
+        return self[CardinalDirection.WEST]
+
+class TileNeighbourhood(ABC):
+    __slots__ = ('owner',)
 
-class TileNeighbourhood:
     owner: Final[Tile]
     def __init__(self, owner: Tile):
         self.owner = owner
 
+    @abstractmethod
+    def _walk(self, side: CardinalDirection) -> Sequence[Tile]:
+        ...
+
+    def _derive(self, key: Hashable, side: CardinalDirection) -> Sequence[Tile]:
+        """
+        Caches the walk for a side on the owner. Walks only visit the vertices of the owner and of the tiles they find, so the result is also the set of tiles it depends on.
+        """
+        return self.owner.derive(key, self._walk_with_dependencies, side)
+
+    def _walk_with_dependencies(self, side: CardinalDirection) -> tuple[Sequence[Tile], Sequence[Tile]]:
+        result = self._walk(side)
+        return (result, result)
+
 class ExteriorTileNeighbourhood(TileNeighbourhood):
     """
     Defines the exterior neighbouring tiles in each cardinal direction. More importantly, it determines the minimum set of tiles that would mandatory be affected by moving an edge of the tile. This minimum set can be expanded heuristically to achieve more advanced behaviour.
 
-    Each side is computed on-demand from vertex neighbourhoods.
+    Each side is computed on-demand from vertex neighbourhoods, then cached on the owner (see Tile.derive).
+    - A cached side remains valid until the generation of the owner or of any tile in the result changes, since the walk only visits the vertices of those tiles.
+    - Neighbourhood objects themselves are therefore cheap and disposable, and all variants share the owner's cache.
 
     Used heavily for determining Boxes for other actions.
     - Might be more efficient technically to directly compute the edge points as it would not require iteration.
     -- For now however, it is more desirable to be declarative/provide more exposition in the initial prototype and as implemented/backup documentation in future if the more efficient alternative is eventually preferred.
     -- This can be decided or interpreted in multiple ways and is therefore configurable.
     """
+    __slots__ = ()
 
     """
         Defines the first index, among the neighbours of the start corner of a side, to include in the neighbourhood. This, along with the end index, is used to control tiebreaker scenarios when a corner vertex is neighboured by 2 other vertices due to a gap.
@@ -55,45 +157,64 @@ class ExteriorTileNeighbourhood(TileNeighbourhood):
         :param sideName:
         :return:
         """
+        return self._derive((self._START_INDEX, self._END_INDEX, side), side)
+
+    def _walk(self, side: CardinalDirection) -> Sequence[Tile]:
         target_edge = self.owner.sides[side]
+
+        if len(target_edge.a.neighbours[side]) == 0:
+            #only the outward sides of a Canvas have no neighbours.
+            return ()
+
         forwardDirection = side.axis.perpendicular.directions[-1]
 
         # note: if the vertex lies between two other vertices on a side it neccessarily means it would have both as neighbours they would otherwise not be within the gap range.
-        current = target_edge.a.neighbours[side][self._START_INDEX]
+        (start_neighbours, end_neighbours) = (target_edge.a.neighbours[side], target_edge[-1].neighbours[side])
+        if len(start_neighbours) == 2 and start_neighbours[0] is end_neighbours[0]:
+            #both corners lie strictly inside the same gap (e.g. the middle window of a row facing the side of its canvas), so there is nothing to walk between, only the tiles on either side of the gap.
+            return tuple(dict.fromkeys(each.owner for each in start_neighbours))
 
-        end = target_edge[-1].neighbours[side][self._END_INDEX]
+        current = start_neighbours[self._START_INDEX]
+
+        end = end_neighbours[self._END_INDEX]
 
         result = []
         result.append(current.owner)
 
         while current is not end:
-            current = current.neighbours[forwardDirection]
+            current = current.neighbours[forwardDirection][0]
             if current.owner is not result[-1]:
                 result.append(current.owner)
 
-        return result
+        return tuple(result)
 
 
 class InteriorCanvasNeighbourhood(TileNeighbourhood):
     """
     Unlike exterior neighbourhoods, this defines available tiles on interior of the canvas, facing inward from the chosen side.
+
+    As with exterior neighbourhoods, each side is cached on the owner (see Tile.derive).
     """
-    _owner: Canvas
+    owner: Canvas
 
     def __init__(self, owner: Canvas):
         super().__init__(owner)
 
     def __getitem__(self, side: CardinalDirection) -> Sequence[Tile]:
-        from procedures.examination import is_divided
         """
         Finds the tiles associated with the vertices adjacent to nodes within the axis-aligned range defined by a side's edge. This automatically captures any tiles which happen to straddle a corner since at least one of the vertices would have to be within that range regardless.
         :param sideName:
         :return:
         """
-        if not is_divided(self._owner):
-            return [] #if the canvas is unbroken it means there are no contents.
+        return self._derive((InteriorCanvasNeighbourhood, side), side)
+
+    def _walk(self, side: CardinalDirection) -> Sequence[Tile]:
+        from procedures.examination import is_divided
+
+        if not is_divided(self.owner):
+            return () #if the canvas is unbroken it means there are no contents.
 
-        targetCorners = self.owner.sides(side.diagonals)
+        targetCorners = [self.owner.corners[each] for each in side.diagonals]
         forwardDirection = side.axis.perpendicular.directions[-1]
 
         # note: if the vertex lies between two other vertices on a side it necessarily means it would push both as they would otherwise not be within the gap range.
@@ -105,11 +226,11 @@ class InteriorCanvasNeighbourhood(TileNeighbourhood):
         result.append(current.owner)
 
         while current is not end:
-            current = current.neighbours[forwardDirection]
+            current = current.neighbours[forwardDirection][0]
             if current.owner is not result[-1]:
                 result.append(current.owner)
 
-        return result
+        return tuple(result)
 
     @property
     def north(self) -> Sequence[Tile]:
@@ -1,13 +1,20 @@
 import itertools
 import warnings
 from functools import singledispatchmethod
-from typing import Final, Iterator, Mapping, MutableMapping, Sequence, Type, TypeVar, overload
+from typing import Collection, Final, Iterable, Iterator, Mapping, MutableMapping, Optional, Sequence, Type, TypeVar, overload
 
+from geometry.axis import Axis
 from geometry.direction.diagonal import DiagonalDirection
 from geometry.vector import Vector
+from geometry.graph.alignment import AlignmentIndex
 from geometry.graph.box import BoxTag, Box
 from geometry.graph.canvas import Canvas, CanvasTag
+from geometry.graph.coordinates import CoordinateStore
+from geometry.graph.dirty import DirtyTracker
 from geometry.graph.edge import Edge, EdgeTag
+from geometry.graph.hibernation import HibernatedCanvas
+from geometry.graph.journal import Journal
+from geometry.graph.spatial import Bounds, SpatialIndex
 from geometry.graph.tag import Tag
 from geometry.graph.tile import Tile, TileId, TileTag
 from geometry.graph.vertex import VertexTag, Vertex
@@ -26,22 +33,70 @@ class TileRegistry:
     - Vertices are described by their
 
     This registry is a factory, but it does not manage tile linkage or geometry, it only provides lookup and factory functionality.
+    - It does however own the storage for vertex locations (see CoordinateStore), which allows groups of tiles to be moved in bulk, and the index of which vertices are aligned (see AlignmentIndex).
+    - It also tracks which tiles have been created or touched since they were last validated (see DirtyTracker).
+    - It also owns the journal which records modifications to the graph within a transaction, so that they can be rolled back or undone (see Journal). Tiles which may still be restored are detached rather than released (see _detach_tile).
+    - It also records which canvas each window was placed within, and the windows within each canvas in the order they were placed (see place_window), so that per-canvas operations are O(windows in the canvas).
+    - Canvases (e.g. of hidden workspaces) can hibernate, packing their windows into arrays until they are next looked up (see hibernate).
     """
     _by_name: Final[MutableMapping[str, Tile]]
     _by_type: Final[Mapping[Type[TileT], MutableMapping[TileId, TileT]]]
+    _by_location: Final[Mapping[Type[TileT], SpatialIndex[TileT]]]
     _tile_id_iter: Iterator[int]
+    _coordinates: Final[CoordinateStore]
+    _alignment: Final[AlignmentIndex]
+    _dirty: Final[DirtyTracker]
+    _journal: Final[Journal]
+    _canvases: Final[MutableMapping[Window, Canvas]]
+    _windows_by_canvas: Final[MutableMapping[Canvas, MutableMapping[Window, None]]]
+    _hibernating: Final[MutableMapping[Canvas, HibernatedCanvas]]
+    _hibernated_keys: Final[MutableMapping[TileId | str, Canvas]]
 
     @property
     def by_type(self) -> Mapping[Type[TileT], Mapping[TileId, TileT]]:
         return self._by_type
 
+    @property
+    def coordinates(self) -> CoordinateStore:
+        return self._coordinates
+
+    @property
+    def alignment(self) -> AlignmentIndex:
+        return self._alignment
+
+    @property
+    def dirty(self) -> DirtyTracker:
+        return self._dirty
+
+    @property
+    def journal(self) -> Journal:
+        return self._journal
+
+    @property
+    def hibernating(self) -> Collection[Canvas]:
+        return self._hibernating.keys()
+
     def __init__(self):
         self._tile_id_iter = itertools.count()
+        self._journal = Journal()
+        self._coordinates = CoordinateStore(self._journal)
+        self._alignment = AlignmentIndex(self._coordinates)
+        self._dirty = DirtyTracker()
         self._by_type = {
             Window: {},
             Canvas: {}
         }
+        self._by_location = {
+            Window: SpatialIndex(),
+            Canvas: SpatialIndex()
+        }
         self._by_name = {}
+        self._canvases = {}
+        #dicts rather than sets, so that windows are listed in the order they were placed.
+        self._windows_by_canvas = {}
+        self._hibernating = {}
+        #the ids and names of the hibernating canvases and their windows, to rehydrate them when they are looked up.
+        self._hibernated_keys = {}
 
     @overload
     def create_tile(self, tile_class: Type[TileT], corners: dict[DiagonalDirection, Vector], *, name=None) -> TileT:
@@ -67,17 +122,295 @@ class TileRegistry:
         elif len(args) == 4:
             corners = args
         name=kwargs['name'] if 'name' in kwargs else None
-        result = tile_class(TileId(next(self._tile_id_iter)), *corners, name=name)
-        self._by_type[tile_class][result.id] = result
+        result = tile_class(TileId(next(self._tile_id_iter)), *corners, coordinates=self._coordinates, dirty=self._dirty, journal=self._journal, name=name)
+        self._index_tile(result)
+        if self._journal.active:
+            self._journal.record_creation(result)
         if name is not None:
             self.name_tile(result, name)
         return result
 
+    def _index_tile(self, target: Tile):
+        self._by_type[target.__class__][target.id] = target
+        self._by_location[target.__class__].insert(target)
+        for each_corner in target.corners:
+            self._alignment.add(each_corner)
+        self._dirty.mark(target)
+
+    def _attach_tile(self, target: Tile, canvas: Optional[Canvas] = None):
+        """
+        Restores a detached tile to every lookup (see _detach_tile), along with its name and canvas, e.g. to undo its erasure (see Delta).
+        :param target:
+        :param canvas: the canvas to place the tile within, if it is a window.
+        :return:
+        """
+        self._index_tile(target)
+        if target._name is not None:
+            if target._name in self._by_name:
+                warnings.warn("Restoring a tile with a name already in use (the previous owner of the name will be unnammed)")
+                self.unname_tile(self._by_name[target._name])
+            self._by_name[target._name] = target
+        if canvas is not None:
+            self.place_window(target, canvas)
+
+    def _restore_tiles(self, targets: Sequence[Tile], bounds: Sequence[Bounds], next_id: Optional[int] = None):
+        """
+        Indexes many tiles at once, building each lookup in a single pass rather than one tile at a time (see _index_tile), e.g. to load a snapshot (see read_snapshot).
+        Names and canvases are not restored, since there are only a few of each (see name_tile and place_window).
+        :param targets: tiles whose vertices have been allocated slots in the coordinate store.
+        :param bounds: the bounds of each tile.
+        :param next_id: if given, the number of the next tile id to be created, which must be greater than that of any restored tile.
+        :return:
+        """
+        for each in targets:
+            self._by_type[each.__class__][each.id] = each
+            self._dirty.mark(each)
+        for (each_class, each_index) in self._by_location.items():
+            each_targets = [(each, each_bounds) for (each, each_bounds) in zip(targets, bounds) if each.__class__ is each_class]
+            each_index.extend([each for (each, _) in each_targets], [each_bounds for (_, each_bounds) in each_targets])
+        self._alignment.extend([each_corner for each in targets for each_corner in each.corners])
+        if next_id is not None:
+            self._tile_id_iter = itertools.count(next_id)
+
+    def _reuse_ids(self, number: int):
+        """
+        Numbers the next tile created from the given id number again, once every tile numbered from it has been released (e.g. those created by a reverted delta, see Journal.revert).
+        """
+        self._tile_id_iter = itertools.count(number)
+
+    def _detach_tile(self, target: Tile) -> Optional[Canvas]:
+        """
+        Removes a tile from every lookup (by id, name, location, alignment and canvas), but keeps the slots of its vertices so that it can be attached again.
+        The tile keeps its name, but the name is free to be used by other tiles.
+        :param target:
+        :return: the canvas that the tile was placed within, if any.
+        """
+        if target._name is not None and self._by_name.get(target._name) is target:
+            del self._by_name[target._name]
+        canvas = None
+        if isinstance(target, Window):
+            canvas = self._canvases.pop(target, None)
+            if canvas is not None:
+                del self._windows_by_canvas[canvas][target]
+                canvas.window_count -= 1
+        elif isinstance(target, Canvas):
+            for each_window in self._windows_by_canvas.pop(target, ()):
+                del self._canvases[each_window]
+        del self._by_type[target.__class__][target.id]
+        self._by_location[target.__class__].remove(target)
+        self._dirty.discard(target)
+        for each_corner in target.corners:
+            self._alignment.remove(each_corner)
+        return canvas
+
+    def _release_tile(self, target: Tile):
+        """
+        Releases the slots of the vertices of a detached tile, after which it can no longer be attached.
+        """
+        for each_corner in target.corners:
+            self._coordinates.release(each_corner.slot)
+
     def _erase_tile(self, key: TileTag):
         result = self[key]
-        if result._name is not None:
-            self.unname_tile(result)
-        del self._by_type[result.__class__][result.id]
+        if self._journal.active:
+            #the slots are kept while the erasure may still be rolled back or undone (see Delta.release).
+            self._journal.record_erasure(result, self._detach_tile(result))
+        else:
+            if result._name is not None:
+                self.unname_tile(result)
+            self._detach_tile(result)
+            self._release_tile(result)
+
+    def _touch_unrecorded(self, target: Tile):
+        """
+        Touches a tile without recording it in the journal, or counting it as unrecorded while the journal is not active (see Journal.unrecorded), e.g. when hibernating leaves the layout as it was.
+        """
+        (journal, target._journal) = (target._journal, None)
+        try:
+            target.touch()
+        finally:
+            target._journal = journal
+
+    def hibernate(self, target: Canvas):
+        """
+        Packs the windows of a canvas into arrays and drops them (see HibernatedCanvas), then detaches the canvas from every lookup, e.g. when it belongs to a hidden workspace.
+        It is rehydrated transparently, with the same ids and names, when it or any of its windows are next looked up by tag, or its windows are listed (see windows_in), or it is reached by navigation (see next_tile). It can also be rehydrated explicitly (see rehydrate).
+        Its windows are then new objects. The canvas itself is kept rather than recreated, so that any links to its corners from outside (e.g. from other canvases) remain valid; while it hibernates, its corners are linked along its sides as if it were empty.
+        The canvas keeps counting its windows while it hibernates (see Canvas.window_count), so it is not mistaken for an empty canvas (see is_divided).
+        Neither hibernating nor rehydrating is counted as a manipulation outside of a transaction (see Journal.unrecorded), since the layout is left as it was. The dropped windows are no longer in the registry though, so any delta which refers to them no longer matches the graph, and the undo history is cleared rather than applying it (see Delta.matches).
+        :param target:
+        :return:
+        """
+        if self._journal.active:
+            raise ValueError("Cannot hibernate a canvas during a transaction, since its modifications may still be rolled back.")
+        if self._by_type[Canvas].get(target.id) is not target:
+            raise ValueError(f"Canvas {target.generate_tag()} is not in the registry, or is already hibernating.")
+        windows = list(self.windows_in(target))
+        hibernated = HibernatedCanvas(target, windows, self._coordinates, self._dirty)
+        #anything derived from the windows (e.g. the interior neighbourhood of the canvas) must not outlive them.
+        self._touch_unrecorded(target)
+        for each in windows:
+            self._detach_tile(each)
+            self._release_tile(each)
+        target.window_count = len(windows)
+        target._link_sides()
+        self._detach_tile(target)
+        if len(windows) > len(self._by_location[Window]) // 8:
+            #the indices do not shrink as tiles are removed one at a time, so are rebuilt around the tiles that remain.
+            self._alignment.compact()
+            self._by_location[Window].compact()
+        for each in (target, *windows):
+            self._hibernated_keys[each.id] = target
+            if each.name is not None:
+                self._hibernated_keys[each.name] = target
+        self._hibernating[target] = hibernated
+
+    def rehydrate(self, target: Canvas):
+        """
+        Restores a hibernating canvas and recreates its windows, as they were when it hibernated (see hibernate).
+        :param target:
+        :return:
+        """
+        hibernated = self._hibernating.pop(target, None)
+        if hibernated is None:
+            raise ValueError(f"Canvas {target.generate_tag()} is not hibernating.")
+        (windows, bounds) = hibernated.restore(self._coordinates, self._dirty, self._journal)
+        for each in (target, *windows):
+            self._hibernated_keys.pop(each.id, None)
+        for each_name in (target.name, *hibernated.names.values()):
+            if self._hibernated_keys.get(each_name) is target:
+                del self._hibernated_keys[each_name]
+        self._attach_tile(target)
+        self._restore_tiles(windows, bounds)
+        for (each, each_name) in hibernated.names.items():
+            self.name_tile(windows[each], each_name)
+        #the windows are counted again as they are placed.
+        target.window_count = 0
+        for each in windows:
+            self.place_window(each, target)
+        #anything derived from the canvas while it hibernated (e.g. the neighbourhood of another canvas found by walking along its sides) must be recomputed.
+        self._touch_unrecorded(target)
+        if not hibernated.canvas_dirty:
+            self._dirty.discard(target)
+        for (each, each_dirty) in zip(windows, hibernated.dirty.tolist()):
+            if not each_dirty:
+                self._dirty.discard(each)
+
+    def place_window(self, target: Window, canvas: Canvas):
+        """
+        Records that a window has been placed within a canvas, and counts it in the canvas (see Canvas.window_count).
+        The registry does not manage tile linkage, so procedures which create windows must call this for each one (e.g. fill_canvas_with_new_window).
+        :param target:
+        :param canvas:
+        :return:
+        """
+        if target in self._canvases:
+            raise ValueError(f"Window {target.generate_tag()} has already been placed within canvas {self._canvases[target].generate_tag()}.")
+        self._canvases[target] = canvas
+        self._windows_by_canvas.setdefault(canvas, {})[target] = None
+        canvas.window_count += 1
+
+    def canvas_of(self, target: Window) -> Optional[Canvas]:
+        """
+        :param target:
+        :return: the canvas that the window was placed within, or None if it was not placed by a procedure (see place_window).
+        """
+        return self._canvases.get(target)
+
+    def windows_in(self, target: Canvas) -> Collection[Window]:
+        """
+        :param target:
+        :return: the windows placed within the canvas, in the order they were placed.
+        """
+        if target in self._hibernating:
+            self.rehydrate(target)
+        windows = self._windows_by_canvas.get(target)
+        return windows.keys() if windows is not None else ()
+
+    def reindex_tile(self, target: Tile):
+        """
+        Updates the location-based lookup for a tile after its vertices have moved.
+        The registry does not manage geometry, so procedures which move vertices must call this for each affected tile once they are done.
+        :param target:
+        :return:
+        """
+        self._by_location[target.__class__].update(target)
+
+    def _reindex_and_touch(self, targets: Iterable[Tile]):
+        """
+        Re-indexes and touches tiles whose vertices have been written to directly in the coordinate store, so that they are re-validated, anything derived from them is recomputed, and the write is recorded in the journal (or counted as unrecorded, see Tile.touch).
+        """
+        for each in targets:
+            self.reindex_tile(each)
+            each.touch()
+
+    def translate_tiles(self, targets: Iterable[Tile], offset: Vector):
+        """
+        Moves every corner of the given tiles by the same offset in a single vectorised pass over the coordinate store (e.g. to move a whole canvas and its contents), then re-indexes and touches the tiles.
+        :param targets:
+        :param offset:
+        :return:
+        """
+        targets = list(targets)
+        self._coordinates.translate([each_corner.slot for each in targets for each_corner in each.corners], offset)
+        self._reindex_and_touch(targets)
+
+    def scale_tiles(self, targets: Iterable[Tile], origin: Vector, numerator: int, denominator: int):
+        """
+        Scales every corner of the given tiles about the origin by numerator/denominator, rounding down, in a single vectorised pass over the coordinate store, then re-indexes and touches the tiles.
+        Note: this does not preserve margins between tiles, so it is intended for whole canvases rather than for resizing within a layout.
+        :param targets:
+        :param origin:
+        :param numerator:
+        :param denominator:
+        :return:
+        """
+        targets = list(targets)
+        self._coordinates.scale([each_corner.slot for each in targets for each_corner in each.corners], origin, numerator, denominator)
+        self._reindex_and_touch(targets)
+
+    def assign_components(self, targets: Iterable[Tile], slots: Sequence[int], axis: Axis, values: Sequence[int]):
+        """
+        Sets the coordinate along an axis of each given vertex slot in a single vectorised pass over the coordinate store (e.g. to resize a whole row of tiles), then re-indexes and touches the tiles that own them.
+        :param targets: the tiles which own the slots.
+        :param slots:
+        :param axis:
+        :param values:
+        :return:
+        """
+        self._coordinates.assign(slots, axis, values)
+        self._reindex_and_touch(targets)
+
+    def tile_at(self, point: Vector, tile_class: Type[TileT] = Window) -> Optional[TileT]:
+        """
+        Finds the tile of the given type which covers a point, e.g. to hit-test the pointer against Windows.
+        Tile bounds are inclusive of their corners, and since Windows never overlap there is at most one result.
+        :param point:
+        :param tile_class: Window by default, but Canvases can also be looked up.
+        :return: the covering tile, or None if the point is not within any tile of that type.
+        """
+        candidates = self._by_location[tile_class].at(point)
+        return candidates[0] if len(candidates) > 0 else None
+
+    @overload
+    def tiles_intersecting(self, target: Box, *, tile_class: Type[TileT] = Window) -> Sequence[TileT]:
+        ...
+
+    @overload
+    def tiles_intersecting(self, north_west: Vector, south_east: Vector, *, tile_class: Type[TileT] = Window) -> Sequence[TileT]:
+        ...
+
+    def tiles_intersecting(self, *args, tile_class: Type[TileT] = Window) -> Sequence[TileT]:
+        """
+        Finds all tiles of the given type which overlap (or touch) a region, given either as a Box or as its north west and south east locations.
+        :return: the intersecting tiles, in no particular order.
+        """
+        query: Bounds
+        if len(args) == 1:
+            query = Bounds.of(args[0])
+        else:
+            query = Bounds.between(*args)
+        return self._by_location[tile_class].intersecting(query)
 
     def name_tile(self, target: Tile, name: str):
         """
@@ -134,6 +467,10 @@ class TileRegistry:
 
     @__getitem__.register
     def _(self, key: TileTag) -> Tile:
+        hibernating = self._hibernated_keys.get(key.id)
+        #names may have been reused by other tiles since, which take precedence.
+        if hibernating is not None and key.id not in self._by_name:
+            self.rehydrate(hibernating)
         if isinstance(key.id, TileId):
             return self._by_type[key.Element][key.id]
         else:
@@ -1,11 +1,21 @@
-from typing import Final, MutableSequence, Sequence
+from typing import Final, MutableSequence, Optional, Sequence, TYPE_CHECKING
 
-from procedures.examination import covers_contents, are_aligned
+import numpy as np
+
+from procedures.examination import covers_contents
 from geometry.axis import Axis
+from geometry.direction.cardinal import CardinalDirection
+from geometry.direction.diagonal import DiagonalDirection
 from geometry.graph.box import Box
+from geometry.graph.edge import Edge
 from geometry.graph.independent import IndependentBox
+from geometry.graph.tile import Tile
 from geometry.graph.vertex import Vertex
 
+if TYPE_CHECKING:
+    from geometry.graph.canvas import Canvas
+    from manager import GeometricTileManager
+
 
 class Segment:
     """
@@ -15,19 +25,27 @@ class Segment:
     source: Final[Box]
     scale_axis: Final[Axis]
 
-    def __init__(self, source: Box, scale_axis: Axis):
-        assert(covers_contents(source))
+    def __init__(self, source: Box, scale_axis: Axis, *, verified: bool = False):
+        """
+        :param source:
+        :param scale_axis:
+        :param verified: whether the source is already known to cover its contents (e.g. because it was found geometrically, see segment_region), in which case the check, which walks every side, is skipped.
+        """
+        assert(verified or covers_contents(source))
         self.source = source
         self.scale_axis = scale_axis
 
 class TileSegment(Segment):
-    ...
+    source: Tile
 
 class SegmentedBox(Segment):
     """
     A recursive structure for scaling subgraphs (contained within an AABB).
 
     Performs calculations and recursive segmentations to ensure integer tiles positions whilst also ensuring that margins are exact.
+
+    The box is divided along the segmentation axis wherever a clean line (one that does not cut through the interior of any tiles) crosses it, and each segment between those lines is either a single tile or is recursively segmented along the perpendicular axis.
+    Boxes which cannot be segmented along either axis are pathological (see the README), and are rejected with a ValueError for now.
     """
     _segments: MutableSequence[Segment]
     segmentation_axis: Final[Axis]
@@ -35,52 +53,212 @@ class SegmentedBox(Segment):
     """
     A utility class created by passing in a Box.
     """
-    def __init__(self, source: Box, scale_axis: Axis, segmentation_axis: Axis):
-        super().__init__(source, scale_axis)
+    def __init__(self, source: Box, scale_axis: Axis, segmentation_axis: Axis, *, deferred: bool = False, segments: Optional[Sequence[Segment]] = None):
+        """
+        :param source:
+        :param scale_axis:
+        :param segmentation_axis:
+        :param deferred: whether this box is the only segment of a box which could not be segmented along the perpendicular axis, in which case it must be segmentable along its own.
+        :param segments: the segments of the box, if they are already known (see segment_region). Otherwise they are found by walking the sides of the box.
+        """
+        super().__init__(source, scale_axis, verified=segments is not None)
         self.segmentation_axis = segmentation_axis
-
-        assert(covers_contents(source))
         self._segments = []
+
+        if segments is not None:
+            self._segments += segments
+            return
+
+        perpendicular_axis = segmentation_axis.perpendicular
         forward_dir = segmentation_axis.directions[-1]
-        perpendicular_forward_dir = segmentation_axis.perpendicular.directions[-1]
-
-        (initial_edge, end_edge) = map(self.sides.__getitem__, segmentation_axis.directions)
-        last_edge = initial_edge
-        cur_negative, cur_positive = last_edge
-
-        while last_edge.a is not end_edge.a:
-            #creep along the sides until we find two aligned corners
-            if are_aligned(cur_negative, cur_positive, segmentation_axis):
-                cur_negative = cur_negative.neighbours[forward_dir]
-                cur_positive = cur_negative.neighbours[forward_dir]
-            elif cur_negative.location[segmentation_axis] < cur_positive.location[segmentation_axis]:
-                cur_negative = cur_negative.neighbours[forward_dir]
+        perpendicular_forward_dir = perpendicular_axis.directions[-1]
+
+        #the lines of vertices along the sides parallel to the segmentation axis, e.g. the north and south sides for a row of columns.
+        (negative_line, positive_line) = (line_vertices(source.sides[each], forward_dir) for each in perpendicular_axis.directions)
+        positive_end = positive_line[-1].location[perpendicular_axis]
+
+        #the positive line's corners which end a tile, by their location along the segmentation axis.
+        positive_ends = {each.location[segmentation_axis]: index for (index, each) in enumerate(positive_line) if forward_dir in each.role}
+
+        (negative_start, positive_start) = (0, 0)
+        for (negative_index, each_vertex) in enumerate(negative_line[:-1]):
+            each_position = each_vertex.location[segmentation_axis]
+            if forward_dir not in each_vertex.role or each_position not in positive_ends:
+                continue
+
+            #creep inwards from the aligned corners to see whether the line between them is clean.
+            current = each_vertex
+            while current.location[perpendicular_axis] != positive_end:
+                candidates: Sequence[Vertex] = current.neighbours[perpendicular_forward_dir]
+                if len(candidates) != 1 or candidates[0].location[segmentation_axis] != each_position:
+                    break
+                current = candidates[0]
             else:
-                cur_positive = cur_negative.neighbours[forward_dir]
-
-            #if we are aligned now, then try to creep inwards.
-            if are_aligned(cur_negative, cur_positive, segmentation_axis):
-                cur_perpendicular = cur_negative
-                candidates: Sequence[Vertex] = cur_perpendicular.neighbours[perpendicular_forward_dir]
-                are_connectable: bool = False
-                while len(candidates) == 1 and not candidates[0].is_sentinel:
-                    if candidates[0] is cur_negative:
-                        are_connectable = True
-                        break
-                    else:
-                        candidates = cur_perpendicular.neighbours[perpendicular_forward_dir]
-
-                if are_connectable:
-                    next_edge = Edge(cur_negative, cur_positive)
-                    if next_edge.a.owner is last_edge.a.owner:
-                        if next_edge.a is next_edge.b.owner:
-                            #the segment is a single tile, no sub-segmentation is required.
-                            self._segments.append(TileSegment(next_edge.a.owner, scale_axis))
-                        else:
-                            self._segments.append(SegmentedBox(IndependentBox(*{
-                                each_dir.snake_case_name: each_vertex for (each_dir, each_vertex) in zip(
-                                    (diag for card in segmentation_axis.directions for diag in card.diagonals),
-                                    (*last_edge, *next_edge)
-                                )
-                            }), scale_axis, segmentation_axis.perpendicular))
-                    last_edge = next_edge
+                positive_index = positive_ends[each_position]
+                self._add_segment(negative_line[negative_start], each_vertex, positive_line[positive_index], positive_line[positive_start], False)
+                (negative_start, positive_start) = (negative_index + 1, positive_index + 1)
+
+        self._add_segment(negative_line[negative_start], negative_line[-1], positive_line[-1], positive_line[positive_start], deferred and len(self._segments) == 0)
+
+    def _add_segment(self, negative_start: Vertex, negative_end: Vertex, positive_end: Vertex, positive_start: Vertex, is_whole: bool):
+        """
+        Adds the segment enclosed by the given vertices, which are the start and end of the segment along the negative and positive lines.
+        :param is_whole: whether the segment would be the whole of a deferred box, i.e. the box cannot be segmented along either axis.
+        """
+        corners = {each.role: each for each in (negative_start, negative_end, positive_end, positive_start)}
+        owner = negative_start.owner
+        if all(each.owner is owner for each in corners.values()):
+            #the segment is a single tile, no sub-segmentation is required.
+            self._segments.append(TileSegment(owner, self.scale_axis))
+        elif is_whole:
+            raise ValueError(f"{self.source.debug_string} cannot be segmented without cutting through tiles.")
+        else:
+            source = IndependentBox(*(corners[each] for each in DiagonalDirection))
+            self._segments.append(SegmentedBox(source, self.scale_axis, self.segmentation_axis.perpendicular, deferred=source.corners == self.source.corners))
+
+    @property
+    def segments(self) -> Sequence[Segment]:
+        return self._segments
+
+    @property
+    def sides(self) -> Box.Sides:
+        return self.source.sides
+
+
+def line_vertices(target: Edge, forward_direction: CardinalDirection) -> Sequence[Vertex]:
+    """
+    Collects the vertices on a clean edge (see validate(Edge)), from a to b.
+    :param target:
+    :param forward_direction: the direction from a to b.
+    :return:
+    """
+    result = [target.a]
+    while result[-1] is not target.b:
+        result.append(result[-1].neighbours[forward_direction][0])
+    return result
+
+
+def segment_region(manager: 'GeometricTileManager', source: Box, segmentation_axis: Axis) -> SegmentedBox:
+    """
+    Builds the same tree as SegmentedBox(source, segmentation_axis, segmentation_axis), from the locations of the tiles within the box rather than by walking their vertices.
+
+    The tiles are sorted by their extent along each axis once, then each box is divided with a sweep: sorted by their start, a clean line lies before each tile that starts at least a margin after the end of every tile before it.
+    Since adjacent tiles are always separated by exactly the margin, this is only the case if the tiles before it all end on the same line.
+    The groups between those lines keep the order along both axes, so each level of the tree only partitions the tiles instead of sorting them again.
+    :param manager: used to find the tiles within the box.
+    :param source: must cover its contents (see covers_contents).
+    :param segmentation_axis:
+    :return:
+    """
+    return _TileSweep(manager, tiles_within(manager, source), segmentation_axis).build(source)
+
+
+def segment_canvas(manager: 'GeometricTileManager', target: 'Canvas', segmentation_axis: Axis) -> SegmentedBox:
+    """
+    Segments all windows within a canvas (see segment_region), caching the tree on the canvas until it or any of the windows are touched (see Tile.derive).
+    Any subtree can be used to resize part of the canvas, e.g. with a ResizePlan, which should itself be kept for repeated resizes of the same region since resizing touches the windows.
+    Throws a ValueError if the canvas has no windows or they cannot be segmented.
+    :param manager:
+    :param target:
+    :param segmentation_axis: the axis along which the root of the tree is segmented.
+    :return:
+    """
+    return target.derive((SegmentedBox, segmentation_axis), _segment_canvas, manager, target, segmentation_axis)
+
+
+def _segment_canvas(manager: 'GeometricTileManager', target: 'Canvas', segmentation_axis: Axis) -> tuple[SegmentedBox, Sequence[Tile]]:
+    tiles = tiles_within(manager, target)
+    if len(tiles) == 0:
+        raise ValueError(f"Canvas {target.generate_tag()} has no windows to segment.")
+    return (_TileSweep(manager, tiles, segmentation_axis).build(None), tiles)
+
+
+def tiles_within(manager: 'GeometricTileManager', source: Box) -> Sequence[Tile]:
+    """
+    :return: the windows which lie entirely within a box, including those which touch its sides.
+    """
+    (north_west, south_east) = (source.corners.north_west.location, source.corners.south_east.location)
+    return [
+        each for each in manager.graph.tiles_intersecting(north_west, south_east)
+        if all(north_west[each_axis] <= each.corners.north_west.location[each_axis] and each.corners.south_east.location[each_axis] <= south_east[each_axis] for each_axis in Axis)
+    ]
+
+
+class _TileSweep:
+    """
+    The state of segment_region: the bounds of the tiles being segmented, as an array of (min horizontal, min vertical, max horizontal, max vertical) rows.
+    """
+    __slots__ = ('tiles', 'bounds', 'scale_axis', 'margin', '_labels')
+
+    tiles: Sequence[Tile]
+    bounds: np.ndarray
+    scale_axis: Axis
+    margin: int
+    _labels: np.ndarray
+
+    def __init__(self, manager: 'GeometricTileManager', tiles: Sequence[Tile], scale_axis: Axis):
+        self.tiles = tiles
+        self.scale_axis = scale_axis
+        self.margin = manager.settings.static_config.constraints.window_margin
+        corners = np.array([(each.corners.north_west.slot, each.corners.south_east.slot) for each in tiles], dtype=np.intp).reshape(len(tiles), 2)
+        self.bounds = np.stack([manager.graph.coordinates.components(each_axis)[corners[:, each_corner]] for each_corner in (0, 1) for each_axis in Axis], axis=-1).astype(np.int64)
+        self._labels = np.zeros(len(tiles), dtype=np.intp)
+
+    def build(self, source: Optional[Box]) -> SegmentedBox:
+        """
+        :param source: the box enclosing all of the tiles, which is found from their corners if not given.
+        """
+        axis = self.scale_axis
+        if len(self.tiles) == 1:
+            #as with walking, a single tile is the only segment of the box.
+            return SegmentedBox(source if source is not None else self.tiles[0], axis, axis, segments=[TileSegment(self.tiles[0], axis, verified=True)])
+        by_axis = np.argsort(self.bounds[:, int(axis.value)], kind='stable')
+        by_perpendicular = np.argsort(self.bounds[:, int(axis.perpendicular.value)], kind='stable')
+        return self._segment(by_axis, by_perpendicular, axis, source, False)
+
+    def _segment(self, by_axis: np.ndarray, by_perpendicular: np.ndarray, axis: Axis, source: Optional[Box], deferred: bool) -> Segment:
+        """
+        :param by_axis: the indices of the tiles within the box, in order of their start along the segmentation axis.
+        :param by_perpendicular: the same indices, in order of their start along the perpendicular axis.
+        """
+        if len(by_axis) == 1:
+            return TileSegment(self.tiles[by_axis[0]], self.scale_axis, verified=True)
+        if source is None:
+            source = self._enclosing_box(by_axis)
+
+        starts = self.bounds[by_axis, int(axis.value)]
+        ends = np.maximum.accumulate(self.bounds[by_axis, 2 + axis.value])
+        cuts = np.flatnonzero(starts[1:] - ends[:-1] >= self.margin) + 1
+
+        perpendicular_axis = axis.perpendicular
+        if len(cuts) == 0:
+            if deferred:
+                raise ValueError(f"{source.debug_string} cannot be segmented without cutting through tiles.")
+            segments = [self._segment(by_perpendicular, by_axis, perpendicular_axis, source, True)]
+        else:
+            #label each tile with its segment, then partition the other order by label whilst keeping it sorted.
+            self._labels[by_axis] = np.repeat(np.arange(len(cuts) + 1), np.diff(np.concatenate(([0], cuts, [len(by_axis)]))))
+            partitioned = by_perpendicular[np.argsort(self._labels[by_perpendicular], kind='stable')]
+            segments = [
+                self._segment(each_by_perpendicular, each_by_axis, perpendicular_axis, None, False)
+                for (each_by_axis, each_by_perpendicular) in zip(np.split(by_axis, cuts), np.split(partitioned, cuts))
+            ]
+        return SegmentedBox(source, self.scale_axis, axis, segments=segments)
+
+    def _enclosing_box(self, indices: np.ndarray) -> IndependentBox:
+        """
+        Finds the corners of the tiles which lie at the corners of their bounds.
+        """
+        bounds = self.bounds[indices]
+        (minima, maxima) = (bounds[:, :2].min(axis=0), bounds[:, 2:].max(axis=0))
+        corners = []
+        for each_corner in DiagonalDirection:
+            #e.g. the tile at the north east corner has the maximum horizontal and minimum vertical bounds.
+            (east, south) = (CardinalDirection.EAST in each_corner, CardinalDirection.SOUTH in each_corner)
+            matches = np.flatnonzero(
+                (bounds[:, 2 if east else 0] == (maxima[0] if east else minima[0])) & (bounds[:, 3 if south else 1] == (maxima[1] if south else minima[1]))
+            )
+            if len(matches) == 0:
+                raise ValueError(f"No tile lies at the {each_corner.snake_case_name} corner of the region covered by {[str(self.tiles[each].generate_tag()) for each in indices]}.")
+            corners.append(self.tiles[indices[matches[0]]].corners[each_corner])
+        return IndependentBox(*corners)
@@ -0,0 +1,189 @@
+import gc
+import mmap
+import os
+from typing import Final, Sequence, Type
+
+import numpy as np
+
+from geometry.direction.cardinal import CardinalDirection
+from geometry.graph.arrays import GraphArrays
+from geometry.graph.canvas import Canvas
+from geometry.graph.registry import TileRegistry
+from geometry.graph.spatial import Bounds
+from geometry.graph.tile import Tile, TileId
+from geometry.graph.window import Window
+
+"""
+A compact, versioned binary format for the whole graph of a TileRegistry, so that large sessions can be saved and restored without parsing each object.
+
+Layout (little-endian), each section starting on an 8 byte boundary:
+- header: magic, format version, tile count, canvas count and the length of the names section (see _HEADER).
+- ids: int32 per tile, the number of its TileId.
+- types: uint8 per tile, its index in _TYPES.
+- canvases: int32 per tile, the tile number of the canvas a window was placed within, or -1.
+- name lengths: int32 per tile, the length in bytes of its name, or -1 if it has none.
+- locations: int32 (vertices, axes), as in GraphArrays.
+- neighbours: int32 (directions, vertices, 2), as in GraphArrays.
+- names: the utf-8 encoded names of the named tiles, concatenated in tile order.
+
+Tiles are numbered canvases first, then windows, and their vertices four per tile, as in GraphArrays.
+Every section is a packed array, so reading a snapshot maps the file into memory and views each section in place (see read_snapshot).
+"""
+
+_MAGIC: Final[bytes] = b'GTMS'
+_VERSION: Final[int] = 1
+_HEADER: Final[np.dtype] = np.dtype([('magic', 'S4'), ('version', '<u4'), ('tiles', '<u4'), ('canvases', '<u4'), ('names', '<u8')])
+_ALIGNMENT: Final[int] = 8
+_TYPES: Final[tuple[Type[Tile], ...]] = (Canvas, Window)
+
+
+def _sections(tile_count: int, names_length: int) -> Sequence[tuple[str, np.dtype, tuple[int, ...]]]:
+    """
+    :return: the name, element type and shape of each section following the header, in order.
+    """
+    vertex_count = 4 * tile_count
+    return (
+        ('ids', np.dtype('<i4'), (tile_count,)),
+        ('types', np.dtype('u1'), (tile_count,)),
+        ('canvases', np.dtype('<i4'), (tile_count,)),
+        ('name_lengths', np.dtype('<i4'), (tile_count,)),
+        ('locations', np.dtype('<i4'), (vertex_count, 2)),
+        ('neighbours', np.dtype('<i4'), (len(CardinalDirection), vertex_count, 2)),
+        ('names', np.dtype('u1'), (names_length,)),
+    )
+
+
+def _padding(offset: int) -> int:
+    return -offset % _ALIGNMENT
+
+
+def write_snapshot(registry: TileRegistry, path: str | os.PathLike):
+    """
+    Writes the tiles of a registry to a file, along with their ids, names, locations, neighbours and the canvas each window was placed within, in a single pass over the graph (see GraphArrays).
+    Links to vertices of erased tiles (see GraphArrays.neighbours) cannot be restored, so they are left out.
+    Anything which is not part of the graph itself (e.g. generations, dirty tiles or undo history) is not saved.
+    Hibernating canvases are rehydrated first (see TileRegistry.hibernate), so that they are saved along with the rest, then hibernated again once the snapshot has been written.
+    :param registry:
+    :param path:
+    :return:
+    """
+    if registry.journal.active:
+        raise ValueError("Cannot write a snapshot during a transaction, since its modifications may still be rolled back.")
+    hibernating = list(registry.hibernating)
+    for each in hibernating:
+        registry.rehydrate(each)
+    try:
+        _write(registry, path)
+    finally:
+        for each in hibernating:
+            registry.hibernate(each)
+
+
+def _write(registry: TileRegistry, path: str | os.PathLike):
+    arrays = GraphArrays(registry)
+    numbers = {each: i for (i, each) in enumerate(arrays.tiles)}
+    names = [each.name.encode() if each.name is not None else None for each in arrays.tiles]
+
+    #drop links to vertices outside of the graph, shifting any second neighbour into the first entry.
+    neighbours = arrays.neighbours.copy()
+    outside = neighbours[..., 0] == -2
+    neighbours[outside, 0] = neighbours[outside, 1]
+    neighbours[outside, 1] = -1
+    neighbours[neighbours == -2] = -1
+
+    contents = {
+        'ids': np.fromiter((each.id.number for each in arrays.tiles), dtype=np.int64, count=len(arrays.tiles)),
+        'types': (~arrays.is_sentinel).astype(np.uint8),
+        'canvases': np.fromiter((numbers.get(registry.canvas_of(each), -1) for each in arrays.tiles), dtype=np.int64, count=len(arrays.tiles)),
+        'name_lengths': np.fromiter((len(each) if each is not None else -1 for each in names), dtype=np.int64, count=len(names)),
+        'locations': arrays.locations,
+        'neighbours': neighbours,
+        'names': np.frombuffer(b''.join(each for each in names if each is not None), dtype=np.uint8),
+    }
+    header = np.array((_MAGIC, _VERSION, len(arrays.tiles), int(arrays.is_sentinel.sum()), len(contents['names'])), dtype=_HEADER)
+    with open(path, 'wb') as file:
+        offset = file.write(header.tobytes())
+        for (each_name, each_type, each_shape) in _sections(len(arrays.tiles), len(contents['names'])):
+            offset += file.write(bytes(_padding(offset)))
+            offset += file.write(np.ascontiguousarray(contents[each_name], dtype=each_type).reshape(each_shape).tobytes())
+
+
+def read_snapshot(path: str | os.PathLike) -> TileRegistry:
+    """
+    Restores a registry from a file written by write_snapshot.
+    The file is memory-mapped and each section is viewed in place as an array, so the only objects created per tile are the tiles and vertices themselves; locations are copied into the coordinate store in bulk and every lookup is built in a single pass (see TileRegistry._restore_tiles).
+    Tiles keep their ids and names, and new tiles are numbered after the highest restored id. Every restored tile is dirty, as if it had just been created.
+    :param path:
+    :return: a new registry, e.g. to replace the graph of a manager.
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size < _HEADER.itemsize:
+            raise ValueError(f"{path} is too short to be a snapshot.")
+        #the mapping is not closed explicitly, since the views of it may outlive reading (e.g. in a traceback). It is unmapped once they have all been released, as with numpy.memmap.
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    #creating the tiles and vertices would otherwise trigger the cyclic garbage collector many times over, although none of them are garbage.
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        return _read(buffer, path)
+    finally:
+        if collecting:
+            gc.enable()
+
+
+def _read(buffer: mmap.mmap, path: str | os.PathLike) -> TileRegistry:
+    header = np.frombuffer(buffer, dtype=_HEADER, count=1)[0]
+    if bytes(header['magic']) != _MAGIC:
+        raise ValueError(f"{path} is not a snapshot.")
+    if int(header['version']) != _VERSION:
+        raise ValueError(f"{path} is a snapshot of version {int(header['version'])}, but only version {_VERSION} is supported.")
+    (tile_count, canvas_count) = (int(header['tiles']), int(header['canvases']))
+
+    sections = {}
+    offset = _HEADER.itemsize
+    for (each_name, each_type, each_shape) in _sections(tile_count, int(header['names'])):
+        offset += _padding(offset)
+        sections[each_name] = (offset, each_type, each_shape)
+        offset += each_type.itemsize * int(np.prod(each_shape))
+    if offset != len(buffer):
+        raise ValueError(f"{path} is {len(buffer)} bytes long, but a snapshot of {tile_count} tiles would be {offset}.")
+    views = {each_name: np.frombuffer(buffer, dtype=each_type, count=int(np.prod(each_shape)), offset=each_offset).reshape(each_shape) for (each_name, (each_offset, each_type, each_shape)) in sections.items()}
+
+    (types, canvases, neighbours) = (views['types'], views['canvases'], views['neighbours'])
+    vertex_count = 4 * tile_count
+    if (
+        (types >= len(_TYPES)).any() or int((types == 0).sum()) != canvas_count or (types[:canvas_count] != 0).any()
+            or
+        ((canvases < -1) | (canvases >= tile_count)).any() or (types[np.maximum(canvases, 0)][canvases >= 0] != 0).any()
+            or
+        ((neighbours < -1) | (neighbours >= vertex_count)).any()
+    ):
+        raise ValueError(f"{path} is not a consistent snapshot.")
+
+    registry = TileRegistry()
+    locations = views['locations']
+    slots = registry.coordinates.extend((locations[:, 0], locations[:, 1]))
+    tiles = [
+        _TYPES[each_type](TileId(each_id), None, None, None, None, coordinates=registry.coordinates, dirty=registry.dirty, journal=registry.journal, slots=slots[4 * i:4 * i + 4])
+        for (i, (each_id, each_type)) in enumerate(zip(views['ids'].tolist(), types.tolist()))
+    ]
+    vertices = [each_corner for each in tiles for each_corner in each.corners]
+
+    #index the vertices with the neighbour table directly, with the padding (-1) selecting the None after the last vertex.
+    objects = np.empty(vertex_count + 1, dtype=object)
+    objects[:vertex_count] = vertices
+    entries = objects[neighbours.transpose(1, 0, 2).reshape(vertex_count, 2 * len(CardinalDirection))]
+    for (each_vertex, each_entries) in zip(vertices, entries.tolist()):
+        each_vertex.neighbours.restore(each_entries)
+
+    corners = np.concatenate((locations[0::4], locations[2::4]), axis=1)
+    registry._restore_tiles(tiles, [Bounds(*each) for each in corners.tolist()], int(views['ids'].max()) + 1 if tile_count > 0 else 0)
+
+    names = bytes(views['names'])
+    lengths = views['name_lengths']
+    starts = np.cumsum(np.maximum(lengths, 0)) - np.maximum(lengths, 0)
+    for each in np.flatnonzero(lengths >= 0).tolist():
+        registry.name_tile(tiles[each], names[starts[each]:starts[each] + lengths[each]].decode())
+    for each in np.flatnonzero(canvases >= 0).tolist():
+        registry.place_window(tiles[each], tiles[canvases[each]])
+    return registry
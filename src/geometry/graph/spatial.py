@@ -0,0 +1,266 @@
+from typing import ClassVar, Generic, Iterator, MutableMapping, NamedTuple, Optional, Sequence, TypeVar
+
+import numpy as np
+
+from geometry.graph.box import Box
+from geometry.vector import Vector
+
+BoxT = TypeVar('BoxT', bound=Box)
+
+
+class Bounds(NamedTuple):
+    """
+    Inclusive, axis-aligned integer bounds, i.e. the region covered by a Box from its north west corner to its south east corner.
+    """
+    min_horizontal: int
+    min_vertical: int
+    max_horizontal: int
+    max_vertical: int
+
+    @staticmethod
+    def of(target: Box) -> 'Bounds':
+        north_west = target.corners.north_west.location
+        south_east = target.corners.south_east.location
+        return Bounds(north_west.horizontal, north_west.vertical, south_east.horizontal, south_east.vertical)
+
+    @staticmethod
+    def between(north_west: Vector[int], south_east: Vector[int]) -> 'Bounds':
+        return Bounds(north_west.horizontal, north_west.vertical, south_east.horizontal, south_east.vertical)
+
+    def intersects(self, other: 'Bounds') -> bool:
+        return (
+            self.min_horizontal <= other.max_horizontal and other.min_horizontal <= self.max_horizontal
+                and
+            self.min_vertical <= other.max_vertical and other.min_vertical <= self.max_vertical
+        )
+
+    def contains(self, other: 'Bounds') -> bool:
+        return (
+            self.min_horizontal <= other.min_horizontal and other.max_horizontal <= self.max_horizontal
+                and
+            self.min_vertical <= other.min_vertical and other.max_vertical <= self.max_vertical
+        )
+
+    def contains_point(self, horizontal: int, vertical: int) -> bool:
+        return self.min_horizontal <= horizontal <= self.max_horizontal and self.min_vertical <= vertical <= self.max_vertical
+
+
+class _QuadNode(Generic[BoxT]):
+    """
+    A square cell of the quadtree. Leaves store the boxes that overlap them (boxes may therefore be stored in several leaves), branches store exactly four children.
+    """
+    __slots__ = ('bounds', 'depth', 'items', 'children')
+
+    bounds: Bounds
+    depth: int
+    items: Optional[MutableMapping[BoxT, Bounds]]
+    children: Optional[tuple['_QuadNode[BoxT]', ...]]
+
+    def __init__(self, bounds: Bounds, depth: int):
+        self.bounds = bounds
+        self.depth = depth
+        self.items = {}
+        self.children = None
+
+    @property
+    def is_leaf(self) -> bool:
+        return self.children is None
+
+    def child_containing(self, horizontal: int, vertical: int) -> '_QuadNode[BoxT]':
+        (west, north, east, south) = self.children[0].bounds
+        return self.children[(1 if horizontal > east else 0) + (2 if vertical > south else 0)]
+
+
+class SpatialIndex(Generic[BoxT]):
+    """
+    An incrementally maintained bucket quadtree over the bounds of Boxes, for point and rectangle hit-testing.
+
+    Each leaf holds at most _LEAF_CAPACITY boxes before it is subdivided. Since the tiles of a layout do not overlap, every subdivision separates them, so point lookups descend a single O(log n) path and check a bounded number of boxes at the leaf.
+    The root grows (by rebuilding around a larger square) when a box is inserted outside of it, which is rare in practice since layouts live within their canvases.
+
+    The index records the bounds each box was inserted with, so that it can still be removed or updated after its vertices have moved. It is therefore the responsibility of whoever moves vertices to call update() afterwards (see TileRegistry.reindex_tile).
+    """
+    _LEAF_CAPACITY: ClassVar[int] = 8
+    _MAX_DEPTH: ClassVar[int] = 32
+
+    _root: Optional[_QuadNode[BoxT]]
+    _bounds: MutableMapping[BoxT, Bounds]
+
+    def __init__(self):
+        self._root = None
+        self._bounds = {}
+
+    def __len__(self) -> int:
+        return len(self._bounds)
+
+    def __contains__(self, item: BoxT) -> bool:
+        return item in self._bounds
+
+    def __iter__(self) -> Iterator[BoxT]:
+        return iter(self._bounds)
+
+    def insert(self, item: BoxT):
+        bounds = Bounds.of(item)
+        self._bounds[item] = bounds
+        if self._root is None or not self._root.bounds.contains(bounds):
+            self._rebuild()
+        else:
+            self._insert(self._root, item, bounds)
+
+    def extend(self, items: Sequence[BoxT], bounds: Sequence[Bounds]):
+        """
+        Inserts many boxes at once, rebuilding the tree a single time around all of them (e.g. to load a snapshot, see read_snapshot).
+        Boxes are still inserted one at a time if there are few of them compared to the rest (e.g. to rehydrate a small canvas, see TileRegistry.rehydrate).
+        :param items:
+        :param bounds: the current bounds of each box, e.g. computed from their coordinates in bulk.
+        """
+        if self._root is not None and len(items) <= len(self._bounds) // 8:
+            for (each, each_bounds) in zip(items, bounds):
+                self._bounds[each] = each_bounds
+                if not self._root.bounds.contains(each_bounds):
+                    self._rebuild()
+                else:
+                    self._insert(self._root, each, each_bounds)
+            return
+        self._bounds.update(zip(items, bounds))
+        self._rebuild()
+
+    def remove(self, item: BoxT):
+        bounds = self._bounds.pop(item)
+        self._remove(self._root, item, bounds)
+
+    def update(self, item: BoxT):
+        """
+        Re-indexes a box whose vertices may have moved since it was inserted. Does nothing if its bounds are unchanged.
+        """
+        bounds = Bounds.of(item)
+        if self._bounds[item] != bounds:
+            self.remove(item)
+            self._bounds[item] = bounds
+            if not self._root.bounds.contains(bounds):
+                self._rebuild()
+            else:
+                self._insert(self._root, item, bounds)
+
+    def compact(self):
+        """
+        Rebuilds the tree around the boxes that remain, e.g. after many have been removed at once (see TileRegistry.hibernate), since removal only merges leaves which have become small enough.
+        """
+        self._bounds = dict(self._bounds)
+        self._rebuild()
+
+    def at(self, point: Vector[int]) -> Sequence[BoxT]:
+        """
+        :return: the boxes whose (inclusive) bounds contain the point, in insertion order.
+        """
+        horizontal, vertical = point.horizontal, point.vertical
+        node = self._root
+        if node is None or not node.bounds.contains_point(horizontal, vertical):
+            return []
+        while not node.is_leaf:
+            node = node.child_containing(horizontal, vertical)
+        return [each for (each, each_bounds) in node.items.items() if each_bounds.contains_point(horizontal, vertical)]
+
+    def intersecting(self, query: Bounds) -> Sequence[BoxT]:
+        """
+        :return: the boxes whose (inclusive) bounds intersect the query bounds, without duplicates.
+        """
+        result: dict[BoxT, None] = {}
+        if self._root is not None:
+            stack = [self._root]
+            while len(stack) > 0:
+                node = stack.pop()
+                if not node.bounds.intersects(query):
+                    continue
+                if node.is_leaf:
+                    for (each, each_bounds) in node.items.items():
+                        if each_bounds.intersects(query):
+                            result[each] = None
+                else:
+                    stack.extend(node.children)
+        return list(result)
+
+    def _rebuild(self):
+        """
+        Recreates the tree with a square, power-of-two sized root that covers every indexed box.
+        The tree is built top-down, partitioning the bounds of all the boxes with array operations at each node rather than inserting them one at a time. Since a node is split exactly when it would hold more than _LEAF_CAPACITY boxes, this results in the same tree as inserting them in order.
+        """
+        if len(self._bounds) == 0:
+            self._root = None
+            return
+        (items, bounds) = (list(self._bounds.keys()), list(self._bounds.values()))
+        extents = np.array(bounds, dtype=np.int64)
+        (min_horizontal, min_vertical) = extents[:, :2].min(axis=0).tolist()
+        (max_horizontal, max_vertical) = extents[:, 2:].max(axis=0).tolist()
+        size = 1
+        while size <= max(max_horizontal - min_horizontal, max_vertical - min_vertical):
+            size *= 2
+        # leave room to grow in every direction, so that small changes at the edges do not trigger another rebuild.
+        size *= 2
+        self._root = _QuadNode(Bounds(min_horizontal - size // 4, min_vertical - size // 4, min_horizontal - size // 4 + size - 1, min_vertical - size // 4 + size - 1), 0)
+        self._build(self._root, items, bounds, extents, np.arange(len(items)))
+
+    def _build(self, node: _QuadNode[BoxT], items: Sequence[BoxT], bounds: Sequence[Bounds], extents: np.ndarray, selected: np.ndarray):
+        """
+        Fills a new node with the selected boxes, splitting it and recursing into its children if they would not fit in a leaf.
+        :param extents: the bounds of every box as an (items, 4) array.
+        :param selected: the indices of the boxes which intersect the node, in insertion order.
+        """
+        if not (len(selected) > self._LEAF_CAPACITY and node.depth < self._MAX_DEPTH and node.bounds.max_horizontal > node.bounds.min_horizontal):
+            node.items = {items[each]: bounds[each] for each in selected.tolist()}
+            return
+        self._subdivide(node)
+        node.items = None
+        selected_extents = extents[selected]
+        for each_child in node.children:
+            (west, north, east, south) = each_child.bounds
+            intersecting = (
+                (selected_extents[:, 0] <= east) & (west <= selected_extents[:, 2])
+                    &
+                (selected_extents[:, 1] <= south) & (north <= selected_extents[:, 3])
+            )
+            self._build(each_child, items, bounds, extents, selected[intersecting])
+
+    def _insert(self, node: _QuadNode[BoxT], item: BoxT, bounds: Bounds):
+        if not node.is_leaf:
+            for each_child in node.children:
+                if each_child.bounds.intersects(bounds):
+                    self._insert(each_child, item, bounds)
+            return
+
+        node.items[item] = bounds
+        if len(node.items) > self._LEAF_CAPACITY and node.depth < self._MAX_DEPTH and node.bounds.max_horizontal > node.bounds.min_horizontal:
+            self._split(node)
+
+    @staticmethod
+    def _subdivide(node: _QuadNode[BoxT]):
+        (west, north, east, south) = node.bounds
+        half = (east - west + 1) // 2
+        node.children = tuple(
+            _QuadNode(Bounds(child_west, child_north, child_west + half - 1, child_north + half - 1), node.depth + 1)
+            for child_north in (north, north + half)
+            for child_west in (west, west + half)
+        )
+
+    def _split(self, node: _QuadNode[BoxT]):
+        items = node.items
+        self._subdivide(node)
+        node.items = None
+        for (each, each_bounds) in items.items():
+            self._insert(node, each, each_bounds)
+
+    def _remove(self, node: _QuadNode[BoxT], item: BoxT, bounds: Bounds):
+        if node.is_leaf:
+            del node.items[item]
+            return
+
+        for each_child in node.children:
+            if each_child.bounds.intersects(bounds):
+                self._remove(each_child, item, bounds)
+
+        # collapse the branch again once its contents would fit in a single leaf.
+        if all(each_child.is_leaf for each_child in node.children):
+            remaining = {each: each_bounds for each_child in node.children for (each, each_bounds) in each_child.items.items()}
+            if len(remaining) <= self._LEAF_CAPACITY:
+                node.children = None
+                node.items = remaining
@@ -70,6 +70,7 @@ class TaggableElement:
     :param type:
     :return:
     """
+    __slots__ = ()
 
     @abstractmethod
     def generate_tag(self) -> Tag:
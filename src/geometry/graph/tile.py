@@ -1,7 +1,8 @@
 
+import itertools
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Final, Optional, NamedTuple, TYPE_CHECKING
+from typing import Callable, Final, Hashable, Iterable, Iterator, Optional, NamedTuple, Sequence, TYPE_CHECKING, TypeVar
 
 import parse as ps
 
@@ -14,6 +15,14 @@ from geometry.graph.vertex import Vertex
 
 if TYPE_CHECKING:
     from geometry.graph.canvas import Canvas
+    from geometry.graph.coordinates import CoordinateStore
+    from geometry.graph.dirty import DirtyTracker
+    from geometry.graph.journal import Journal
+
+T = TypeVar('T')
+
+#generations are drawn from a single counter rather than counted per tile, so that a generation is never given out twice (see Tile.touch).
+_GENERATIONS: Final[Iterator[int]] = itertools.count(1)
 
 class TileId(NamedTuple):
     """
@@ -28,18 +37,46 @@ class Tile(Box):
     Concrete Boxes that create and strictly own the Vertices that define their corners.
 
     In addition to the corresponding vertices, Tile have unique identifiers.
+
+    Tiles should only be created through a TileRegistry, which supplies the CoordinateStore that their vertices' locations are kept in.
+
+    Each tile has a generation, which procedures must bump (via touch) whenever they modify the locations or neighbours of its vertices. Anything derived from the graph can compare generations to tell whether it is stale (see derive).
+    Generations increase, but are unique across all tiles rather than consecutive, so that a tile can be given back an earlier generation once its modifications have been reverted (see Journal.revert) without anything derived in the meantime appearing valid.
+    Touching a tile also marks it as dirty in the tracker of its registry, if any, so that it is re-validated (see validate_dirty), and records it in the journal of its registry, or counts it as unrecorded if the journal is not active (see Journal).
     """
 
+    __slots__ = ('id', '_name', 'generation', '_derived', '_dirty', '_journal')
+
     id:  Final[TileId]
     _name: Optional[str]
-
-    def __init__(self, id: TileId, north_west: Vector, north_east: Vector, south_east: Vector, south_west: Vector, *, name=None):
-        super().__init__(*(Vertex(location, self, direction) for (location, direction) in zip((north_west, north_east, south_east, south_west), DiagonalDirection)))
+    generation: int
+    _derived: Optional[dict[Hashable, tuple[object, tuple[tuple['Tile', int], ...]]]]
+    _dirty: Optional['DirtyTracker']
+    _journal: Optional['Journal']
+
+    def __init__(self, id: TileId, north_west: Optional[Vector], north_east: Optional[Vector], south_east: Optional[Vector], south_west: Optional[Vector], *, coordinates: 'CoordinateStore', dirty: Optional['DirtyTracker'] = None, journal: Optional['Journal'] = None, name=None, slots: Optional[Sequence[int]] = None):
+        """
+        :param slots: if given, the slots already allocated with the location of each corner in the order of DiagonalDirection, in which case the corners are ignored and the vertices are left unlinked, for whoever allocated them to link (see read_snapshot).
+        """
+        if slots is None:
+            super().__init__(*(Vertex(location, self, direction, coordinates, journal) for (location, direction) in zip((north_west, north_east, south_east, south_west), DiagonalDirection)))
+        else:
+            super().__init__(*(Vertex(None, self, direction, coordinates, journal, slot) for (slot, direction) in zip(slots, DiagonalDirection)))
 
         self.id = id
         self._name = name
-
-        # connect the vertices along each side to one another
+        self.generation = 0
+        self._derived = None
+        self._dirty = dirty
+        self._journal = journal
+
+        if slots is None:
+            self._link_sides()
+
+    def _link_sides(self):
+        """
+        Connects the corners along each side directly to one another, as for a tile with nothing between them (e.g. a new tile, or a canvas whose windows have been hibernated, see TileRegistry.hibernate).
+        """
         for each_direction in CardinalDirection:
             perpendicular_directions = each_direction.axis.perpendicular.directions
             each_side = self.sides[each_direction]
@@ -54,6 +91,45 @@ class Tile(Box):
     def debug_string(self) -> str:
         return f"{self.generate_tag()}@({','.join(each.debug_string for each in self.corners)}"
 
+    def touch(self):
+        """
+        Records that the vertices of this tile have been modified, invalidating anything derived from them (e.g. cached neighbourhoods, including those of other tiles which depend on this one).
+        :return:
+        """
+        (generation, derived) = (self.generation, self._derived)
+        self.generation = next(_GENERATIONS)
+        self._derived = None
+        if self._dirty is not None:
+            self._dirty.mark(self)
+        if self._journal is not None:
+            if self._journal.active:
+                self._journal.record_touch(self, generation, derived)
+            else:
+                self._journal.unrecorded += 1
+
+    def derive(self, key: Hashable, compute: Callable[..., tuple[T, Iterable['Tile']]], *args) -> T:
+        """
+        Caches a value derived from the graph around this tile, such as one side of a neighbourhood.
+        The value is recomputed only once this tile or any of the other tiles it was derived from have been touched since it was cached.
+        :param key: identifies the derivation among others cached on this tile.
+        :param compute: called with args, returns the value and the other tiles whose vertices were read to compute it.
+        :return:
+        """
+        if self._derived is None:
+            self._derived = {}
+        else:
+            entry = self._derived.get(key)
+            if entry is not None:
+                for (each_tile, each_generation) in entry[1]:
+                    if each_tile.generation != each_generation:
+                        break
+                else:
+                    return entry[0]
+
+        (result, dependencies) = compute(*args)
+        self._derived[key] = (result, tuple((each_tile, each_tile.generation) for each_tile in dict.fromkeys((self, *dependencies))))
+        return result
+
     @property
     def name(self):
         return self._name
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Final, TYPE_CHECKING
+from typing import Final, Optional, TYPE_CHECKING
 
 from geometry.direction.diagonal import DiagonalDirection
 from geometry.vector import Vector
@@ -8,6 +8,8 @@ from geometry.graph.tag import TaggableElement, Tag
 
 
 if TYPE_CHECKING:
+    from geometry.graph.coordinates import CoordinateStore
+    from geometry.graph.journal import Journal
     from geometry.graph.tile import Tile, TileTag
     from geometry.graph.neighbourhood import VertexNeighbourhood
 
@@ -17,26 +19,44 @@ class Vertex(TaggableElement):
     """
     A node in the layout graph. Every node corresponds uniquely to a corner of a Tile, and belongs exclusively to that Tile object.
     Stores:
-     - Its location, via a Point
+     - Its location, via a slot in the CoordinateStore of its registry
      - The owning Box.
      - A list of the adjacent Vertices (or Edges, as the case may be) in each cardinal direction (N,S,E,W)
 
-    Vertex persist precisely with their owning tile, and should never be destroyed directly (only through the Tile). For this reason, its location is a separate object.
+    Vertex persist precisely with their owning tile, and should never be destroyed directly (only through the Tile). Its location is not stored on the vertex itself, but at its slot in the CoordinateStore of the registry, which is allocated with the vertex and released by the registry along with its tile.
+    - Reading the location returns an immutable Vector snapshot, and assigning a location writes it back to the store.
+    - The store is the source of truth, so the coordinates of many vertices can also be read or written at once through their slots (e.g. by a ResizePlan), without going through their Vertex objects.
     """
 
 
 
+    __slots__ = ('owner', 'role', 'slot', 'neighbours', '_coordinates')
+
     owner: Final['Tile']
     role: Final[DiagonalDirection]
-    location: Vector[int] #not optional, so Windows should only be created via algorithms - canvass could possibly simulate free floating layers? or an extension of canvass.
+    slot: Final[int] #location is not optional, so Windows should only be created via algorithms - canvass could possibly simulate free floating layers? or an extension of canvass.
     neighbours: Final['VertexNeighbourhood']
+    _coordinates: Final['CoordinateStore']
 
-    def __init__(self, location: Vector[int], owner: 'Tile', role: DiagonalDirection):
+    def __init__(self, location: Optional[Vector[int]], owner: 'Tile', role: DiagonalDirection, coordinates: 'CoordinateStore', journal: Optional['Journal'] = None, slot: Optional[int] = None):
+        """
+        :param location: allocated a new slot in the store, unless a slot is given.
+        :param slot: a slot already allocated with the location of the vertex (e.g. see read_snapshot), in which case location is ignored.
+        """
         from geometry.graph.neighbourhood import VertexNeighbourhood
         self.owner = owner
         self.role = role
-        self.location = location
-        self.neighbours = VertexNeighbourhood([],[],[],[])
+        self._coordinates = coordinates
+        self.slot = coordinates.allocate(location) if slot is None else slot
+        self.neighbours = VertexNeighbourhood(journal)
+
+    @property
+    def location(self) -> Vector[int]:
+        return self._coordinates[self.slot]
+
+    @location.setter
+    def location(self, value: Vector[int]):
+        self._coordinates[self.slot] = value
 
     def generate_tag(self) -> 'VertexTag':
         return VertexTag(self.owner.generate_tag(), self.role)
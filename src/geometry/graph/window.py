@@ -12,6 +12,7 @@ class Window(Tile):
         Theoretically, a Window could hold a nested Canvas, given suitable polymorphic abstraction of size checks etc.
         However, for now such ideas are out of scope.
     """
+    __slots__ = ()
 
     def generate_tag(self) -> 'WindowTag':
         return WindowTag(self._name if self._name is not None else self.id)
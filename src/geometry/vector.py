@@ -6,7 +6,7 @@ from utility.enum_data import enum_dataclass
 
 T = TypeVar('T')
 
-@enum_dataclass(frozen=True)
+@enum_dataclass(compiled=True)
 class Vector(AxisDataclass[T]):
 
     def __str__(self):
@@ -29,4 +29,6 @@ class Vector(AxisDataclass[T]):
         return self.__op(other, operator.mul)
 
     def __mul__(self, scale: T) -> 'Vector[T]':
-        return Vector(*tuple(each * scale for each in self))
\ No newline at end of file
+        return Vector(*tuple(each * scale for each in self))
+
+    __rmul__ = __mul__
\ No newline at end of file
@@ -1,6 +1,13 @@
+from typing import Callable, MutableSequence, Optional, TYPE_CHECKING
+
 from settings import Settings
+from geometry.graph.dirty import DirtyTracker
 from geometry.graph.registry import TileRegistry
 
+if TYPE_CHECKING:
+    from procedures.history import UndoHistory
+    from procedures.transaction import Change, Transaction
+
 
 class GeometricTileManager:
     """
@@ -12,7 +19,31 @@ class GeometricTileManager:
 
     graph: TileRegistry
     settings: Settings
+    #called with each change once it has been committed (see Transaction).
+    listeners: MutableSequence[Callable[['Change'], None]]
+    #records committed transactions so that they can be undone, if set.
+    history: Optional['UndoHistory']
 
     def __init__(self):
         self.graph = TileRegistry()
-        self.settings = Settings()
\ No newline at end of file
+        self.settings = Settings()
+        self.listeners = []
+        self.history = None
+
+    @property
+    def dirty(self) -> DirtyTracker:
+        """
+        The tiles which have been created or touched by procedures since they were last validated (see validate_dirty).
+        """
+        return self.graph.dirty
+
+    def transaction(self) -> 'Transaction':
+        """
+        Groups manipulations so that they are validated and reported once, or rolled back together. Connections are still repaired by each manipulation as it is made (see Transaction), e.g.:
+            with manager.transaction() as transaction:
+                split_window_with_new_window(manager, target, EAST)
+                ...
+            problems = transaction.change.problems
+        """
+        from procedures.transaction import Transaction
+        return Transaction(self)
\ No newline at end of file
@@ -45,3 +45,43 @@ class InsufficientDistanceProblem(VertexDistanceProblem):
 
 class ExcessiveDistanceProblem(VertexDistanceProblem):
     ...
+
+
+class NeighbourPlacementProblem(VertexProblem, OrientedProblem):
+    """
+    A vertex with one neighbour on a side must be aligned with it, and a vertex with two must lie strictly between them (see facing_neighbours). Either way, the neighbours must lie on that side of it.
+    """
+    def __init__(self, vertex: Vertex, direction: CardinalDirection):
+        super().__init__(vertex)
+        self.direction = direction
+
+    @property
+    def description(self) -> str:
+        return f'The neighbours on side {self.direction} of vertex {self.vertex.debug_string} are not placed where that side faces.'
+
+
+class AsymmetricNeighbourProblem(VertexProblem, OrientedProblem):
+    """
+    Each neighbour of a vertex must face back toward the line of that vertex, i.e. its own neighbours on the opposite side must lie on the same line as the vertex.
+    """
+    def __init__(self, vertex: Vertex, direction: CardinalDirection, neighbour: Vertex):
+        super().__init__(vertex)
+        self.direction = direction
+        self.neighbour = neighbour
+
+    @property
+    def description(self) -> str:
+        return f'Vertex {self.vertex.debug_string} has {self.neighbour.debug_string} as a neighbour on side {self.direction}, but it does not face back toward it.'
+
+
+class UnmatchedCornerProblem(VertexProblem, OrientedProblem):
+    """
+    Each corner of a canvas must face the corner of a window with the same role and location on both of its inward sides.
+    """
+    def __init__(self, vertex: Vertex, direction: CardinalDirection):
+        super().__init__(vertex)
+        self.direction = direction
+
+    @property
+    def description(self) -> str:
+        return f'Canvas corner {self.vertex.debug_string} does not face the matching corner of a window on side {self.direction}.'
@@ -0,0 +1,186 @@
+from typing import MutableSequence, Optional, Sequence
+
+import numpy as np
+
+from geometry.axis import Axis, AXIS_PERPENDICULARS
+from geometry.direction.cardinal import CardinalDirection, AXIS_DIRECTIONS, CARDINAL_AXES, CARDINAL_OPPOSITES
+from geometry.direction.diagonal import DiagonalDirection, CARDINAL_DIAGONALS
+from geometry.graph.arrays import GraphArrays
+from manager import GeometricTileManager
+from problems.edge import BrokenEdgeProblem, NotAxisAlignedProblem, OutOfOrderProblem
+from problems.state import StateProblem
+from problems.vertex import AsymmetricNeighbourProblem, NeighbourAbsenceProblem, NeighbourPlacementProblem, UnmatchedCornerProblem
+
+"""
+Vectorised checks of the invariants of a whole graph, for offline audits and fuzzing of large layouts.
+Not to be confused with the examination module, which validates individual graph objects (and is what procedures use as they go).
+"""
+
+#cardinal ordinal -> the ordinals of the (negative, positive) directions along its sides, i.e. along the perpendicular axis.
+_SIDE_DIRECTIONS: np.ndarray = np.array([AXIS_DIRECTIONS[AXIS_PERPENDICULARS[each]] for each in CARDINAL_AXES])
+#diagonal ordinal, cardinal ordinal -> whether the diagonal faces the cardinal direction.
+_FACES: np.ndarray = np.array([[each_cardinal in each_diagonal for each_cardinal in CardinalDirection] for each_diagonal in DiagonalDirection])
+_SIGNS: np.ndarray = np.array([1 if each.is_positive else -1 for each in CardinalDirection])
+_DIRECTIONS: tuple[CardinalDirection, ...] = tuple(CardinalDirection)
+
+
+def audit(manager: GeometricTileManager, arrays: Optional[GraphArrays] = None) -> Sequence[StateProblem]:
+    """
+    Checks every invariant of the graph at once, with array operations over a GraphArrays snapshot rather than by validating each tile in turn (see validate_all).
+
+    Reports the same problems as validate for the invariants they share (the alignment, order and continuity of the sides of every tile, the links along the sides of every window, and missing neighbours), along with:
+    - NeighbourPlacementProblem: a single neighbour which is not aligned with its vertex, or two which do not lie either side of it, or any which lie behind it.
+    - AsymmetricNeighbourProblem: a neighbour which does not face back toward the line of its vertex.
+    - UnmatchedCornerProblem: a canvas corner which does not face the corner of a window with the same role and location.
+    Problems are grouped by invariant rather than by tile.
+    :param manager:
+    :param arrays: a snapshot of the graph of the manager, if one has already been exported.
+    :return: A potentially-empty sequence of StateProblem objects describing any violated constraints.
+    """
+    if arrays is None:
+        arrays = GraphArrays(manager.graph)
+    result: list[StateProblem] = []
+    _audit_sides(arrays, result)
+    _audit_neighbours(arrays, result)
+    _audit_canvas_corners(arrays, result)
+    return result
+
+
+def _audit_sides(arrays: GraphArrays, result: MutableSequence[StateProblem]):
+    """
+    Checks the sides of every tile as validate(Edge) does, then the links along the sides of every window as validate(Window) does.
+    """
+    tile_count = len(arrays.tiles)
+    (side_tiles, side_directions) = (np.repeat(np.arange(tile_count), 4), np.tile(np.arange(4), tile_count))
+    corner_roles = np.array(CARDINAL_DIAGONALS)[side_directions]
+    (a, b) = (4 * side_tiles + corner_roles[:, 0], 4 * side_tiles + corner_roles[:, 1])
+    (backward, forward) = (_SIDE_DIRECTIONS[side_directions, 0], _SIDE_DIRECTIONS[side_directions, 1])
+
+    def side(i: int):
+        return arrays.tiles[side_tiles[i]].sides[_DIRECTIONS[side_directions[i]]]
+
+    (a_locations, b_locations) = (arrays.locations[a], arrays.locations[b])
+    misaligned = (a_locations != b_locations).all(axis=-1)
+    out_of_order = a_locations > b_locations
+    for each in np.flatnonzero(misaligned).tolist():
+        result.append(NotAxisAlignedProblem(side(each)))
+    for each_axis in Axis:
+        for each in np.flatnonzero(out_of_order[:, each_axis.ordinal]).tolist():
+            result.append(OutOfOrderProblem(side(each), each_axis))
+
+    #walk every remaining side from a toward b in lockstep, one step per iteration, through vertices with exactly one neighbour forward which lie on the side, between the last vertex and b.
+    successors = np.where(arrays.counts == 1, arrays.neighbours[..., 0], -1)
+    successors[successors < 0] = -1
+    (along, across) = (np.array(CARDINAL_AXES)[forward], np.array(AXIS_PERPENDICULARS)[np.array(CARDINAL_AXES)[forward]])
+    pending = np.flatnonzero(~misaligned & ~out_of_order.any(axis=-1))
+    current = a[pending]
+    broken = []
+    #a path can visit each vertex at most once, so any side still pending after that many steps is a cycle that never reaches b.
+    for _ in range(len(arrays) + 1):
+        unfinished = current != b[pending]
+        (pending, current) = (pending[unfinished], current[unfinished])
+        if len(pending) == 0:
+            break
+        previous = current
+        current = successors[forward[pending], current]
+        safe = np.maximum(current, 0)
+        (sides_along, sides_across) = (along[pending], across[pending])
+        stuck = (
+            (current < 0)
+                |
+            (arrays.locations[safe, sides_across] != arrays.locations[a[pending], sides_across])
+                |
+            (arrays.locations[safe, sides_along] < arrays.locations[previous, sides_along])
+                |
+            (arrays.locations[safe, sides_along] > arrays.locations[b[pending], sides_along])
+        )
+        broken.append(pending[stuck])
+        (pending, current) = (pending[~stuck], current[~stuck])
+    else:
+        broken.append(pending)
+    for each in np.sort(np.concatenate(broken)).tolist() if len(broken) > 0 else ():
+        result.append(BrokenEdgeProblem(side(each)))
+
+    windows = ~arrays.is_sentinel[side_tiles]
+    linked = (
+        (arrays.counts[forward, a] == 1) & (arrays.neighbours[forward, a, 0] == b)
+            &
+        (arrays.counts[backward, b] == 1) & (arrays.neighbours[backward, b, 0] == a)
+    )
+    for each in np.flatnonzero(windows & ~linked).tolist():
+        result.append(BrokenEdgeProblem(side(each)))
+
+
+def _audit_neighbours(arrays: GraphArrays, result: MutableSequence[StateProblem]):
+    """
+    Checks the number and placement of the neighbours on every side of every vertex, and that each neighbour faces back.
+    """
+    vertex_count = len(arrays)
+    sentinel = arrays.is_sentinel[arrays.owners]
+    outward = _FACES[arrays.roles].T
+
+    #only the outward sides of canvas corners face nothing.
+    for (each_direction, each_vertex) in zip(*np.nonzero((arrays.counts == 0) & ~(sentinel[np.newaxis, :] & outward))):
+        result.append(NeighbourAbsenceProblem(arrays.vertices[each_vertex], _DIRECTIONS[each_direction]))
+
+    #every link as (direction, vertex, neighbour), excluding links to vertices outside the graph, which cannot face back.
+    (link_directions, link_vertices, link_entries) = np.nonzero(arrays.neighbours != -1)
+    link_neighbours = arrays.neighbours[link_directions, link_vertices, link_entries]
+    for each in np.flatnonzero(link_neighbours < 0).tolist():
+        (each_direction, each_vertex) = (_DIRECTIONS[link_directions[each]], arrays.vertices[link_vertices[each]])
+        result.append(AsymmetricNeighbourProblem(each_vertex, each_direction, each_vertex.neighbours[each_direction][link_entries[each]]))
+    internal = link_neighbours >= 0
+    (link_directions, link_vertices, link_entries, link_neighbours) = (link_directions[internal], link_vertices[internal], link_entries[internal], link_neighbours[internal])
+
+    (axes, parallel_axes) = (np.array(CARDINAL_AXES)[link_directions], np.array(AXIS_PERPENDICULARS)[np.array(CARDINAL_AXES)[link_directions]])
+    (vertex_locations, neighbour_locations) = (arrays.locations[link_vertices], arrays.locations[link_neighbours])
+    links = np.arange(len(link_vertices))
+    ahead = (neighbour_locations[links, axes] - vertex_locations[links, axes]) * _SIGNS[link_directions] >= 0
+    offsets = neighbour_locations[links, parallel_axes] - vertex_locations[links, parallel_axes]
+    counts = arrays.counts[link_directions, link_vertices]
+    placed = ahead & np.where(counts == 1, offsets == 0, np.where(link_entries == 0, offsets < 0, offsets > 0))
+    misplaced = np.zeros((len(_DIRECTIONS), vertex_count), dtype=bool)
+    misplaced[link_directions[~placed], link_vertices[~placed]] = True
+    for (each_direction, each_vertex) in zip(*np.nonzero(misplaced)):
+        result.append(NeighbourPlacementProblem(arrays.vertices[each_vertex], _DIRECTIONS[each_direction]))
+
+    #each neighbour must have neighbours on the opposite side, all on the same line as the vertex.
+    opposites = np.array(CARDINAL_OPPOSITES)[link_directions]
+    (back, back_counts) = (arrays.neighbours[opposites, link_neighbours], arrays.counts[opposites, link_neighbours])
+    back_locations = np.where(back >= 0, arrays.locations[np.maximum(back, 0), axes[:, np.newaxis]], vertex_locations[links, axes][:, np.newaxis])
+    faces_back = (back_counts > 0) & (back != -2).all(axis=-1) & ((back == -1) | (back_locations == vertex_locations[links, axes][:, np.newaxis])).all(axis=-1)
+    for each in np.flatnonzero(~faces_back).tolist():
+        result.append(AsymmetricNeighbourProblem(arrays.vertices[link_vertices[each]], _DIRECTIONS[link_directions[each]], arrays.vertices[link_neighbours[each]]))
+
+
+def _audit_canvas_corners(arrays: GraphArrays, result: MutableSequence[StateProblem]):
+    """
+    Checks that each corner of each canvas faces the corner of a window with the same role and location on both of its inward sides.
+    The corners of an empty canvas face each other along its sides instead, which is only accepted if all of them do.
+    """
+    corners = np.flatnonzero(arrays.is_sentinel[arrays.owners])
+    checks = []
+    for each_direction in CardinalDirection:
+        facing = corners[~_FACES[arrays.roles[corners], each_direction.ordinal]]
+        neighbours = arrays.neighbours[each_direction.ordinal, facing, 0]
+        linked = (
+            (arrays.counts[each_direction.ordinal, facing] == 1)
+                &
+            (neighbours >= 0)
+        )
+        safe = np.maximum(neighbours, 0)
+        matched = linked & (
+            (arrays.roles[safe] == arrays.roles[facing])
+                &
+            (arrays.locations[safe] == arrays.locations[facing]).all(axis=-1)
+                &
+            ~arrays.is_sentinel[arrays.owners[safe]]
+        )
+        checks.append((each_direction, facing, matched, linked & (arrays.owners[safe] == arrays.owners[facing])))
+
+    empty = np.ones(len(arrays.tiles), dtype=bool)
+    for (_, facing, _, each_own) in checks:
+        empty[arrays.owners[facing[~each_own]]] = False
+    for (each_direction, facing, matched, _) in checks:
+        for each in facing[~(matched | empty[arrays.owners[facing]])].tolist():
+            result.append(UnmatchedCornerProblem(arrays.vertices[each], each_direction))
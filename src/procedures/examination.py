@@ -1,21 +1,32 @@
 from abc import abstractmethod
 from functools import singledispatch
-from typing import Sequence
+from typing import Iterable, Sequence
 
 from geometry.axis import Axis
 from geometry.direction.cardinal import CardinalDirection
 from geometry.direction.diagonal import DiagonalDirection
 from geometry.graph.box import Box
+from geometry.graph.canvas import Canvas
 from geometry.graph.edge import Edge
 from geometry.graph.tile import Tile
 from geometry.graph.vertex import Vertex
 from geometry.graph.window import Window
+from manager import GeometricTileManager
 from problems.edge import NotAxisAlignedProblem, BrokenEdgeProblem, OutOfOrderProblem
 from problems.state import StateProblem
 from problems.vertex import NeighbourAbsenceProblem
 
 
 def is_divided(target: Tile) -> bool:
+    """
+    Determines whether or not a tile has other tiles placed within it, i.e. whether the corners on any of its sides are not directly connected to one another.
+    Canvases count the windows placed within them (see Canvas.window_count), so this is O(1) for canvases with windows placed within them. Other tiles, and canvases whose count is 0 (which may still have windows linked to them directly), are inspected side by side.
+    :param target:
+    :return:
+    """
+    if isinstance(target, Canvas) and target.window_count > 0:
+        return True
+
     for each_side in CardinalDirection:
         each_edge = target.sides[each_side]
 
@@ -83,14 +94,13 @@ def _(target: Edge) -> Sequence[StateProblem]:
     Valid edges must be aligned (parallel) to an axis, must start before they end (or at the same place), and the start and end must be reachable through an unambigous path of vertices that lie strictly on the edge
     - Note: the latter condition can observed by ensuring that there each vertex has only one neighbor in both directions along that line.
     -- Having exactly one neighbour in a direction implies being the only neighbour in the reverse direction, so one directional tests suffice.
+    - The path is walked in O(path) steps and always terminates, even if the links are corrupted into a cycle: every step must stay on the line and must not move backward or past b, so the walk can only revisit a vertex without advancing, which is detected by remembering the vertices visited since it last advanced.
     :param target:
     :return:
     """
     result = []
 
-    forward_direction = target.axis.directions[-1]
-
-    if not (target.a.location.horizontal == target.b.location.horizontal or target.a.location.vertical == target.a.location.vertical):
+    if not (target.a.location.horizontal == target.b.location.horizontal or target.a.location.vertical == target.b.location.vertical):
         result.append(NotAxisAlignedProblem(target))
 
     if target.a.location.horizontal > target.b.location.horizontal:
@@ -100,13 +110,28 @@ def _(target: Edge) -> Sequence[StateProblem]:
         result.append(OutOfOrderProblem(target, Axis.VERTICAL))
 
     if len(result) == 0:
-        current = target.a
+        axis = target.axis
+        forward_direction = axis.directions[-1]
+        (line, end) = (target.a.location[axis.perpendicular], target.b.location[axis])
+        (current, position) = (target.a, target.a.location[axis])
+        #vertices visited at the current position, i.e. since the walk last advanced (e.g. through coincident corners of adjacent tiles).
+        visited = {current}
         while current is not target.b:
             options = current.neighbours[forward_direction]
             if len(options) != 1:
                 result.append(BrokenEdgeProblem(target))
                 break
-
+            current = options[0]
+            location = current.location
+            if location[axis.perpendicular] != line or not (position <= location[axis] <= end):
+                result.append(BrokenEdgeProblem(target))
+                break
+            if location[axis] != position:
+                (position, visited) = (location[axis], set())
+            elif current in visited:
+                result.append(BrokenEdgeProblem(target))
+                break
+            visited.add(current)
 
     return result
 
@@ -128,15 +153,16 @@ def _(target: Window) -> Sequence[StateProblem]:
     for each_side in CardinalDirection:
         each_side: CardinalDirection
         each_edge = target.sides[each_side]
-        (forward_neighbours, backward_neighbours) = [each_edge.a.neighbours[dir] for dir in each_side.axis.directions]
+        (backward_direction, forward_direction) = each_edge.axis.directions
+        (forward_neighbours, backward_neighbours) = (each_edge.a.neighbours[forward_direction], each_edge.b.neighbours[backward_direction])
         if (
                 len(forward_neighbours) != 1
                 or
-                forward_neighbours[0] is not each_side.b
+                forward_neighbours[0] is not each_edge.b
                 or
                 len(backward_neighbours) != 1
                 or
-                backward_neighbours[0] is not each_side.a
+                backward_neighbours[0] is not each_edge.a
         ):
             result.append(BrokenEdgeProblem(each_edge))
 
@@ -147,3 +173,48 @@ def _(target: Window) -> Sequence[StateProblem]:
 
     return result
 
+
+
+def validate_dirty(manager: GeometricTileManager) -> Sequence[StateProblem]:
+    """
+    Validates only the tiles which have been created or touched since they were last validated (see DirtyTracker), along with their immediate neighbours (see validate_around).
+    This costs time in proportion to the size of the change rather than of the layout, so it can be run after every manipulation. The dirty tiles are then considered valid.
+    :param manager:
+    :return: A potentially-empty sequence of StateProblem objects describing any violated constraints, as for validate.
+    """
+    return validate_around(manager, manager.dirty.take())
+
+def validate_around(manager: GeometricTileManager, targets: Iterable[Tile]) -> Sequence[StateProblem]:
+    """
+    Validates the given tiles along with their immediate neighbours, since a manipulation which corrupts the links of a tile usually does so through the links of the tiles beside it.
+    - Canvases are only validated by validate_all, since their sides run along the whole border of the layout. The windows along them are still validated when they are given or beside a given tile.
+    :param manager:
+    :param targets:
+    :return: A potentially-empty sequence of StateProblem objects describing any violated constraints, as for validate.
+    """
+    targets: dict[Tile, None] = dict.fromkeys(targets)
+    for each_tile in list(targets):
+        for each_corner in each_tile.corners:
+            for each_direction in CardinalDirection:
+                for each_neighbour in each_corner.neighbours[each_direction]:
+                    targets.setdefault(each_neighbour.owner)
+
+    result = []
+    for each_tile in targets:
+        #links may still lead to tiles that have since been erased, whose vertices can no longer be read.
+        if not each_tile.is_sentinel and manager.graph.by_type[each_tile.__class__].get(each_tile.id) is each_tile:
+            result += validate(each_tile)
+    return result
+
+def validate_all(manager: GeometricTileManager) -> Sequence[StateProblem]:
+    """
+    Validates every tile in the layout, after which none are considered dirty (see validate_dirty).
+    :param manager:
+    :return: A potentially-empty sequence of StateProblem objects describing any violated constraints, as for validate.
+    """
+    manager.dirty.take()
+    result = []
+    for each_class in (Canvas, Window):
+        for each_tile in manager.graph.by_type[each_class].values():
+            result += validate(each_tile)
+    return result
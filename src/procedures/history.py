@@ -0,0 +1,125 @@
+import collections
+from typing import MutableSequence, Optional
+
+from geometry.graph.journal import Delta
+from manager import GeometricTileManager
+from procedures.transaction import Change, notify
+
+
+class UndoHistory:
+    """
+    Multi-level undo and redo of the manipulations committed in transactions (see Transaction), kept as compact deltas rather than copies of the graph (see Delta).
+
+    The deltas are kept in a ring buffer within a budget of bytes: once it is exceeded, the oldest deltas are evicted and can no longer be undone.
+    Undoing or redoing a delta costs time in proportion to the size of the delta, regardless of the depth of the history or the size of the layout.
+    Recording a new delta discards those which have been undone, as they can no longer be redone.
+
+    Only manipulations made within transactions are recorded. Once the graph has been manipulated outside of one (i.e. any tile has been touched, see Journal.unrecorded) since the latest delta was recorded or applied, the deltas no longer match the graph, so the history is cleared rather than applied.
+    The same goes for a delta which refers to tiles that have since been dropped, e.g. by hibernating their canvas (see Delta.matches), although hibernating is not itself a manipulation.
+    Enable it by assigning it to the manager, e.g.:
+        manager.history = UndoHistory(manager)
+    """
+    __slots__ = ('manager', 'budget', '_done', '_undone', '_nbytes', '_unrecorded')
+
+    manager: GeometricTileManager
+    budget: int
+    _done: collections.deque[Delta]
+    _undone: MutableSequence[Delta]
+    _nbytes: int
+    _unrecorded: int
+
+    def __init__(self, manager: GeometricTileManager, budget: int = 16 * 2 ** 20):
+        """
+        :param manager:
+        :param budget: the maximum number of bytes kept by the deltas (see Delta.nbytes).
+        """
+        self.manager = manager
+        self.budget = budget
+        self._done = collections.deque()
+        self._undone = []
+        self._nbytes = 0
+        self._unrecorded = manager.graph.journal.unrecorded
+
+    def __len__(self) -> int:
+        """
+        :return: the number of deltas which can be undone.
+        """
+        return len(self._done)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes kept by all deltas, including those which can be redone.
+        """
+        return self._nbytes
+
+    @property
+    def can_undo(self) -> bool:
+        return len(self._done) > 0 and self._is_current and self._done[-1].matches(self.manager.graph)
+
+    @property
+    def can_redo(self) -> bool:
+        return len(self._undone) > 0 and self._is_current and self._undone[-1].matches(self.manager.graph)
+
+    @property
+    def _is_current(self) -> bool:
+        """
+        Whether the graph has not been manipulated outside of a transaction since the latest delta was recorded or applied.
+        """
+        return self.manager.graph.journal.unrecorded == self._unrecorded
+
+    def record(self, target: Delta):
+        """
+        Adds a committed delta, discarding any which have been undone, then evicts the oldest deltas until the history is within its budget.
+        """
+        if not self._is_current:
+            self.clear()
+        self._discard_undone()
+        #the values derived before the delta are only needed to revert it straight away, so are not kept alive by the history.
+        target.derived = None
+        self._done.append(target)
+        self._nbytes += target.nbytes
+        while self._nbytes > self.budget and len(self._done) > 0:
+            self._forget(self._done.popleft())
+
+    def undo(self) -> Optional[Change]:
+        """
+        Restores the graph to its state before the most recent delta, and notifies the listeners of the manager.
+        :return: the change, or None if there is nothing to undo (including if the history has been cleared, since the graph was manipulated outside of a transaction).
+        """
+        return self._apply(self._done, self._undone, False)
+
+    def redo(self) -> Optional[Change]:
+        """
+        Reapplies the most recently undone delta, and notifies the listeners of the manager.
+        :return: the change, or None if there is nothing to redo (including if the history has been cleared, since the graph was manipulated outside of a transaction).
+        """
+        return self._apply(self._undone, self._done, True)
+
+    def clear(self):
+        self._discard_undone()
+        while len(self._done) > 0:
+            self._forget(self._done.popleft())
+        self._unrecorded = self.manager.graph.journal.unrecorded
+
+    def _apply(self, source: MutableSequence[Delta], destination: MutableSequence[Delta], forward: bool) -> Optional[Change]:
+        if self.manager.graph.journal.active:
+            raise ValueError("The history cannot be applied within a transaction.")
+        if not self._is_current or (len(source) > 0 and not source[-1].matches(self.manager.graph)):
+            self.clear()
+        if len(source) == 0:
+            return None
+        delta = source.pop()
+        delta.apply(self.manager.graph, forward)
+        #applying the delta touches its tiles, which is not a manipulation outside of the history.
+        self._unrecorded = self.manager.graph.journal.unrecorded
+        destination.append(delta)
+        return notify(self.manager, delta.tiles)
+
+    def _discard_undone(self):
+        while len(self._undone) > 0:
+            self._forget(self._undone.pop())
+
+    def _forget(self, target: Delta):
+        target.release(self.manager.graph)
+        self._nbytes -= target.nbytes
@@ -1,17 +1,28 @@
-from typing import Sequence
+from bisect import bisect_left, bisect_right
+from typing import Iterable, MutableMapping, MutableSequence, Optional, Sequence
 
-from procedures.examination import is_divided, are_aligned
+from procedures.examination import is_divided, are_aligned, validate
 from geometry.axis import Axis
 from geometry.direction.cardinal import CardinalDirection
 from geometry.graph.canvas import Canvas
 from geometry.graph.edge import Edge
 from geometry.graph.vertex import Vertex
 from geometry.graph.window import Window
+from geometry.vector import Vector
 from manager import GeometricTileManager
 from problems.box import BoxTooSmallForMarginsProblem
 from problems.state import StateProblem
 
 
+def touch_owners(vertices: Iterable[Vertex]):
+    """
+    Bumps the generation of each distinct tile that owns any of the given (modified) vertices, once. See Tile.touch.
+    :param vertices:
+    :return:
+    """
+    for each_owner in dict.fromkeys(each.owner for each in vertices):
+        each_owner.touch()
+
 def establish_connections_along_injection_axis(target: Window, parallel_axis: Axis, neighbours_negative: tuple[Sequence[Vertex], Sequence[Vertex]], neighbours_positive: tuple[Sequence[Vertex], Sequence[Vertex]]):
     """
       Connects a new node to its neighbours along the axis it was injected into a box by.
@@ -33,25 +44,74 @@ def establish_connections_along_injection_axis(target: Window, parallel_axis: Ax
     :return:
     """
     ## now connect the new tile to its neighbours along the split axis.
+    perpendicular_axis = parallel_axis.perpendicular
     for (each_dir, neighbours_in_dir, neighbours_in_opposite_dir) in zip(parallel_axis.directions, (neighbours_negative, neighbours_positive), (neighbours_positive, neighbours_negative)):
+        each_opposite_dir = each_dir.opposite
         for (each_new_vertex, each_intended_neighbours, each_opposite_neighbours) in zip(target.sides[each_dir], neighbours_in_dir, neighbours_in_opposite_dir):
             each_neighbour = each_intended_neighbours[0]
             each_other_neighbour = each_opposite_neighbours[0]
             each_new_vertex.neighbours[each_dir] = list(each_intended_neighbours)
 
-            if len(each_neighbour.neighbours[each_dir.opposite]) == 0 or are_aligned(each_new_vertex, each_neighbour, parallel_axis.perpendicular):
-                each_neighbour.neighbours[each_dir.opposite] = [each_new_vertex]
-            elif each_neighbour.neighbours[each_dir.opposite][-1] == each_other_neighbour:
-               each_neighbour.neighbours[each_dir.opposite][-1] = each_new_vertex
+            if len(each_neighbour.neighbours[each_opposite_dir]) == 0 or are_aligned(each_new_vertex, each_neighbour, perpendicular_axis):
+                each_neighbour.neighbours[each_opposite_dir] = [each_new_vertex]
+            elif each_neighbour.neighbours[each_opposite_dir][-1] == each_other_neighbour:
+               each_neighbour.neighbours.replace(each_opposite_dir, -1, each_new_vertex)
             if len(each_intended_neighbours) > 1:
                 assert len(each_intended_neighbours) == 2
 
                 each_neighbour = each_intended_neighbours[-1]
                 each_other_neighbour = each_opposite_neighbours[0]
-                if len(each_neighbour.neighbours[each_dir.opposite]) == 0 or are_aligned(each_new_vertex, each_neighbour, parallel_axis.perpendicular):
-                    each_neighbour.neighbours[each_dir.opposite] = [each_new_vertex]
-                elif each_neighbour.neighbours[each_dir.opposite][0] == each_other_neighbour:
-                    each_neighbour.neighbours[each_dir.opposite][0] = each_new_vertex
+                if len(each_neighbour.neighbours[each_opposite_dir]) == 0 or are_aligned(each_new_vertex, each_neighbour, perpendicular_axis):
+                    each_neighbour.neighbours[each_opposite_dir] = [each_new_vertex]
+                elif each_neighbour.neighbours[each_opposite_dir][0] == each_other_neighbour:
+                    each_neighbour.neighbours.replace(each_opposite_dir, 0, each_new_vertex)
+
+    touch_owners((*target.corners, *(each for each_side in (*neighbours_negative, *neighbours_positive) for each in each_side)))
+
+def connect_facing_vertex_lines(targets: Sequence[Vertex], others: Sequence[Vertex], facing_direction: CardinalDirection):
+    """
+    Connects each vertex of one line to its nearest vertices on a parallel line which it faces, in a single merge-walk over both lines.
+    Both lines must be ordered along the parallel axis (as produced by walking forward along an edge), which allows each line to be traversed only once in total: O(n+m) rather than rescanning the other line for every target vertex.
+
+    For each target vertex, the new neighbours are:
+        - the vertex of the other line that is aligned with it, if any. When there are two (i.e. the end of one side and the start of the next, with no margin between them), the one whose tile lies on the same side of the target as its own tile is preferred; otherwise
+        - the last vertex before it and the first vertex after it along the parallel axis.
+    If either of the latter is missing but the target previously had two neighbours, the missing one is kept from its old neighbours.
+
+    This is symmetrical, so the same function is used for the exterior->interior and interior->exterior directions.
+    :param targets: the vertices whose neighbours are being replaced.
+    :param others: the vertices on the line faced by the targets.
+    :param facing_direction: the direction from targets toward others.
+    :return: None
+    """
+    parallel_axis = facing_direction.axis.perpendicular
+    forward_parallel_direction = parallel_axis.directions[-1]
+
+    other_index = 0
+    for each_target in targets:
+        target_position = each_target.location[parallel_axis]
+
+        # everything the previous target skipped past is also before this one, since both lines are ordered.
+        while other_index < len(others) and others[other_index].location[parallel_axis] < target_position:
+            other_index += 1
+
+        candidate_neighbours: list[Vertex]
+        if other_index < len(others) and others[other_index].location[parallel_axis] == target_position:
+            aligned_index = other_index
+            if forward_parallel_direction not in each_target.role and aligned_index + 1 < len(others) and others[aligned_index + 1].location[parallel_axis] == target_position:
+                aligned_index += 1
+            candidate_neighbours = [others[aligned_index]]
+        else:
+            candidate_neighbours = [
+                others[other_index - 1] if other_index > 0 else None,
+                others[other_index] if other_index < len(others) else None
+            ]
+            old_neighbours = each_target.neighbours[facing_direction]
+            if len(old_neighbours) == 2:
+                candidate_neighbours = [each_new if each_new is not None else each_old for (each_new, each_old) in zip(candidate_neighbours, old_neighbours)]
+        assert None not in candidate_neighbours
+
+        each_target.neighbours[facing_direction] = candidate_neighbours
 
 def repair_connections_along_perpendicular_axis(perpendicular_axis: Axis, exterior_negative_edge: Edge, interior_negative_edge: Edge, exterior_positive_edge: Edge, interior_positive_edge: Edge):
     """
@@ -69,6 +129,7 @@ def repair_connections_along_perpendicular_axis(perpendicular_axis: Axis, exteri
     forward_parallel_direction: CardinalDirection = parallel_axis.directions[-1]
 
 
+    touched: list[Vertex] = []
     for (each_outward_direction, each_exterior_edge, each_interior_edge) in zip(perpendicular_axis.directions, (exterior_negative_edge, exterior_positive_edge), (interior_negative_edge, interior_positive_edge)):
         each_outward_direction: CardinalDirection
         each_exterior_edge: Edge
@@ -82,6 +143,8 @@ def repair_connections_along_perpendicular_axis(perpendicular_axis: Axis, exteri
             cur_interior_part = next_neighbours[0]
             interior_parts.append(cur_interior_part)
 
+        touched.extend(interior_parts)
+
         assert not interior_parts[0].is_sentinel
         assert not interior_parts[-1].is_sentinel
 
@@ -108,6 +171,7 @@ def repair_connections_along_perpendicular_axis(perpendicular_axis: Axis, exteri
 
             for each_internal_vertex in interior_parts[start_index:end_index]:
                 each_internal_vertex.neighbours[each_outward_direction] = list(each_exterior_edge)
+            touched.extend(each_exterior_edge)
 
         else:
             #normal case
@@ -115,12 +179,12 @@ def repair_connections_along_perpendicular_axis(perpendicular_axis: Axis, exteri
             if are_aligned(each_exterior_edge.a, each_interior_edge.a, parallel_axis):
                 each_exterior_edge.a.neighbours[each_outward_direction.opposite] = [each_interior_edge.a]
             elif each_interior_edge.a.location[perpendicular_axis] < each_exterior_edge.a.neighbours[each_outward_direction.opposite][-1].location[perpendicular_axis]:
-                each_exterior_edge.a.neighbours[each_outward_direction.opposite][-1] = each_interior_edge.a
+                each_exterior_edge.a.neighbours.replace(each_outward_direction.opposite, -1, each_interior_edge.a)
 
             if are_aligned(each_exterior_edge.b, each_interior_edge.b, parallel_axis):
                 each_exterior_edge.b.neighbours[each_outward_direction.opposite] = [each_interior_edge.b]
             elif each_interior_edge.b.location[perpendicular_axis] > each_exterior_edge.b.neighbours[each_outward_direction.opposite][0].location[perpendicular_axis]:
-                each_exterior_edge.b.neighbours[each_outward_direction.opposite][0] = each_interior_edge.b
+                each_exterior_edge.b.neighbours.replace(each_outward_direction.opposite, 0, each_interior_edge.b)
 
             cur_exterior_part = each_exterior_edge.a
             exterior_parts = [cur_exterior_part]
@@ -130,88 +194,23 @@ def repair_connections_along_perpendicular_axis(perpendicular_axis: Axis, exteri
                 cur_exterior_part = next_neighbours[0]
                 exterior_parts.append(cur_exterior_part)
 
-            # todo: make the following loops more efficient
-            # this currently scans the opposite side once for every node on the cuurrent side, which may be inefficient/unneccesary
-            # one possible solution could be using an initial test to decide whether to go forward or backward through the opposing list, before looping in that direction.
-            # although, and this may need to very verified or tested, in the case that the decision is to go backwards, we could perhaps just copy the neighbours given to the previous node without actually moving!
-
-            # todo: write a symmetrical version that can be used for both (the external usage will need to supply the corresponding slice of the external parts)
-
-            internal_index = 0
-
-            for external_index in range(1, len(exterior_parts)-1):
-                each_exterior_vertex = exterior_parts[external_index]
-                old_neighbours = each_exterior_vertex.neighbours[each_outward_direction.opposite]
-                candidate_neighbours = [None, None]
-
-                internal_index = 0
-                while internal_index < len(interior_parts):
-                    each_interior_vertex = interior_parts[internal_index]
-                    if are_aligned(each_exterior_vertex, each_interior_vertex, parallel_axis):
-                        candidate_neighbours = [each_interior_vertex]
-                        break
-                    if (
-                            each_exterior_vertex.location[parallel_axis] > each_interior_vertex.location[parallel_axis]
-                                and not
-                            each_exterior_vertex.location[parallel_axis] >= interior_parts[internal_index + 1].location[parallel_axis]
-                    ):
-                        #we want the LAST node less than us to be our 'left'
-                        candidate_neighbours[0] = each_interior_vertex
-                    elif each_exterior_vertex.location[parallel_axis] < each_interior_vertex.location[parallel_axis]:
-                        #we want the FIRST node greater than us to be on our 'right'
-                        candidate_neighbours[-1] = each_interior_vertex
-                        break
-
-
-                    internal_index += 1
-
-                if len(candidate_neighbours) > 1 and len(old_neighbours) == 2:
-                    candidate_neighbours = [each_new if each_new is not None else each_old for (each_new, each_old) in zip(candidate_neighbours, old_neighbours)]
-                assert None not in candidate_neighbours
-
-                each_exterior_vertex.neighbours[each_outward_direction.opposite] = candidate_neighbours
-
-            external_index = 0
-            for internal_index in range(len(interior_parts)):
-                each_interior_vertex = interior_parts[internal_index]
-                old_neighbours = interior_parts[internal_index].neighbours[each_outward_direction]
-                candidate_neighbours = [None, None]
-
-                external_index = 0
-                while external_index < len(exterior_parts):
-                    each_exterior_vertex = exterior_parts[external_index]
-                    if are_aligned(each_interior_vertex, each_exterior_vertex, parallel_axis):
-                        # we want the LAST node this is greater than to be our 'left'
-                        candidate_neighbours = [each_exterior_vertex]
-                        break
-                    elif (
-                            each_interior_vertex.location[parallel_axis] > each_exterior_vertex.location[parallel_axis]
-                                and not
-                            each_interior_vertex.location[parallel_axis] >= exterior_parts[external_index + 1].location[parallel_axis]
-                    ):
-                        # we want the LAST node less than us to be our 'left'
-                        candidate_neighbours[0] = each_exterior_vertex
-                    elif each_interior_vertex.location[parallel_axis] < each_exterior_vertex.location[parallel_axis]:
-                        # we want the FIRST node greater than us to be on our 'right'
-                        candidate_neighbours[-1] = each_exterior_vertex
-                        break
-
-                    external_index += 1
-
-                if len(candidate_neighbours) > 1 and len(old_neighbours) == 2:
-                    candidate_neighbours = [each_new if each_new is not None else each_old for (each_new, each_old) in zip(candidate_neighbours, old_neighbours)]
-                assert None not in candidate_neighbours
-
-                each_interior_vertex.neighbours[each_outward_direction] = candidate_neighbours
+            connect_facing_vertex_lines(exterior_parts[1:-1], interior_parts, each_outward_direction.opposite)
+            connect_facing_vertex_lines(interior_parts, exterior_parts, each_outward_direction)
+            touched.extend(exterior_parts)
+
+    touch_owners(touched)
 
 def fill_canvas_with_new_window(manager: GeometricTileManager, target: Canvas) -> Window:
     """
-    Note: although most procedures for creating Windows can technically succeed but return results that show problems (constraint violations), this procedure throws a ValueError if the canvas is already divided (has Windows inside).
+    Note: although most procedures for creating Windows can technically succeed but return results that show problems (constraint violations), this procedure throws a ValueError if the canvas is already divided (has Windows inside), including while it hibernates with windows packed away (see TileRegistry.hibernate).
         It is intended to be used as part of a broader procedure that handles these errors.
     :param graphMgr:
     :param target:
     :return:
     """
+    #the sides of a hibernating canvas are linked as if it were empty, so it is rehydrated before anything is linked to them.
+    if target in manager.graph.hibernating:
+        manager.graph.rehydrate(target)
     if is_divided(target):
         raise ValueError(f"Canvas {target.generate_tag()} is not empty.")
     else:
@@ -220,36 +219,225 @@ def fill_canvas_with_new_window(manager: GeometricTileManager, target: Canvas) -
             for each_dir in each_result_corner.role:
                 each_result_corner.neighbours[each_dir] = [each_target_corner]
                 each_target_corner.neighbours[each_dir.opposite] = [each_result_corner]
+        manager.graph.place_window(result, target)
+        target.touch()
 
         return result
 
+class _FacingLines:
+    """
+    Index of the sides of a set of windows which face one direction, grouped into lines by their coordinate along that direction's axis, for use by fill_canvas_with_layout.
+
+    Each line holds the corners of its sides in order along the perpendicular axis, as well as the spans of the sides themselves. Since windows do not overlap, the sides on a line do not overlap either, so both the corners and the spans are sorted and can be searched by bisection.
+    """
+    __slots__ = ('axis', 'coordinates', 'positions', 'vertices', 'starts', 'ends')
+
+    axis: Axis
+    coordinates: Sequence[int]
+    positions: MutableMapping[int, MutableSequence[int]]
+    vertices: MutableMapping[int, MutableSequence[Vertex]]
+    starts: MutableMapping[int, MutableSequence[int]]
+    ends: MutableMapping[int, MutableSequence[int]]
+
+    def __init__(self, windows: Sequence[Window], direction: CardinalDirection):
+        self.axis = direction.axis
+        perpendicular_axis = direction.axis.perpendicular
+        (self.positions, self.vertices, self.starts, self.ends) = ({}, {}, {}, {})
+
+        sides = sorted(
+            (each_window.sides[direction] for each_window in windows),
+            key=lambda each_side: (each_side.a.location[self.axis], each_side.a.location[perpendicular_axis])
+        )
+        for each_side in sides:
+            (a_location, b_location) = (each_side.a.location, each_side.b.location)
+            each_coordinate = a_location[self.axis]
+            if each_coordinate not in self.positions:
+                (self.positions[each_coordinate], self.vertices[each_coordinate], self.starts[each_coordinate], self.ends[each_coordinate]) = ([], [], [], [])
+            self.positions[each_coordinate] += (a_location[perpendicular_axis], b_location[perpendicular_axis])
+            self.vertices[each_coordinate] += each_side
+            self.starts[each_coordinate].append(a_location[perpendicular_axis])
+            self.ends[each_coordinate].append(b_location[perpendicular_axis])
+        self.coordinates = list(self.positions)
+
+    def overlaps(self, coordinate: int, start: int, end: int) -> bool:
+        """
+        :return: whether any side on the line at the coordinate overlaps the open span (start, end).
+        """
+        ends = self.ends[coordinate]
+        index = bisect_right(ends, start)
+        return index < len(ends) and self.starts[coordinate][index] < end
+
+    def nearest(self, coordinate: int, start: int, end: int, is_positive: bool) -> Optional[int]:
+        """
+        :return: the coordinate of the first line at or beyond the given coordinate (in the positive or negative direction) with a side overlapping the open span (start, end), if any.
+        """
+        if is_positive:
+            candidates = range(bisect_left(self.coordinates, coordinate), len(self.coordinates))
+        else:
+            candidates = range(bisect_right(self.coordinates, coordinate) - 1, -1, -1)
+        for each_index in candidates:
+            if self.overlaps(self.coordinates[each_index], start, end):
+                return self.coordinates[each_index]
+        return None
+
+
+def facing_neighbours(position: int, positions: Sequence[int], vertices: Sequence[Vertex], extends_forward: bool) -> Sequence[Vertex]:
+    """
+    Finds the neighbours of a vertex on an ordered line of vertices that it faces: the one aligned with it, or otherwise the last one before it and the first one after it.
+    This is the same rule used by connect_facing_vertex_lines, for a single vertex.
+    :param position: the location of the vertex along the line.
+    :param positions: the locations of the vertices on the line, in ascending order.
+    :param vertices:
+    :param extends_forward: whether the tile of the vertex lies forward of it along the line, which decides between two aligned vertices.
+    :return:
+    """
+    index = bisect_left(positions, position)
+    if index < len(positions) and positions[index] == position:
+        if extends_forward and index + 1 < len(positions) and positions[index + 1] == position:
+            index += 1
+        return [vertices[index]]
+    assert 0 < index < len(positions)
+    return [vertices[index - 1], vertices[index]]
+
+
+def fill_canvas_with_layout(manager: GeometricTileManager, target: Canvas, rectangles: Sequence[tuple[Vector, Vector]]) -> tuple[Sequence[Window], Sequence[StateProblem]]:
+    """
+    Creates a whole layout of windows in an empty canvas at once, e.g. to restore a session, rather than by filling and then repeatedly splitting it (which repairs the connections incrementally after every split).
+
+    The rectangles must not overlap and must tile the canvas, with the configured margins between them, as they would if they had been created by splitting.
+    Neighbours are assigned by the same rules that the incremental procedures maintain: each corner faces the nearest line of opposing sides beyond it (or the side of the canvas), and is connected to the vertex it is aligned with on that line or otherwise the vertices on either side of it.
+    This is done with one sorted index of lines per direction, so the whole layout is connected in O(n log n) time.
+
+    Like fill_canvas_with_new_window, this throws a ValueError if the canvas is already divided.
+    :param manager:
+    :param target:
+    :param rectangles: the (position, size) of each window, as accepted by TileRegistry.create_tile.
+    :return: The created windows in the same order as the rectangles, and the problems found by validating them and the canvas.
+    """
+    #the sides of a hibernating canvas are linked as if it were empty, so it is rehydrated before anything is linked to them.
+    if target in manager.graph.hibernating:
+        manager.graph.rehydrate(target)
+    if is_divided(target):
+        raise ValueError(f"Canvas {target.generate_tag()} is not empty.")
+
+    result = [manager.graph.create_tile(Window, position, size) for (position, size) in rectangles]
+    for each_window in result:
+        manager.graph.place_window(each_window, target)
+
+    #lines of sides indexed by the direction that they are faced from, e.g. windows look east towards the west sides of other windows.
+    facing_lines = {each_direction: _FacingLines(result, each_direction.opposite) for each_direction in CardinalDirection}
+
+    for each_direction in CardinalDirection:
+        axis = each_direction.axis
+        perpendicular_axis = axis.perpendicular
+        lines = facing_lines[each_direction]
+        canvas_side = target.sides[each_direction]
+        canvas_coordinate = canvas_side.a.location[axis]
+        canvas_positions = [each.location[perpendicular_axis] for each in canvas_side]
+
+        for each_window in result:
+            each_side = each_window.sides[each_direction]
+            (each_start, each_end) = (each.location[perpendicular_axis] for each in each_side)
+            each_coordinate = each_side.a.location[axis]
+
+            if each_coordinate == canvas_coordinate:
+                (positions, vertices) = (canvas_positions, canvas_side)
+            else:
+                facing_coordinate = lines.nearest(each_coordinate, each_start, each_end, each_direction.is_positive)
+                if facing_coordinate is None:
+                    raise ValueError(f"Window {each_window.generate_tag()} has no neighbours to the {each_direction} within canvas {target.generate_tag()}.")
+                (positions, vertices) = (lines.positions[facing_coordinate], lines.vertices[facing_coordinate])
+
+            for (each_corner, each_position, each_extends_forward) in zip(each_side, (each_start, each_end), (True, False)):
+                each_corner.neighbours[each_direction] = facing_neighbours(each_position, positions, vertices, each_extends_forward)
+
+        #the canvas corners on the opposite side look inward, toward the windows along this side of the canvas.
+        inward_direction = each_direction.opposite
+        if canvas_coordinate not in facing_lines[inward_direction].positions:
+            raise ValueError(f"No windows lie along the {each_direction} side of canvas {target.generate_tag()}.")
+        inward_line = (facing_lines[inward_direction].positions[canvas_coordinate], facing_lines[inward_direction].vertices[canvas_coordinate])
+        for each_corner in canvas_side:
+            each_corner.neighbours[inward_direction] = facing_neighbours(each_corner.location[perpendicular_axis], *inward_line, each_corner is canvas_side.a)
+
+    target.touch()
+
+    problems = list(validate(target))
+    for each_window in result:
+        problems += validate(each_window)
+
+    return (result, problems)
+
+def allocate_segments(space: int, count: int, margin: int) -> tuple[Sequence[tuple[int, int]], bool]:
+    """
+    Divides a span of space into a row of equally sized segments separated by margins, exactly filling it.
+        - The desired outer dimensions are always met exactly, with the integer residual of the division given one unit at a time to the first (i.e. left-most/top-most) segments.
+        - If there is not enough space for every segment to be at least 1 unit with full margins between them, each segment is given 1 unit and the remainder is divided between the margins in the same way.
+        - If there is not enough space for even that, every segment occupies the whole space.
+    :param space: the distance between the start of the first segment and the end of the last.
+    :param count: the number of segments.
+    :param margin: the desired distance between consecutive segments.
+    :return: the (start, end) offsets of each segment from the start of the space, in order, and whether the margins could be allocated in full.
+    """
+    if space < count:
+        return ([(0, space)] * count, False)
+
+    sizes: Sequence[int]
+    gaps: Sequence[int]
+    available_space = space - (count - 1) * margin
+    if available_space < count:
+        (sizes, gaps) = ([1] * count, exact_shares(space - count, count - 1))
+    else:
+        (sizes, gaps) = (exact_shares(available_space, count), [margin] * (count - 1))
+
+    result = []
+    position = 0
+    for (each_size, each_gap) in zip(sizes, (*gaps, 0)):
+        result.append((position, position + each_size))
+        position += each_size + each_gap
+    return (result, available_space >= count)
+
+def exact_shares(total: int, count: int) -> Sequence[int]:
+    """
+    :return: count integers which sum to the total and differ by at most 1, with the larger ones first.
+    """
+    if count == 0:
+        return []
+    (base_size, remainder) = divmod(total, count)
+    return [base_size + 1] * remainder + [base_size] * (count - remainder)
+
 def split_window_with_new_window(manager: GeometricTileManager, target_tile: Window, target_direction: CardinalDirection) -> tuple[Window, Sequence[StateProblem]]:
     """
     This implementation splits a specific side, but user-facing behaviour is intended to use configurations to allow default splitting direction (and, for example, to make room within a containing resizable box).
-        This calculation will probably be extracted to a common space later, but for now note that available space allocated as follows:
-        - The desired outer dimensions of the requested resizable box are always met exactly, with residuals distributed as fairly as possible (preferencing smaller contents)
-        - First: Starting from the split origin and its immediate adjacent margins (or top/left if no origin is given) and then from both of the the outside of the supposed resizable box inward: each window is given at least 1px and each margin is given full allocation until no space
-        - The remaining space is allocated by scaling the contents to fit it, rounded down, and with any modulo remainder allocated to smallest segments first, or otherwise left-to-right/top-to-bottom.
+        The old window is split in half along the parallel axis, as allocated by allocate_segments. See split_window_with_new_windows, of which this is the special case for a single new window.
     :param target_tile:
     :param target_direction: The side on which the new window will be created. The old window will be split in half along the parallel axis and the new window will be placed on this side of the old one.
     :return: The created window, and a list of state problems (violated constraints on minimum sizes or margins)
     """
+    (result, problems) = split_window_with_new_windows(manager, target_tile, target_direction, 1)
+    return (result[0], problems)
 
-    #todo: deal with minima, for now just evenly split allocating excess to the new container, minimum viable product and all.
+def split_window_with_new_windows(manager: GeometricTileManager, target_tile: Window, target_direction: CardinalDirection, count: int) -> tuple[Sequence[Window], Sequence[StateProblem]]:
+    """
+    Splits a window into a row of count + 1 equally sized windows along the axis of the target direction in a single pass, e.g. to open a whole row or column of a grid at once.
 
-    ##start by recording the relevant neighbours along the split axis and the cross axis.
+    Unlike splitting repeatedly (which halves the space each time, and repairs the connections along the whole perpendicular boundary after every split), the space for all windows and the margins between them is allocated at once (see allocate_segments) and the perpendicular connections are repaired once for the whole row, so this is O(count + boundary) rather than O(count * boundary).
+    :param manager:
+    :param target_tile:
+    :param target_direction: The side on which the new windows will be created. The old window keeps the segment at the opposite end of the row.
+    :param count: The number of new windows to create.
+    :return: The created windows in order moving away from the old window, and a list of state problems (violated constraints on minimum sizes or margins)
+    """
+    if count < 1:
+        raise ValueError(f"Cannot split window {target_tile.generate_tag()} into {count + 1} windows.")
 
-    #aligned neighbours may be multiple per vertex but the cross neighbours are always exactly one)
-    # i.e. aligned_neighbour[i] = pair[list[Vertex]], cross_neighbours_x = pair[Vertex]
-    # more specifically, aligned neighbours are the vertices on either side of where the new tile was injected, including the tile that was split and its neighbours on the split side.
-    parallel_neighbours: tuple[tuple[Sequence[Vertex], Sequence[Vertex]], tuple[Sequence[Vertex], Sequence[Vertex]]]
-    parallel_neighbours = (
-            tuple(list([each_vertex] for each_vertex in target_tile.sides[target_direction])),
-            tuple(list(list(each_vertex.neighbours[target_direction]) for each_vertex in target_tile.sides[target_direction]))
-        )
-    if not target_direction.is_positive:
-        parallel_neighbours = (parallel_neighbours[1], parallel_neighbours[0])
+    canvas = manager.graph.canvas_of(target_tile)
+
+    #the only minimum size is 1 unit per window (no minimum window size is configured), which allocate_segments enforces before the margins, reporting the margins it could not meet as a problem.
 
+    ##start by recording the relevant neighbours along the split axis and the cross axis.
+
+    #The neighbours beyond the split side of the target, which will become the neighbours of the last new window.
+    outer_neighbours: tuple[Sequence[Vertex], Sequence[Vertex]] = tuple(list(each_vertex.neighbours[target_direction]) for each_vertex in target_tile.sides[target_direction])
 
     #These are the outermost neighbours on the sides to the split direction.
     # E.g. if the split was west or east, the negative start/end would be the west-most/east-most neighbour vertices of the northWest/northWest corners of the box that will be modified (in this case, a window), and the positive start/end are the corresponding vertices to the south.
@@ -260,87 +448,66 @@ def split_window_with_new_window(manager: GeometricTileManager, target_tile: Win
         for each_perpendicular_direction in target_direction.axis.perpendicular.directions
     ]
 
-    ##now make space for the new box and create it, before calling the function that correct
-    #note: in a resizable box this may need to be sorted?
-    old_target_edge: Edge = target_tile.sides[target_direction]
-    old_opposite_edge: Edge = target_tile.sides[target_direction.opposite]
-    start_edge: Edge
-    end_edge: Edge
-    result: Window
-    (start_edge, end_edge) = [target_tile.sides[each] for each in target_direction.axis.directions]
-
-    available_space = Edge(start_edge.a, end_edge.a).distance()
-
-    num_segments = 2
+    ##now make space for the new boxes and create them, before calling the functions that correct the connections.
+    (negative_direction, positive_direction) = target_direction.axis.directions
+    start_edge: Edge = target_tile.sides[negative_direction]
+    end_edge: Edge = target_tile.sides[positive_direction]
+    start_locations = [each.location for each in start_edge]
+    unit_vector = positive_direction.unit_vector
 
     problems = []
 
-    if available_space < num_segments:
-        # outcome: the windows just all occupy the full available space instead of allocating them in any particular way; This will not break relative neighbouring since each node is connected to the first/last node to be on either side of it as needed.
-
-        problems.append(BoxTooSmallForMarginsProblem(target_tile))
-
-        result = manager.graph.create_tile(Window, {each.role: each.location for each in target_tile.corners})
-
-    elif available_space < (num_segments + manager.settings.static_config.constraints.window_margin):
-        #outcome: the windows occupy singular pixels at the the ends of the space, and any remainder is margin.
-        #but more generally: this where we would allocate margins and spaces individually as needed and result a problem like "toosmallformargins"
-
+    (segments, fits) = allocate_segments(Edge(start_edge.a, end_edge.a).distance(), count + 1, manager.settings.static_config.constraints.window_margin)
+    if not fits:
         problems.append(BoxTooSmallForMarginsProblem(target_tile))
 
-        result = manager.graph.create_tile(Window, {
-            old_target_edge.a.role: old_target_edge.a.location,
-            old_target_edge.b.role: old_target_edge.b.location,
-            old_opposite_edge.a.role: old_target_edge.a.location - target_direction.unit_vector,
-            old_opposite_edge.b.role: old_target_edge.b.location - target_direction.unit_vector,
-        })
-
-        #update old location
-        old_target_edge.a.location = old_opposite_edge.a.location + target_direction.unit_vector
-        old_target_edge.b.location = old_opposite_edge.b.location + target_direction.unit_vector
+    #the old window keeps the segment at the opposite end of the row from the split side.
+    if target_direction.is_positive:
+        (target_segment, new_segments) = (segments[0], segments[1:])
     else:
-        #outcome: this is where we allocate margins first and then consider minimum sizes for the remainder.
-
-        available_space -= manager.settings.static_config.constraints.window_margin
-
-        base_size = available_space//2
-        remainder = available_space % 2
+        (target_segment, new_segments) = (segments[-1], segments[-2::-1])
 
+    result: Sequence[Window] = [
+        manager.graph.create_tile(Window, {
+            **{each_corner.role: each_location + unit_vector * each_start for (each_corner, each_location) in zip(start_edge, start_locations)},
+            **{each_corner.role: each_location + unit_vector * each_end for (each_corner, each_location) in zip(end_edge, start_locations)},
+        })
+        for (each_start, each_end) in new_segments
+    ]
+    if canvas is not None:
+        for each_window in result:
+            manager.graph.place_window(each_window, canvas)
+
+    #update old locations
+    for (each_edge, each_offset) in zip((start_edge, end_edge), target_segment):
+        for (each_corner, each_location) in zip(each_edge, start_locations):
+            each_corner.location = each_location + unit_vector * each_offset
+
+    manager.graph.reindex_tile(target_tile)
+    target_tile.touch()
+
+    #connect each new window to the previous window in the row and, for now, to the outer neighbours. The latter are replaced by the next window in the row, if any.
+    previous = target_tile
+    for each_window in result:
+        inner_neighbours = tuple([each_vertex] for each_vertex in previous.sides[target_direction])
         if target_direction.is_positive:
-            old_size_vector = target_direction.unit_vector * (base_size + remainder)
-            new_size_vector = target_direction.unit_vector * base_size
+            establish_connections_along_injection_axis(each_window, target_direction.axis, inner_neighbours, outer_neighbours)
         else:
-            old_size_vector = target_direction.unit_vector * base_size
-            new_size_vector = target_direction.unit_vector * (base_size + remainder)
-
-        result = manager.graph.create_tile(Window, {
-            old_target_edge.a.role: old_target_edge.a.location,
-            old_target_edge.b.role: old_target_edge.b.location,
-            old_opposite_edge.a.role: old_target_edge.a.location - new_size_vector,
-            old_opposite_edge.b.role: old_target_edge.b.location - new_size_vector,
-        })
-
-        #update old locations
-        old_target_edge.a.location = old_opposite_edge.a.location + old_size_vector
-        old_target_edge.b.location = old_opposite_edge.b.location + old_size_vector
-
-    establish_connections_along_injection_axis(result, target_direction.axis, *parallel_neighbours)
+            establish_connections_along_injection_axis(each_window, target_direction.axis, outer_neighbours, inner_neighbours)
+        previous = each_window
 
 
     #Now deal with cross axis connections.
-    #to do this, we need to determine the interior start/ends. Whilst the exterior includes neighbours past the boundaries of the modified box, the interior start/ends are the vertices that define the boundaries of the new box (in this case, the outer corners of the box enclosing the region covered by the ld and new windows.
+    #to do this, we need to determine the interior start/ends. Whilst the exterior includes neighbours past the boundaries of the modified box, the interior start/ends are the vertices that define the boundaries of the new box (in this case, the outer corners of the box enclosing the region covered by the old and new windows.
+    (first_window, last_window) = (target_tile, result[-1]) if target_direction.is_positive else (result[-1], target_tile)
     negative_perpendicular_interior_edge: Edge
     positive_perpendicular_interior_edge: Edge
-
     (negative_perpendicular_interior_edge, positive_perpendicular_interior_edge) = [
-        Edge(target_tile.sides[each_perpendicular_direction].a, result.sides[each_perpendicular_direction].b)
-        for each_perpendicular_direction in target_direction.axis.perpendicular.directions
-    ] if target_direction.is_positive else [
-        Edge(result.sides[each_perpendicular_direction].a, target_tile.sides[each_perpendicular_direction].b)
+        Edge(first_window.sides[each_perpendicular_direction].a, last_window.sides[each_perpendicular_direction].b)
         for each_perpendicular_direction in target_direction.axis.perpendicular.directions
     ]
 
     repair_connections_along_perpendicular_axis(target_direction.axis.perpendicular, negative_perpendicular_exterior_edge, negative_perpendicular_interior_edge, positive_perpendicular_exterior_edge, positive_perpendicular_interior_edge)
 
 
-    return (result, problems)
\ No newline at end of file
+    return (result, problems)
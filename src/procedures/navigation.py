@@ -1,10 +1,10 @@
-from typing import Optional
+from typing import Iterable, MutableSequence, Optional
 
 from geometry.graph.canvas import Canvas
 from procedures.examination import is_divided
-from geometry import CardinalDirection
+from geometry.direction.cardinal import CardinalDirection
 from geometry.graph.neighbourhood import InteriorCanvasNeighbourhood
-from geometry import Tile
+from geometry.graph.tile import Tile
 from manager import GeometricTileManager
 
 """
@@ -15,14 +15,10 @@ def next_tile(manager: GeometricTileManager, initial: Tile, direction: CardinalD
     """
     When multiple options are available, option furthest towards the top-left/bottom-right corner will be taken, depend on which corner the input direction faces.
     - This maximises the likelihood that reversing a navigation will reach the previous Tile.
-    """
-
-    candidates = manager.settings.static_config.navigation.tile_neighbourhood(initial)[direction]
 
-    if len(candidates) == 0:
-        return None
-    else:
-        return manager.settings.static_config.navigation.tiebreaker(candidates)
+    Neighbourhoods are cached on the tiles themselves, so repeated navigation without intervening manipulations does not walk the graph again.
+    """
+    return _next_tile(manager, initial, direction, [])
 
 
 def next_undivided_tile(manager: GeometricTileManager, initial: Tile, direction: CardinalDirection) -> Optional[Tile]:
@@ -33,22 +29,93 @@ def next_undivided_tile(manager: GeometricTileManager, initial: Tile, direction:
     When multiple options are available, option furthest towards the top-left/bottom-right corner will be taken, depend on which corner the input direction faces.
     -This maximises the likelihood that reversing a navigation will reach the previous Tile.
     """
-    result = next_tile(manager, initial, direction)
+    return _next_undivided_tile(manager, initial, direction, [])
+
+
+def _next_tile(manager: GeometricTileManager, initial: Tile, direction: CardinalDirection, dependencies: MutableSequence[Tile]) -> Optional[Tile]:
+    """
+    Implements next_tile, additionally recording every tile whose vertices were read in order to find the result.
+    """
+    candidates = manager.settings.static_config.navigation.tile_neighbourhood(initial)[direction]
+    dependencies.append(initial)
+    dependencies.extend(candidates)
+
+    if len(candidates) == 0:
+        return None
+    result = manager.settings.static_config.navigation.tiebreaker(direction, candidates)
+    #a canvas found by walking along its sides (e.g. from a linked canvas) may be hibernating, so its windows must be rebuilt before navigating into it.
+    if result in manager.graph.hibernating:
+        manager.graph.rehydrate(result)
+    return result
+
+
+def _next_undivided_tile(manager: GeometricTileManager, initial: Tile, direction: CardinalDirection, dependencies: MutableSequence[Tile]) -> Optional[Tile]:
+    """
+    Implements next_undivided_tile, additionally recording every tile whose vertices were read in order to find the result.
+    """
+    result = _next_tile(manager, initial, direction, dependencies)
 
     if result is None:
         return None
 
     if not initial.is_sentinel and result.is_sentinel:
         #this means we are moving from a Window to find its containing canvas, so we want to skip to the next canvas, if any
-        result = next_tile(manager, result, direction)
+        result = _next_tile(manager, result, direction, dependencies)
 
         if result is None:
             return None
 
     #isinstance actually makes more sense that is_sentinel here
-    if isinstance(result, Canvas) and is_divided(result):
-        candidates = InteriorCanvasNeighbourhood(result)[direction]
-        result = manager.settings.static_config.navigation.tiebreaker(candidates)
+    if isinstance(result, Canvas):
+        dependencies.append(result)
+        if is_divided(result):
+            candidates = InteriorCanvasNeighbourhood(result)[direction]
+            dependencies.extend(candidates)
+            result = manager.settings.static_config.navigation.tiebreaker(direction, candidates)
 
     return result
 
+
+class FocusTable:
+    """
+    A lookup table from (tile, direction) to the result of next_undivided_tile (or next_tile), for latency-critical focus movement such as key-repeat.
+
+    Entries are stored on the tiles themselves (see Tile.derive) along with the generations of every tile that was read to find them. Each manipulation therefore only invalidates the entries of the tiles it touched and of those whose targets depended on them. An invalidated entry still references the tiles it was derived from (including any erased since) until it is next looked up, or its own tile is touched or erased.
+    Invalidated entries are recomputed when they are next looked up, or eagerly via refresh (e.g. for the tiles around a manipulation, before the next keypress arrives).
+    """
+    __slots__ = ('manager', 'undivided')
+
+    manager: GeometricTileManager
+    undivided: bool
+
+    def __init__(self, manager: GeometricTileManager, undivided: bool = True):
+        """
+        :param manager:
+        :param undivided: whether targets follow next_undivided_tile (the default, for focus) or next_tile.
+        """
+        self.manager = manager
+        self.undivided = undivided
+
+    def __getitem__(self, key: tuple[Tile, CardinalDirection]) -> Optional[Tile]:
+        (initial, direction) = key
+        navigation = self.manager.settings.static_config.navigation
+        #the configured options are part of the key, so that changing them cannot return stale targets.
+        return initial.derive((FocusTable, self.undivided, direction, navigation.tile_neighbourhood, navigation.tiebreaker), self._compute, initial, direction)
+
+    def refresh(self, tiles: Iterable[Tile]):
+        """
+        Ensures that the entries for every direction from each of the given tiles are up to date.
+        :param tiles:
+        :return:
+        """
+        for each_tile in tiles:
+            for each_direction in CardinalDirection:
+                self[each_tile, each_direction]
+
+    def _compute(self, initial: Tile, direction: CardinalDirection) -> tuple[Optional[Tile], Iterable[Tile]]:
+        dependencies = []
+        if self.undivided:
+            result = _next_undivided_tile(self.manager, initial, direction, dependencies)
+        else:
+            result = _next_tile(self.manager, initial, direction, dependencies)
+        return (result, dependencies)
@@ -0,0 +1,51 @@
+from typing import Callable, Mapping, NamedTuple, Sequence
+
+from geometry.graph.tile import Tile
+from geometry.vector import Vector
+from manager import GeometricTileManager
+from procedures.examination import validate_around
+from problems.state import StateProblem
+
+
+class Preview(NamedTuple):
+    """
+    The layout that a manipulation would result in, without it having been made (see preview).
+    - result: what the procedure returned.
+    - corners: the locations that the corners of each changed or created tile would have, in the order of DiagonalDirection.
+    - created: the tiles that would have been created. They are not part of the graph, so only their identity and their corners in the preview are meaningful.
+    - problems: the problems that validating the changed tiles would find (see validate_around).
+    """
+    result: object
+    corners: Mapping[Tile, tuple[Vector, Vector, Vector, Vector]]
+    created: Sequence[Tile]
+    problems: Sequence[StateProblem]
+
+
+def preview(manager: GeometricTileManager, procedure: Callable[..., object], *args, **kwargs) -> Preview:
+    """
+    Finds the layout that a manipulation would result in, e.g. to show the result of a split or resize while its target is hovered, before the user commits to it.
+
+    Procedures modify the vertices of the graph in place, so rather than running against a separate copy of the graph, the procedure is run against the graph itself while its journal records the state it overwrites (see Journal).
+    The changed region is then read and the journal rolled back, so this costs time in proportion to the size of the change rather than of the layout. Nothing is notified or recorded in the history of the manager, and the dirty tiles are left as they were. The changed tiles keep their generations and the ids of the created tiles are given back (see Journal.revert), so nothing derived from the graph beforehand (e.g. a FocusTable) is invalidated by previewing.
+    :param manager:
+    :param procedure: called with the manager, followed by args and kwargs, e.g. split_window_with_new_window.
+    :return: the preview.
+    """
+    graph = manager.graph
+    dirty = manager.dirty.stash()
+    graph.journal.begin()
+    try:
+        result = procedure(manager, *args, **kwargs)
+    except BaseException:
+        graph.journal.rollback(graph)
+        manager.dirty.unstash(dirty)
+        raise
+    delta = graph.journal.finish(graph)
+
+    tiles = [each for each in delta.tiles if graph.by_type[each.__class__].get(each.id) is each]
+    corners = {each_tile: tuple(each_corner.location for each_corner in each_tile.corners) for each_tile in tiles}
+    problems = validate_around(manager, tiles)
+
+    graph.journal.revert(graph, delta)
+    manager.dirty.unstash(dirty)
+    return Preview(result, corners, delta.created, problems)
@@ -0,0 +1,422 @@
+from typing import Mapping, MutableSequence, Optional, Sequence
+
+import numpy as np
+
+from geometry.axis import Axis
+from geometry.direction.cardinal import CardinalDirection
+from geometry.direction.diagonal import DiagonalDirection
+from geometry.graph.box import Box
+from geometry.graph.edge import Edge
+from geometry.graph.independent import IndependentBox
+from geometry.graph.segmentation import Segment, SegmentedBox, TileSegment, line_vertices, segment_canvas, segment_region
+from geometry.graph.tile import Tile
+from geometry.graph.vertex import Vertex
+from geometry.graph.window import Window
+from manager import GeometricTileManager
+from problems.box import BoxTooLargeForConstraintsProblem, BoxTooSmallForConstraintsProblem, BoxTooSmallForMarginsProblem
+from problems.state import StateProblem
+from procedures.manipulation import allocate_segments, connect_facing_vertex_lines, repair_connections_along_perpendicular_axis, touch_owners
+from procedures.selection import find_parallel_end
+
+
+def scale_sizes(total: int, weights: np.ndarray) -> np.ndarray:
+    """
+    Divides a total into integers proportional to the given weights, such that they sum to the total exactly.
+    Each share is rounded down, then the remainder is given one unit at a time to the shares with the largest fractional parts, preferring smaller weights and then earlier shares when tied.
+    :param total: must not be negative.
+    :param weights: if they are all zero, the total is divided evenly instead.
+    :return:
+    """
+    weights = weights.astype(np.int64)
+    weight_total = int(weights.sum())
+    if weight_total == 0:
+        (weights, weight_total) = (np.ones_like(weights), len(weights))
+    (result, fractions) = np.divmod(weights * total, weight_total)
+    remainder = total - int(result.sum())
+    if remainder > 0:
+        order = np.lexsort((np.arange(len(weights)), weights, -fractions))
+        result[order[:remainder]] += 1
+    return result
+
+
+class _Group:
+    """
+    The segments of a SegmentedBox that is segmented along the axis of a ResizePlan, which are allocated space together.
+    """
+    __slots__ = ('box', 'parent', 'first', 'weights')
+
+    box: SegmentedBox
+    parent: int
+    first: int
+    weights: np.ndarray
+
+    def __init__(self, box: SegmentedBox, parent: int, first: int, weights: np.ndarray):
+        self.box = box
+        self.parent = parent
+        self.first = first
+        self.weights = weights
+
+
+class ResizePlan:
+    """
+    Resizes the segments of a SegmentedBox along its segmentation axis, scaling all other segments (recursively) to fill the remaining space, as described in the README.
+
+    The segment tree is compiled once into flat arrays:
+        - Every SegmentedBox within the tree that is segmented along the same axis is a group of entries, each of which is allocated a span within the span of its parent entry.
+        - Boxes segmented along the perpendicular axis do not divide space along the axis, so their contents take the span of the entry that contains them.
+        - Every tile takes the span of one entry, so the new locations of all of their vertices can be gathered and written back to the coordinate store in a single vectorised pass.
+    Resizing always scales from the sizes at the time the plan was compiled, so that repeated resizes (e.g. whilst dragging) do not accumulate rounding errors, and the box can be restored to those sizes exactly.
+
+    Moving vertices along the axis can change which vertices face each other across the lines parallel to it, so those lines are re-linked afterwards: the sides of the box, and the boundaries between stacked segments within it.
+    """
+    __slots__ = ('manager', 'target', 'axis', '_groups', '_span', '_tiles', '_tile_entries', '_slots', '_initial', '_boundaries', '_exterior_edges')
+
+    manager: GeometricTileManager
+    target: SegmentedBox
+    axis: Axis
+    _groups: Sequence[_Group]
+    _span: tuple[int, int]
+    _tiles: Sequence[Tile]
+    _tile_entries: np.ndarray
+    _slots: np.ndarray
+    _initial: np.ndarray
+    _boundaries: Sequence[tuple[Edge, Edge]]
+    _exterior_edges: tuple[Edge, Edge]
+
+    def __init__(self, manager: GeometricTileManager, target: SegmentedBox):
+        self.manager = manager
+        self.target = target
+        self.axis = target.segmentation_axis
+        self._span = tuple(target.sides[each].a.location[self.axis] for each in self.axis.directions)
+
+        (groups, tiles, tile_entries, boundaries) = ([], [], [], [])
+        entry_count = 0
+        #each item is a segment to compile, and the entry which gives it its span.
+        stack: MutableSequence[tuple[Segment, int]] = [(target, -1)]
+        while len(stack) > 0:
+            (each_segment, each_entry) = stack.pop()
+            if isinstance(each_segment, TileSegment):
+                tiles.append(each_segment.source)
+                tile_entries.append(each_entry)
+            elif each_segment.segmentation_axis is self.axis:
+                groups.append(_Group(each_segment, each_entry, entry_count, np.array([extent(each.source, self.axis) for each in each_segment.segments], dtype=np.int64)))
+                stack += ((each_child, entry_count + index) for (index, each_child) in enumerate(each_segment.segments))
+                entry_count += len(each_segment.segments)
+            else:
+                stack += ((each_child, each_entry) for each_child in each_segment.segments)
+                (negative_direction, positive_direction) = self.axis.perpendicular.directions
+                boundaries += ((previous.source.sides[positive_direction], following.source.sides[negative_direction]) for (previous, following) in zip(each_segment.segments, each_segment.segments[1:]))
+
+        self._groups = groups
+        self._tiles = tiles
+        self._tile_entries = np.array(tile_entries, dtype=np.intp)
+        self._slots = np.array([
+            [each_corner.slot for each_direction in self.axis.directions for each_corner in each_tile.sides[each_direction]]
+            for each_tile in tiles
+        ], dtype=np.intp).reshape(len(tiles), 2, 2)
+        self._initial = manager.graph.coordinates.components(self.axis)[self._slots.reshape(-1)].copy()
+        self._boundaries = boundaries
+
+        #These are the outermost neighbours beyond the sides of the box parallel to the axis, as found by split_window_with_new_windows.
+        self._exterior_edges = tuple(
+            Edge(*(each_corner.neighbours[each_direction][i] for (i, each_corner) in zip((0, -1), target.sides[each_direction])))
+            for each_direction in self.axis.perpendicular.directions
+        )
+
+    def resize(self, sizes: Mapping[int, int]) -> Sequence[StateProblem]:
+        """
+        Moves every vertex within the box so that the given segments have the requested sizes, and the others share the remaining space in proportion to their sizes when the plan was compiled.
+        The outer dimensions of the box and the configured margins between segments are always preserved exactly.
+        :param sizes: the requested size along the axis of each resized segment, by its index in the segments of the target.
+        :return: problems describing any requests or constraints that could not be met, in which case the space is shared as fairly as possible instead.
+        """
+        problems = self.move(sizes)
+        self.relink()
+        return problems
+
+    def move(self, sizes: Mapping[int, int]) -> Sequence[StateProblem]:
+        """
+        Moves the vertices as by resize, without re-linking any vertices that pass one another or re-indexing the locations of the tiles (see TileRegistry.reindex_tile). Both are done by relink, or unnecessary once the move is reverted by restore, either of which must happen before the graph is used by anything else.
+        :param sizes:
+        :return:
+        """
+        margin = self.manager.settings.static_config.constraints.window_margin
+        entry_count = self._groups[-1].first + len(self._groups[-1].weights)
+        (starts, ends) = (np.empty(entry_count, dtype=np.int64), np.empty(entry_count, dtype=np.int64))
+
+        problems = []
+        for each_group in self._groups:
+            (each_start, each_end) = self._span if each_group.parent < 0 else (starts[each_group.parent], ends[each_group.parent])
+            (each_starts, each_ends) = allocate_entries(int(each_end - each_start), each_group.weights, sizes if each_group.parent < 0 else {}, margin, each_group.box.source, problems)
+            starts[each_group.first:each_group.first + len(each_group.weights)] = each_starts + each_start
+            ends[each_group.first:each_group.first + len(each_group.weights)] = each_ends + each_start
+
+        values = np.stack((starts[self._tile_entries], ends[self._tile_entries]), axis=-1)
+        self._assign(np.repeat(values.reshape(-1), 2))
+        return problems
+
+    def restore(self):
+        """
+        Moves every vertex within the box back to where it was when the plan was compiled. Since the links were correct then, they do not need to be repaired afterwards, unless the box has since been re-linked by resize.
+        """
+        self._assign(self._initial)
+        self._reindex()
+
+    def _assign(self, values: np.ndarray):
+        self.manager.graph.coordinates.assign(self._slots.reshape(-1), self.axis, values)
+        for each_tile in self._tiles:
+            each_tile.touch()
+
+    def _reindex(self):
+        for each_tile in self._tiles:
+            self.manager.graph.reindex_tile(each_tile)
+
+    def relink(self):
+        """
+        Re-indexes the tiles after they have moved, then re-links the vertices on each pair of facing lines parallel to the axis.
+        """
+        self._reindex()
+        (negative_direction, positive_direction) = self.axis.perpendicular.directions
+        forward_direction = self.axis.directions[-1]
+
+        touched: list[Vertex] = []
+        for (each_negative_edge, each_positive_edge) in self._boundaries:
+            (negative_parts, positive_parts) = (line_vertices(each_negative_edge, forward_direction), line_vertices(each_positive_edge, forward_direction))
+            connect_facing_vertex_lines(negative_parts, positive_parts, positive_direction)
+            connect_facing_vertex_lines(positive_parts, negative_parts, negative_direction)
+            touched += negative_parts
+            touched += positive_parts
+        touch_owners(touched)
+
+        #the vertices between the corners of the box only move between the corners, so they can only pass other vertices if the box is not bordered by the canvas on either side.
+        if all(each.a.is_sentinel for each in self._exterior_edges):
+            return
+        repair_connections_along_perpendicular_axis(
+            self.axis.perpendicular,
+            self._exterior_edges[0], self.target.sides[negative_direction],
+            self._exterior_edges[1], self.target.sides[positive_direction]
+        )
+
+
+def extent(target: Box, axis: Axis) -> int:
+    """
+    :return: the size of a box along an axis, as a distance between its corners.
+    """
+    return Edge(*(target.sides[each].a for each in axis.directions)).distance()
+
+
+def allocate_entries(space: int, weights: np.ndarray, requested: Mapping[int, int], margin: int, source: Box, problems: MutableSequence[StateProblem]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Allocates a span of space to a row of segments separated by margins, giving the requested segments their requested sizes and scaling the others in proportion to their weights (see scale_sizes).
+    If the requests cannot be met exactly, all segments are scaled in proportion to their requested sizes or weights instead. If the margins cannot be met, the space is allocated as by allocate_segments.
+    :param space: the distance between the start of the first segment and the end of the last.
+    :param weights: the current sizes of the segments.
+    :param requested: the requested sizes of some segments, by index.
+    :param margin:
+    :param source: the box being allocated, for reporting problems.
+    :param problems: any problems are appended to this.
+    :return: the start and end offsets of each segment from the start of the space.
+    """
+    count = len(weights)
+    available_space = space - (count - 1) * margin
+    if available_space < count:
+        problems.append(BoxTooSmallForMarginsProblem(source))
+        segments = np.array(allocate_segments(space, count, margin)[0], dtype=np.int64).reshape(count, 2)
+        return (segments[:, 0], segments[:, 1])
+
+    sizes = weights.copy()
+    if len(requested) > 0:
+        indices = np.fromiter(requested.keys(), dtype=np.intp, count=len(requested))
+        if np.any(np.fromiter(requested.values(), dtype=np.int64, count=len(requested)) < 0):
+            raise ValueError(f"Cannot resize segments of {source.debug_string} to negative sizes.")
+        sizes[indices] = np.fromiter(requested.values(), dtype=np.int64, count=len(requested))
+        is_free = np.ones(count, dtype=bool)
+        is_free[indices] = False
+
+        (free_count, free_space) = (int(is_free.sum()), available_space - int(sizes[~is_free].sum()))
+        if free_space >= free_count and (free_count > 0 or free_space == 0):
+            if free_count > 0:
+                sizes[is_free] = scale_sizes(free_space, weights[is_free])
+        else:
+            problems.append((BoxTooSmallForConstraintsProblem if free_space < free_count else BoxTooLargeForConstraintsProblem)(source))
+            sizes = scale_sizes(available_space, sizes)
+    else:
+        sizes = scale_sizes(available_space, weights)
+
+    if np.any(sizes < 1):
+        problems.append(BoxTooSmallForConstraintsProblem(source))
+
+    ends = np.cumsum(sizes) + np.arange(count, dtype=np.int64) * margin
+    return (ends - sizes, ends)
+
+
+def resize_segments(manager: GeometricTileManager, target: SegmentedBox, sizes: Mapping[int, int]) -> Sequence[StateProblem]:
+    """
+    Resizes the given segments of a box, scaling the rest of its contents to fit. See ResizePlan, which should be kept and reused instead when resizing the same box repeatedly.
+    :param manager:
+    :param target:
+    :param sizes: the requested size along the segmentation axis of each resized segment, by its index in the segments of the target.
+    :return:
+    """
+    return ResizePlan(manager, target).resize(sizes)
+
+
+def minimum_extent(target: Segment, axis: Axis, margin: int) -> int:
+    """
+    Since the contents of a segment are scaled in proportion to their current sizes (see scale_sizes), this is at least the sum of the minimum sizes of its contents, and more if they are not in proportion.
+    :return: the smallest size along an axis that a segment can be resized to, whilst keeping every tile within it at least 1 unit in size and the margins between them.
+    """
+    if isinstance(target, TileSegment):
+        return 1
+    minima = [minimum_extent(each, axis, margin) for each in target.segments]
+    if target.segmentation_axis is not axis:
+        return max(minima)
+    return proportional_minimum(minima, [extent(each.source, axis) for each in target.segments]) + (len(minima) - 1) * margin
+
+
+def proportional_minimum(minima: Sequence[int], weights: Sequence[int]) -> int:
+    """
+    :return: the smallest space that can be divided in proportion to the given weights (see scale_sizes), such that every share is at least its minimum.
+    """
+    total = sum(weights)
+    #rounding down alone never gives a share less than its minimum from this space, so the remainder can only help.
+    return max(-(-each_minimum * total // max(each_weight, 1)) for (each_minimum, each_weight) in zip(minima, weights))
+
+
+class ResizeSession:
+    """
+    Resizes a window interactively by dragging one of its sides, e.g. with the pointer, which may be updated hundreds of times per second.
+
+    - begin selects the region affected by the drag, segments it, and compiles a ResizePlan for it, all exactly once.
+    - update only moves coordinates (see ResizePlan.move), clamping the drag so that every tile keeps a size of at least 1 and the margins between them.
+    - commit re-links the vertices which passed one another during the drag, once. cancel restores the coordinates from when the drag began instead, whose links were never changed.
+
+    Whilst a drag is in progress the links within the region are stale, so nothing else should examine or manipulate it until the session is committed or cancelled.
+    """
+    __slots__ = ('manager', 'target', 'direction', '_plan', '_index', '_initial_size', '_limits')
+
+    manager: GeometricTileManager
+    target: Optional[Window]
+    direction: Optional[CardinalDirection]
+    _plan: Optional[ResizePlan]
+    _index: int
+    _initial_size: int
+    _limits: tuple[int, int]
+
+    def __init__(self, manager: GeometricTileManager):
+        self.manager = manager
+        self.target = None
+        self.direction = None
+        self._plan = None
+
+    @property
+    def is_active(self) -> bool:
+        return self._plan is not None
+
+    def begin(self, target: Edge, axis: Axis):
+        """
+        Starts dragging a side of a window.
+
+        The region is the clean row or column between the opposite side of the window and the far end found by find_parallel_end, so that only the window and those beyond the dragged side are resized.
+        If there is no such row or column, e.g. because the side borders several tiles which must be dragged along with it, the region is instead the smallest box in the segmentation of the canvas (see segment_canvas) which has the side as a boundary between its segments.
+        Throws a ValueError if the side cannot be dragged.
+        :param target: a side of a window.
+        :param axis: the axis along which the side is dragged, i.e. perpendicular to it.
+        :return:
+        """
+        if self.is_active:
+            raise ValueError(f"A drag of {self.target.generate_tag()} is already in progress.")
+        if not target.is_side or target.a.owner.is_sentinel or target.axis is axis:
+            raise ValueError(f"{target.debug_string} is not a side of a window which can be dragged along the {axis} axis.")
+        owner = target.a.owner
+        direction = next(each for each in axis.directions if owner.sides[each] == target)
+
+        far_end = find_parallel_end(self.manager, target, direction)
+        if far_end is not None:
+            (near_end, perpendicular_negative) = (owner.sides[direction.opposite], axis.perpendicular.directions[0])
+            box = IndependentBox(*(
+                (far_end if direction in each_corner else near_end)[0 if perpendicular_negative in each_corner else -1]
+                for each_corner in DiagonalDirection
+            ))
+            region = segment_region(self.manager, box, axis)
+            index = 0 if direction.is_positive else -1
+        else:
+            (region, index) = self._find_boundary(owner, direction)
+
+        self.target = owner
+        self.direction = direction
+        self._plan = ResizePlan(self.manager, region)
+        self._index = index % len(region.segments)
+
+        #the other segments share the remaining space in proportion to their current sizes.
+        margin = self.manager.settings.static_config.constraints.window_margin
+        others = [each for (i, each) in enumerate(region.segments) if i != self._index]
+        self._initial_size = extent(region.segments[self._index].source, axis)
+        self._limits = (
+            minimum_extent(region.segments[self._index], axis, margin),
+            extent(region.source, axis) - len(others) * margin - proportional_minimum([minimum_extent(each, axis, margin) for each in others], [extent(each.source, axis) for each in others])
+        )
+
+    def _find_boundary(self, owner: Window, direction: CardinalDirection) -> tuple[SegmentedBox, int]:
+        """
+        :return: the smallest box in the segmentation of the canvas which has the given side of the window as a boundary between its segments, and the index of the segment on the same side of the boundary as the window.
+        """
+        axis = direction.axis
+        #canvases which only touch the window (e.g. across a shared border) also intersect it, so the canvas it was placed within is used instead.
+        canvas = self.manager.graph.canvas_of(owner)
+        if canvas is None:
+            raise ValueError(f"{owner.generate_tag()} was not placed within a canvas.")
+        coordinate = owner.sides[direction].a.location[axis]
+        (result, current) = (None, segment_canvas(self.manager, canvas, axis))
+        while not isinstance(current, TileSegment):
+            containing = next(i for (i, each) in enumerate(current.segments) if contains(each.source, owner))
+            if current.segmentation_axis is axis:
+                neighbour = containing + (1 if direction.is_positive else -1)
+                if 0 <= neighbour < len(current.segments) and current.segments[containing].source.sides[direction].a.location[axis] == coordinate:
+                    result = (current, containing)
+            current = current.segments[containing]
+        if result is None:
+            raise ValueError(f"The {direction} side of {owner.generate_tag()} borders its canvas.")
+        return result
+
+    def update(self, offset: int) -> Sequence[StateProblem]:
+        """
+        Moves the side to the given offset from where it was when the drag began, as far as is possible.
+        :param offset: along the axis of the drag, positive in the positive direction of the axis.
+        :return: problems describing any constraints within the region that could not be met.
+        """
+        if not self.is_active:
+            raise ValueError("No drag is in progress.")
+        size = self._initial_size + (offset if self.direction.is_positive else -offset)
+        return self._plan.move({self._index: min(max(size, self._limits[0]), self._limits[1])})
+
+    def commit(self):
+        """
+        Finishes the drag, leaving the side where it was last moved to.
+        """
+        if not self.is_active:
+            raise ValueError("No drag is in progress.")
+        self._plan.relink()
+        self._finish()
+
+    def cancel(self):
+        """
+        Finishes the drag, returning every window in the region to where it was when the drag began.
+        """
+        if not self.is_active:
+            raise ValueError("No drag is in progress.")
+        self._plan.restore()
+        self._finish()
+
+    def _finish(self):
+        self.target = None
+        self.direction = None
+        self._plan = None
+
+
+def contains(outer: Box, inner: Box) -> bool:
+    """
+    :return: whether one box lies entirely within another, including along its sides.
+    """
+    (outer_start, outer_end, inner_start, inner_end) = (outer.corners.north_west.location, outer.corners.south_east.location, inner.corners.north_west.location, inner.corners.south_east.location)
+    return all(outer_start[each] <= inner_start[each] and inner_end[each] <= outer_end[each] for each in Axis)
@@ -1,50 +1,77 @@
+import itertools
 from typing import Optional, Sequence
 
 from geometry.direction.cardinal import CardinalDirection
 from geometry.graph.edge import Edge
-from procedures.examination import validate, are_aligned
+from procedures.examination import validate
 from geometry.graph.vertex import Vertex
+from manager import GeometricTileManager
 
 """
 Procedures which determine actionable regions for the purpose of manipulations.
 Not to be confused with the navigation module/file, which is for more basic activities like window focus.
 """
 
-def find_parallel_end(target: Edge, direction: CardinalDirection) -> Optional[Edge]:
+def find_parallel_end(manager: GeometricTileManager, target: Edge, direction: CardinalDirection) -> Optional[Edge]:
     """
     Computes the far end edge parallel to the target edge in the target direction, or None if there is no further edge.
+    The lines perpendicular to the edge through each of its ends are looked up in the alignment index of the graph (see AlignmentIndex), so the cost is a lookup and a scan along each line.
+    :param manager:
     :param target:
     :param direction:
-    :param new_size:
     :return:
     """
-    initial_a, initial_b = target
-
-    #first build stacks that show the furthest reachable nodes from the ends of the edge, along the straight lines perpendicular to the edge.
-    stack_a: list[Vertex] = [initial_a]
-    stack_b: list[Vertex] = [initial_b]
-
-    for each_stack in (stack_a, stack_b):
-        next: Sequence[Vertex] = each_stack[-1].neighbours[direction]
-        while len(next) == 1 and not next[0].is_sentinel:
-            each_stack.append(next[0])
-            next = next[0].neighbours[direction]
-
-    # now work backwards through the stacks finding the furthest pair we can draw an edge for.
-    while all(len(each) > 2 for each in (stack_a, stack_b)):
-        vertex_a = stack_a[-1]
-        vertex_b = stack_b[-1]
-        if are_aligned(vertex_a, vertex_b, direction.axis.perpendicular):
-            candidate = Edge(vertex_a, vertex_b)
-            if validate(candidate):
+    (chain_a, chain_b) = (_reachable_line(manager, each, direction) for each in target)
+
+    #the far end must be formed by corners on the far sides of their tiles (i.e. facing the target direction) which are aligned with each other, beyond the tile of the target itself.
+    ends_b: dict[int, Vertex] = {each.location[direction.axis]: each for each in chain_b[2:] if direction in each.role}
+    for each_a in reversed(chain_a[2:]):
+        if direction not in each_a.role:
+            continue
+        each_b = ends_b.get(each_a.location[direction.axis])
+        if each_b is not None:
+            candidate = Edge(each_a, each_b)
+            if len(validate(candidate)) == 0:
                 return candidate
-            else:
-                stack_a.pop()
-                stack_b.pop()
-        else:
-            if direction.is_positive == vertex_a.location[direction.axis] > vertex_b.location[direction.axis]:
-                stack_a.pop()
-            else:
-                stack_b.pop()
-
-    return None #no viable result was found.
\ No newline at end of file
+
+    return None #no viable result was found.
+
+
+def _reachable_line(manager: GeometricTileManager, start: Vertex, direction: CardinalDirection) -> Sequence[Vertex]:
+    """
+    Finds the vertices on the line from a vertex in a direction which can be reached through single links, i.e. without passing a junction between tiles.
+    Only the links between tiles need to be checked, since the other vertices on the line in between are the far corners of the same tiles.
+    :param manager:
+    :param start: a corner facing the direction.
+    :param direction:
+    :return: the reachable vertices in order from the start, alternating between the near and far corners of each tile along the line.
+    """
+    axis = direction.axis
+    position = start.location[axis]
+    side = next(each for each in axis.perpendicular.directions if each in start.role)
+    line = manager.graph.alignment.aligned(
+        axis.perpendicular, start.location[axis.perpendicular],
+        *((position, None) if direction.is_positive else (None, position))
+    )
+    if not direction.is_positive:
+        line = line[::-1]
+
+    result = [start]
+    for each in itertools.islice(line, next(i for (i, each) in enumerate(line) if each is start) + 1, None):
+        #tiles on the other side of the line also have corners on it when there is no margin.
+        if side not in each.role:
+            continue
+        previous = result[-1]
+        if direction in previous.role:
+            #the next tile begins with a corner facing away from the direction, whereas a link to the canvas at the far border leads to a corner facing it.
+            links = previous.neighbours[direction]
+            if len(links) == 1 and links[0] is each and direction not in each.role:
+                result.append(each)
+                continue
+        elif each.owner is previous.owner:
+            result.append(each)
+            continue
+        #the corners of the canvas may also lie on the line, at the same locations as the corners of the tiles within it.
+        if not each.is_sentinel:
+            break
+    return result
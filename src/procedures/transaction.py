@@ -0,0 +1,95 @@
+from typing import Iterable, NamedTuple, Optional, Sequence
+
+from geometry.graph.tile import Tile
+from manager import GeometricTileManager
+from procedures.examination import validate_around
+from problems.state import StateProblem
+
+
+class Change(NamedTuple):
+    """
+    Describes the outcome of a committed Transaction to its listeners (see GeometricTileManager.listeners).
+    """
+    tiles: Sequence[Tile]
+    problems: Sequence[StateProblem]
+
+
+def notify(manager: GeometricTileManager, tiles: Iterable[Tile]) -> Change:
+    """
+    Validates the tiles which have changed (those which still exist), along with their neighbours, and notifies the listeners of the manager of the change.
+    The tiles are then no longer considered dirty.
+    :param manager:
+    :param tiles:
+    :return: the change.
+    """
+    tiles = [each for each in tiles if manager.graph.by_type[each.__class__].get(each.id) is each]
+    problems = validate_around(manager, tiles)
+    for each_tile in tiles:
+        manager.dirty.discard(each_tile)
+    result = Change(tiles, problems)
+    for each_listener in manager.listeners:
+        each_listener(result)
+    return result
+
+
+class Transaction:
+    """
+    Groups manipulations so that they are validated and reported once, as a single change, or rolled back together (e.g. the several splits and resizes of a gesture such as moving a window into the next column).
+
+    Used as a context manager (see GeometricTileManager.transaction). Within it, procedures modify the graph as usual while the journal of the registry records the state they overwrite (see Journal).
+    - On leaving the context, the transaction is committed: the tiles which were created or touched are validated together with their neighbours (see validate_around) and the listeners of the manager are notified once.
+    - If an exception is raised within the context, or abort is called, the journal is rolled back instead, restoring the graph without copying it. Nothing is notified, since the intermediate state was never reported.
+    - Committed manipulations are recorded in the history of the manager, if any, so that they can be undone (see UndoHistory).
+
+    Only validation and notification are deferred and coalesced over the union of touched tiles. Connection repair is not: each procedure still repairs the connections around its own change as it goes, so a transaction costs the same repairs as making its manipulations one at a time.
+    This is because every procedure finds the vertices it manipulates by walking the links left by the previous one (e.g. the sides of a split window, or the segmentation of a canvas), so the links cannot be left unrepaired between procedures.
+    Transactions cannot be nested.
+    """
+    __slots__ = ('manager', 'change')
+
+    manager: GeometricTileManager
+    change: Optional[Change]
+
+    def __init__(self, manager: GeometricTileManager):
+        self.manager = manager
+        self.change = None
+
+    def __enter__(self) -> 'Transaction':
+        self.manager.graph.journal.begin()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if not self.manager.graph.journal.active:
+            #already aborted.
+            return False
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.commit()
+        return False
+
+    def commit(self) -> Change:
+        """
+        Keeps the manipulations made so far, validates the tiles they changed and notifies the listeners of the manager. Ends the transaction.
+        The manipulations are kept in the history of the manager, if any, so that they can be undone.
+        :return: the change, which is also kept on the transaction.
+        """
+        journal = self.manager.graph.journal
+        if not journal.active:
+            raise ValueError("The transaction has already ended.")
+        delta = journal.finish(self.manager.graph)
+        if self.manager.history is not None:
+            self.manager.history.record(delta)
+        else:
+            delta.release(self.manager.graph)
+        self.change = notify(self.manager, delta.tiles)
+        return self.change
+
+    def abort(self):
+        """
+        Rolls back the manipulations made so far. Ends the transaction.
+        """
+        journal = self.manager.graph.journal
+        if not journal.active:
+            raise ValueError("The transaction has already ended.")
+        journal.rollback(self.manager.graph)
@@ -50,6 +50,7 @@ class StaticConfiguration:
         tiebreaker: DirectionSensitiveTiebreaker.EXTREME_SYMMETRICAL_NORTH_WEST_AND_SOUTH_EAST
         def __init__(self):
             self.tile_neighbourhood = TileNeighbourhoodOption.NARROW
+            self.tiebreaker = DirectionSensitiveTiebreaker.EXTREME_SYMMETRICAL_NORTH_WEST_AND_SOUTH_EAST
 
 
     class Manipulation:
@@ -1,4 +1,30 @@
 from basic.structures.utility.resolve_type_arguments import *
 from unit.procedures.manipulation.establish_connections_along_injection_axis import *
 from unit.procedures.manipulation.fill_wall_with_new_window import *
-from unit.procedures.manipulation.repair_connections_along_perpendicular_axis import *
\ No newline at end of file
+from unit.procedures.manipulation.repair_connections_along_perpendicular_axis import *
+from unit.geometry.graph.registry import *
+from unit.geometry.graph.coordinates import *
+from unit.geometry.graph.neighbourhood import *
+from unit.utility.enum_data import *
+from unit.geometry.direction.tables import *
+from unit.geometry.graph.edge import *
+from unit.procedures.navigation.next_tile import *
+from unit.procedures.navigation.focus_table import *
+from unit.procedures.manipulation.fill_canvas_with_layout import *
+from unit.procedures.manipulation.split_window_with_new_windows import *
+from unit.geometry.graph.segmentation import *
+from unit.procedures.resizing.resize_segments import *
+from unit.procedures.resizing.resize_session import *
+from unit.procedures.selection.find_parallel_end import *
+from unit.geometry.graph.alignment import *
+from unit.procedures.examination.validate_dirty import *
+from unit.geometry.graph.arrays import *
+from unit.procedures.audit.audit import *
+from unit.procedures.examination.validate_edge import *
+from unit.procedures.examination.is_divided import *
+from unit.procedures.transaction.transaction import *
+from unit.procedures.history.undo_history import *
+from unit.procedures.preview.preview import *
+from unit.geometry.graph.snapshot import *
+from unit.geometry.graph.hibernation import *
+from unit.procedures.manipulation.connect_facing_vertex_lines import *
\ No newline at end of file
@@ -0,0 +1,44 @@
+import gc
+import sys
+import time
+
+from geometry.graph.edge import Edge
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from geometry.direction.cardinal import CardinalDirection
+from manager import GeometricTileManager
+
+
+def churn_benchmark(cycles: int = 1_000_000, samples: int = 10):
+    """
+    Repeatedly creates a window, evaluates the derived properties of its sides (as manipulations do), then erases it again.
+    Every window is erased before the next is created, so the memory retained by the session should stay flat however many cycles are run.
+    Retention is measured in allocated interpreter blocks rather than with tracemalloc, which would slow a million cycles down by an order of magnitude.
+    """
+    gtmInstance = GeometricTileManager()
+    interval = cycles // samples
+
+    gc.collect()
+    baseline = sys.getallocatedblocks()
+    start_time = time.perf_counter()
+    print(f'{"cycles":>9} {"retained blocks":>16} {"µs per cycle":>13}')
+    for i in range(1, cycles + 1):
+        each_window = gtmInstance.graph.create_tile(Window, Vector(i % 1000, 0), Vector(10, 10))
+        for each_direction in CardinalDirection:
+            each_side: Edge = each_window.sides[each_direction]
+            each_side.axis
+            each_side.distance()
+        gtmInstance.graph._erase_tile(each_window.generate_tag())
+        del each_window, each_side
+
+        if i % interval == 0:
+            gc.collect()
+            retained = sys.getallocatedblocks() - baseline
+            print(f'{i:>9} {retained:>16} {(time.perf_counter() - start_time) / i * 1e6:>13.1f}')
+
+
+if __name__ == '__main__':
+    """
+    Execute all benchmarks in this file
+    """
+    churn_benchmark()
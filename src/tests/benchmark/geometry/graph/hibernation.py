@@ -0,0 +1,39 @@
+import gc
+import time
+import tracemalloc
+
+from geometry.graph.canvas import Canvas
+from benchmark.geometry.graph.snapshot import canvases
+
+
+def hibernation_benchmark(sizes=(1000, 4000, 10000), num_canvases=4):
+    """
+    Measures the memory retained by a multi-canvas session before and after every canvas but the first hibernates, and times hibernating and rehydrating a single canvas.
+    """
+    print(f'{"windows":>8} {"resident (KiB)":>15} {"hibernating (KiB)":>18} {"hibernate (ms)":>15} {"rehydrate (ms)":>15}')
+    for each_size in sizes:
+        gc.collect()
+        tracemalloc.start()
+        gtmInstance = canvases(each_size, num_canvases)
+        targets = list(gtmInstance.graph.by_type[Canvas].values())[1:]
+        gc.collect()
+        resident = tracemalloc.get_traced_memory()[0]
+        timings = []
+        for each in targets:
+            start = time.perf_counter()
+            gtmInstance.graph.hibernate(each)
+            timings.append(time.perf_counter() - start)
+        gc.collect()
+        hibernating = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        start = time.perf_counter()
+        gtmInstance.graph.rehydrate(targets[0])
+        rehydrated = time.perf_counter() - start
+        print(f'{each_size:>8} {resident / 1024:>15.0f} {hibernating / 1024:>18.0f} {min(timings) * 1e3:>15.2f} {rehydrated * 1e3:>15.2f}')
+
+
+if __name__ == '__main__':
+    """
+    Execute all benchmarks in this file
+    """
+    hibernation_benchmark()
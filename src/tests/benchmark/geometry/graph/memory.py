@@ -0,0 +1,59 @@
+import gc
+import math
+import tracemalloc
+
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+
+
+def build_grid(gtmInstance: GeometricTileManager, num_windows: int, size: int = 10) -> list[Window]:
+    """
+    Creates a square-ish grid of num_windows flush windows and links every corner to the adjacent corners of the neighbouring windows, as a layout built by splitting would be.
+    """
+    columns = math.ceil(math.sqrt(num_windows))
+    grid = [
+        gtmInstance.graph.create_tile(Window, Vector((i % columns) * (size + 1), (i // columns) * (size + 1)), Vector(size, size))
+        for i in range(num_windows)
+    ]
+    for (i, each_window) in enumerate(grid):
+        east = grid[i + 1] if (i + 1) % columns != 0 and i + 1 < num_windows else None
+        south = grid[i + columns] if i + columns < num_windows else None
+        if east is not None:
+            for each_dir in VERTICAL.directions:
+                (each_corner, next_corner) = (each_window.sides[each_dir].b, east.sides[each_dir].a)
+                each_corner.neighbours[EAST] = [next_corner]
+                next_corner.neighbours[WEST] = [each_corner]
+        if south is not None:
+            for each_dir in HORIZONTAL.directions:
+                (each_corner, next_corner) = (each_window.sides[each_dir].b, south.sides[each_dir].a)
+                each_corner.neighbours[SOUTH] = [next_corner]
+                next_corner.neighbours[NORTH] = [each_corner]
+    return grid
+
+
+def bytes_per_window_benchmark(sizes=(1_000, 10_000, 100_000)):
+    """
+    Measures the memory retained by a registry holding a grid layout, divided by the number of windows.
+    This includes the Tiles, Vertices, neighbourhoods and the registry's own lookup structures.
+    """
+    print(f'{"windows":>8} {"bytes per window":>17}')
+    for each_size in sizes:
+        gc.collect()
+        tracemalloc.start()
+        start = tracemalloc.get_traced_memory()[0]
+        gtmInstance = GeometricTileManager()
+        build_grid(gtmInstance, each_size)
+        gc.collect()
+        end = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f'{each_size:>8} {(end - start) / each_size:>17.1f}')
+        del gtmInstance
+
+
+if __name__ == '__main__':
+    """
+    Execute all benchmarks in this file
+    """
+    bytes_per_window_benchmark()
@@ -0,0 +1,54 @@
+import time
+
+from geometry.axis import Axis
+from geometry.graph.canvas import Canvas
+from geometry.graph.segmentation import SegmentedBox, segment_canvas
+from geometry.vector import Vector
+from procedures.manipulation import fill_canvas_with_layout
+from manager import GeometricTileManager
+
+
+def nested_rows(num_rows: int, row_length: int, size: int = 20) -> tuple[GeometricTileManager, Canvas]:
+    """
+    Builds a canvas filled by rows of windows, offsetting alternate rows by half a window so that each row must be segmented separately.
+    :return: the manager and the canvas.
+    """
+    gtmInstance = GeometricTileManager()
+    gtmInstance.settings.static_config.constraints.window_margin = 0
+    canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(row_length * size, num_rows * size))
+    rectangles = []
+    for each_row in range(num_rows):
+        offsets = [0] + [each * size - (size // 2) * (each_row % 2) for each in range(1, row_length)] + [row_length * size]
+        rectangles += [(Vector(start, each_row * size), Vector(end - start, size)) for (start, end) in zip(offsets, offsets[1:])]
+    fill_canvas_with_layout(gtmInstance, canvas, rectangles)
+    return (gtmInstance, canvas)
+
+
+def segmentation_benchmark(shapes=((10, 100), (40, 100), (40, 400)), repeats=3):
+    """
+    Times segmenting a whole canvas by walking its vertices (SegmentedBox), by sweeping over the locations of its windows (segment_canvas), and fetching the sweep again once it is cached on the canvas.
+    """
+    print(f'{"windows":>8} {"walk (ms)":>10} {"sweep (ms)":>11} {"cached (ms)":>12}')
+    for (each_rows, each_length) in shapes:
+        (gtmInstance, canvas) = nested_rows(each_rows, each_length)
+        best = [float('inf')] * 3
+        for each_repeat in range(repeats):
+            canvas.touch()
+            start = time.perf_counter()
+            walked = SegmentedBox(segment_canvas(gtmInstance, canvas, Axis.VERTICAL).source, Axis.VERTICAL, Axis.VERTICAL)
+            walk_time = time.perf_counter() - start
+            canvas.touch()
+            start = time.perf_counter()
+            segment_canvas(gtmInstance, canvas, Axis.VERTICAL)
+            swept = time.perf_counter()
+            segment_canvas(gtmInstance, canvas, Axis.VERTICAL)
+            cached = time.perf_counter()
+            best = [min(*each) for each in zip(best, (walk_time, swept - start, cached - swept))]
+        print(f'{each_rows * each_length:>8} {best[0] * 1e3:>10.2f} {best[1] * 1e3:>11.2f} {best[2] * 1e3:>12.2f}')
+
+
+if __name__ == '__main__':
+    """
+    Execute all benchmarks in this file
+    """
+    segmentation_benchmark()
@@ -0,0 +1,52 @@
+import os
+import tempfile
+import time
+
+from geometry.graph.canvas import Canvas
+from geometry.graph.snapshot import read_snapshot, write_snapshot
+from geometry.vector import Vector
+from procedures.manipulation import fill_canvas_with_layout
+from manager import GeometricTileManager
+
+
+def canvases(num_windows: int, num_canvases: int = 4, columns: int = 25, size: int = 20) -> GeometricTileManager:
+    """
+    Builds side by side canvases, each filled by a grid of flush windows, with num_windows windows in total.
+    """
+    gtmInstance = GeometricTileManager()
+    rows = num_windows // (num_canvases * columns)
+    for each_canvas in range(num_canvases):
+        origin = Vector(each_canvas * (columns * size + 100), 0)
+        canvas = gtmInstance.graph.create_tile(Canvas, origin, Vector(columns * size, rows * size))
+        fill_canvas_with_layout(gtmInstance, canvas, [(origin + Vector((i % columns) * size, (i // columns) * size), Vector(size, size)) for i in range(rows * columns)])
+    return gtmInstance
+
+
+def snapshot_benchmark(sizes=(1000, 4000, 10000), repeats=5):
+    """
+    Times writing a multi-canvas session to a snapshot and reading it back, against building the same layout with procedures.
+    Reading should take a small multiple of the time needed to create the tile and vertex objects themselves.
+    """
+    print(f'{"windows":>8} {"build (ms)":>11} {"write (ms)":>11} {"read (ms)":>10} {"file (KiB)":>11}')
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'session.gtms')
+        for each_size in sizes:
+            start = time.perf_counter()
+            gtmInstance = canvases(each_size)
+            built = time.perf_counter() - start
+            best = [float('inf')] * 2
+            for each_repeat in range(repeats):
+                start = time.perf_counter()
+                write_snapshot(gtmInstance.graph, path)
+                written = time.perf_counter()
+                read_snapshot(path)
+                read = time.perf_counter()
+                best = [min(*each) for each in zip(best, (written - start, read - written))]
+            print(f'{each_size:>8} {built * 1e3:>11.2f} {best[0] * 1e3:>11.2f} {best[1] * 1e3:>10.2f} {os.path.getsize(path) / 1024:>11.1f}')
+
+
+if __name__ == '__main__':
+    """
+    Execute all benchmarks in this file
+    """
+    snapshot_benchmark()
@@ -0,0 +1,33 @@
+import time
+
+from geometry.graph.arrays import GraphArrays
+from procedures.audit import audit
+from procedures.examination import validate_all
+from benchmark.geometry.graph.segmentation import nested_rows
+
+
+def audit_benchmark(shapes=((50, 200), (100, 500)), repeats=3):
+    """
+    Times checking every invariant of a whole layout by exporting it to arrays and auditing those, compared to validating each tile in turn.
+    """
+    print(f'{"windows":>8} {"export (ms)":>12} {"audit (ms)":>11} {"validate all (ms)":>18}')
+    for (each_rows, each_length) in shapes:
+        (gtmInstance, _) = nested_rows(each_rows, each_length)
+        best = [float('inf')] * 3
+        for each_repeat in range(repeats):
+            start = time.perf_counter()
+            arrays = GraphArrays(gtmInstance.graph)
+            exported = time.perf_counter()
+            assert len(audit(gtmInstance, arrays)) == 0
+            audited = time.perf_counter()
+            assert len(validate_all(gtmInstance)) == 0
+            validated = time.perf_counter()
+            best = [min(*each) for each in zip(best, (exported - start, audited - exported, validated - audited))]
+        print(f'{each_rows * each_length:>8} {best[0] * 1e3:>12.2f} {best[1] * 1e3:>11.2f} {best[2] * 1e3:>18.2f}')
+
+
+if __name__ == '__main__':
+    """
+    Execute all benchmarks in this file
+    """
+    audit_benchmark()
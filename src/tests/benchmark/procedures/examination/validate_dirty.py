@@ -0,0 +1,34 @@
+import time
+
+from geometry.direction.constants import *
+from procedures.examination import validate_all, validate_dirty
+from procedures.manipulation import split_window_with_new_window
+from benchmark.procedures.resizing.resize_segments import row
+
+
+def validation_benchmark(sizes=(1000, 4000, 16000), repeats=5):
+    """
+    Times validating a row of windows after splitting one of them, both in full and restricted to the tiles touched by the split (and their neighbours).
+    """
+    print(f'{"windows":>8} {"split (ms)":>11} {"dirty (ms)":>11} {"full (ms)":>10}')
+    for each_size in sizes:
+        (gtmInstance, target) = row(each_size)
+        validate_all(gtmInstance)
+        best = [float('inf')] * 3
+        for each_repeat in range(repeats):
+            start = time.perf_counter()
+            split_window_with_new_window(gtmInstance, target.segments[each_size // 2 + each_repeat].source, SOUTH)
+            split = time.perf_counter()
+            assert len(validate_dirty(gtmInstance)) == 0
+            dirty = time.perf_counter()
+            assert len(validate_all(gtmInstance)) == 0
+            full = time.perf_counter()
+            best = [min(*each) for each in zip(best, (split - start, dirty - split, full - dirty))]
+        print(f'{each_size:>8} {best[0] * 1e3:>11.2f} {best[1] * 1e3:>11.2f} {best[2] * 1e3:>10.2f}')
+
+
+if __name__ == '__main__':
+    """
+    Execute all benchmarks in this file
+    """
+    validation_benchmark()
@@ -0,0 +1,37 @@
+import time
+
+from geometry.direction.constants import *
+from procedures.examination import validate
+from benchmark.procedures.resizing.resize_segments import row
+
+
+def edge_benchmark(sizes=(1000, 4000, 16000, 64000), repeats=5):
+    """
+    Times validating the north side of a canvas along a row of windows, whose path passes through two corners of every window, both intact and with the last window linked back into the first so that the path is a cycle.
+    The time per vertex should stay flat as the row grows.
+    """
+    print(f'{"windows":>8} {"intact (ms)":>12} {"cycle (ms)":>11} {"per vertex (ns)":>16}')
+    for each_size in sizes:
+        (gtmInstance, target) = row(each_size)
+        canvas = target.source.corners[0].neighbours[WEST][0].owner
+        edge = canvas.sides[NORTH]
+        (first, last) = (target.segments[0].source, target.segments[-1].source)
+        best = [float('inf')] * 2
+        for each_repeat in range(repeats):
+            start = time.perf_counter()
+            assert len(validate(edge)) == 0
+            intact = time.perf_counter()
+            original = last.corners.north_east.neighbours[EAST]
+            last.corners.north_east.neighbours[EAST] = [first.corners.north_west]
+            assert len(validate(edge)) == 1
+            cycle = time.perf_counter()
+            last.corners.north_east.neighbours[EAST] = original
+            best = [min(*each) for each in zip(best, (intact - start, cycle - intact))]
+        print(f'{each_size:>8} {best[0] * 1e3:>12.2f} {best[1] * 1e3:>11.2f} {best[0] * 1e9 / (2 * each_size):>16.1f}')
+
+
+if __name__ == '__main__':
+    """
+    Execute all benchmarks in this file
+    """
+    edge_benchmark()
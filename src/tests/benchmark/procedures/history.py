@@ -0,0 +1,40 @@
+import time
+
+from geometry.direction.constants import *
+from procedures.history import UndoHistory
+from procedures.manipulation import split_window_with_new_window
+from benchmark.procedures.resizing.resize_segments import row
+
+
+def history_benchmark(depths=(10, 100, 1000), size=4000, repeats=3):
+    """
+    Times undoing and then redoing a history of splits, each in its own transaction, across a row of windows.
+    The time per step should not depend on the depth of the history (or on the size of the layout).
+    """
+    print(f'{"depth":>6} {"record (us)":>12} {"undo (us)":>10} {"redo (us)":>10} {"bytes/step":>11}')
+    for each_depth in depths:
+        best = [float('inf')] * 3
+        for each_repeat in range(repeats):
+            (gtmInstance, target) = row(size)
+            gtmInstance.history = UndoHistory(gtmInstance, budget=2 ** 30)
+            windows = [each.source for each in target.segments]
+            start = time.perf_counter()
+            for i in range(each_depth):
+                with gtmInstance.transaction():
+                    split_window_with_new_window(gtmInstance, windows[i * size // each_depth], SOUTH)
+            recorded = time.perf_counter()
+            while gtmInstance.history.undo() is not None:
+                pass
+            undone = time.perf_counter()
+            while gtmInstance.history.redo() is not None:
+                pass
+            redone = time.perf_counter()
+            best = [min(*each) for each in zip(best, (recorded - start, undone - recorded, redone - undone))]
+        print(f'{each_depth:>6} {best[0] * 1e6 / each_depth:>12.1f} {best[1] * 1e6 / each_depth:>10.1f} {best[2] * 1e6 / each_depth:>10.1f} {gtmInstance.history.nbytes // each_depth:>11}')
+
+
+if __name__ == '__main__':
+    """
+    Execute all benchmarks in this file
+    """
+    history_benchmark()
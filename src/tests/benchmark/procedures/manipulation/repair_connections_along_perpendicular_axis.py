@@ -0,0 +1,52 @@
+import time
+
+from geometry.graph.edge import Edge
+from procedures.manipulation import repair_connections_along_perpendicular_axis
+from geometry.direction.constants import *
+from layouts import build_row
+from manager import GeometricTileManager
+
+
+def staggered_rows(num_windows: int, width: int = 20) -> tuple[Edge, Edge, Edge, Edge]:
+    """
+    Builds three rows of num_windows windows, where the outer rows are offset by half a window from the middle row, so that every vertex of each facing line lies between two vertices of the other.
+    :return: the exterior and interior edges to repair, in the order expected by repair_connections_along_perpendicular_axis.
+    """
+    gtmInstance = GeometricTileManager()
+    total = num_windows * width + 1
+    aligned = [i * width for i in range(num_windows)] + [total]
+    staggered = [0] + [i * width + width // 2 for i in range(num_windows - 1)] + [total]
+
+    upper = build_row(gtmInstance, staggered, 0, 99)
+    middle = build_row(gtmInstance, aligned, 100, 99)
+    lower = build_row(gtmInstance, staggered, 200, 99)
+
+    return (
+        Edge(upper[0].corners.south_west, upper[-1].corners.south_east),
+        Edge(middle[0].corners.north_west, middle[-1].corners.north_east),
+        Edge(lower[0].corners.north_west, lower[-1].corners.north_east),
+        Edge(middle[0].corners.south_west, middle[-1].corners.south_east),
+    )
+
+
+def linear_scaling_benchmark(sizes=(250, 500, 1000, 2000, 4000), repeats=5):
+    """
+    Times a single repair between staggered rows of increasing length.
+    For a linear implementation, the time per window should remain roughly constant as the rows grow.
+    """
+    print(f'{"windows":>8} {"best (ms)":>10} {"per window (us)":>16}')
+    for each_size in sizes:
+        best = float('inf')
+        for _ in range(repeats):
+            edges = staggered_rows(each_size)
+            start = time.perf_counter()
+            repair_connections_along_perpendicular_axis(VERTICAL, *edges)
+            best = min(best, time.perf_counter() - start)
+        print(f'{each_size:>8} {best * 1e3:>10.2f} {best * 1e6 / each_size:>16.2f}')
+
+
+if __name__ == '__main__':
+    """
+    Execute all benchmarks in this file
+    """
+    linear_scaling_benchmark()
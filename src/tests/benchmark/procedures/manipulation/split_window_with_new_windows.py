@@ -0,0 +1,58 @@
+import time
+
+from geometry.graph.canvas import Canvas
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from procedures.manipulation import fill_canvas_with_layout, split_window_with_new_window, split_window_with_new_windows
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+
+
+def bordered_window(boundary: int, width: int = 20) -> tuple[GeometricTileManager, Window]:
+    """
+    Builds a window between two rows of boundary windows each, so that every split of it along the horizontal axis must repair connections along both rows.
+    :return: the manager and the window in the middle.
+    """
+    gtmInstance = GeometricTileManager()
+    total = boundary * width
+    canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(total, 300))
+    edges = [i * width for i in range(boundary)] + [total + 1]
+    row = lambda top, height: [(Vector(start, top), Vector(end - start - 1, height)) for (start, end) in zip(edges, edges[1:])]
+    (windows, _) = fill_canvas_with_layout(gtmInstance, canvas, [*row(0, 99), (Vector(0, 100), Vector(total, 99)), *row(200, 100)])
+    return (gtmInstance, windows[boundary])
+
+
+def repeated_splits(gtmInstance: GeometricTileManager, target: Window, count: int):
+    for _ in range(count):
+        (target, _) = split_window_with_new_window(gtmInstance, target, EAST)
+
+
+def single_split(gtmInstance: GeometricTileManager, target: Window, count: int):
+    split_window_with_new_windows(gtmInstance, target, EAST, count)
+
+
+def row_benchmark(boundaries=(16, 256, 4096), counts=(8, 16), repeats=5):
+    """
+    Times opening a row of windows inside a window bordered by rows of the given lengths, by repeatedly splitting off one window at a time and by a single multi-way split.
+    The repeated splits repair the whole boundary once per window, whilst the single split only repairs it once.
+    """
+    print(f'{"boundary":>8} {"windows":>8} {"repeated (ms)":>14} {"single (ms)":>12}')
+    for each_boundary in boundaries:
+        for each_count in counts:
+            timings = []
+            for each_procedure in (repeated_splits, single_split):
+                best = float('inf')
+                for _ in range(repeats):
+                    (gtmInstance, target) = bordered_window(each_boundary)
+                    start = time.perf_counter()
+                    each_procedure(gtmInstance, target, each_count)
+                    best = min(best, time.perf_counter() - start)
+                timings.append(best)
+            print(f'{each_boundary:>8} {each_count:>8} {timings[0] * 1e3:>14.2f} {timings[1] * 1e3:>12.2f}')
+
+
+if __name__ == '__main__':
+    """
+    Execute all benchmarks in this file
+    """
+    row_benchmark()
@@ -0,0 +1,34 @@
+import time
+
+from geometry.direction.constants import *
+from procedures.manipulation import split_window_with_new_window
+from procedures.preview import preview
+from benchmark.procedures.resizing.resize_segments import row
+
+
+def preview_benchmark(sizes=(1000, 4000, 16000), repeats=20):
+    """
+    Times previewing a split (making it, reading the changed region and rolling it back) in rows of windows of increasing size.
+    The time should not depend on the size of the layout.
+    """
+    print(f'{"windows":>8} {"preview (ms)":>13} {"split (ms)":>11}')
+    for each_size in sizes:
+        (gtmInstance, target) = row(each_size)
+        window = target.segments[each_size // 2].source
+        best = [float('inf')] * 2
+        for each_repeat in range(repeats):
+            start = time.perf_counter()
+            preview(gtmInstance, split_window_with_new_window, window, SOUTH)
+            previewed = time.perf_counter()
+            best = [min(*each) for each in zip(best, (previewed - start, float('inf')))]
+        start = time.perf_counter()
+        split_window_with_new_window(gtmInstance, window, SOUTH)
+        best[1] = time.perf_counter() - start
+        print(f'{each_size:>8} {best[0] * 1e3:>13.2f} {best[1] * 1e3:>11.2f}')
+
+
+if __name__ == '__main__':
+    """
+    Execute all benchmarks in this file
+    """
+    preview_benchmark()
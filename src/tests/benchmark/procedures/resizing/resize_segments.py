@@ -0,0 +1,52 @@
+import time
+
+from geometry.axis import Axis
+from geometry.graph.canvas import Canvas
+from geometry.graph.independent import IndependentBox
+from geometry.graph.segmentation import SegmentedBox
+from geometry.vector import Vector
+from procedures.manipulation import fill_canvas_with_layout
+from procedures.resizing import ResizePlan
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+
+
+def row(num_windows: int, width: int = 20) -> tuple[GeometricTileManager, SegmentedBox]:
+    """
+    Builds a canvas filled by a single row of windows.
+    :return: the manager and the segmented row.
+    """
+    gtmInstance = GeometricTileManager()
+    total = num_windows * width
+    canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(total, 100))
+    (windows, _) = fill_canvas_with_layout(gtmInstance, canvas, [(Vector(i * width, 0), Vector(width, 100)) for i in range(num_windows)])
+    box = IndependentBox(windows[0].corners.north_west, windows[-1].corners.north_east, windows[-1].corners.south_east, windows[0].corners.south_west)
+    return (gtmInstance, SegmentedBox(box, Axis.HORIZONTAL, Axis.HORIZONTAL))
+
+
+def row_benchmark(sizes=(1000, 4000, 16000), repeats=5):
+    """
+    Times compiling a plan for a row of windows, and then resizing its first window (which moves every other window in the row) with it.
+    Resizing is split into the vectorised allocation and write-back, and the re-linking of the sides of the row.
+    """
+    print(f'{"windows":>8} {"compile (ms)":>13} {"resize (ms)":>12} {"of which relink (ms)":>21}')
+    for each_size in sizes:
+        (gtmInstance, target) = row(each_size)
+        best = [float('inf')] * 3
+        for each_repeat in range(repeats):
+            start = time.perf_counter()
+            plan = ResizePlan(gtmInstance, target)
+            compiled = time.perf_counter()
+            plan.resize({0: 10 + each_repeat})
+            resized = time.perf_counter()
+            plan.relink()
+            relinked = time.perf_counter()
+            best = [min(*each) for each in zip(best, (compiled - start, resized - compiled, relinked - resized))]
+        print(f'{each_size:>8} {best[0] * 1e3:>13.2f} {best[1] * 1e3:>12.2f} {best[2] * 1e3:>21.2f}')
+
+
+if __name__ == '__main__':
+    """
+    Execute all benchmarks in this file
+    """
+    row_benchmark()
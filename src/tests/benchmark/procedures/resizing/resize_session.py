@@ -0,0 +1,41 @@
+import time
+
+from geometry.axis import Axis
+from geometry.direction.constants import *
+from procedures.resizing import ResizeSession
+from benchmark.procedures.resizing.resize_segments import row
+
+
+def drag_benchmark(sizes=(1000, 4000, 16000), frames=20):
+    """
+    Times dragging the east side of the first window in a row (which moves every other window in the row) for a number of frames.
+    Each frame of a session only moves coordinates, whereas a full resize also re-links the sides of the row.
+    """
+    print(f'{"windows":>8} {"begin (ms)":>11} {"frame (ms)":>11} {"commit (ms)":>12} {"full resize (ms)":>17}')
+    for each_size in sizes:
+        (gtmInstance, target) = row(each_size)
+        session = ResizeSession(gtmInstance)
+        first = target.segments[0].source
+
+        start = time.perf_counter()
+        session.begin(first.sides[EAST], Axis.HORIZONTAL)
+        begun = time.perf_counter()
+        for each_frame in range(frames):
+            session.update(each_frame)
+        updated = time.perf_counter()
+        session.commit()
+        committed = time.perf_counter()
+
+        session.begin(first.sides[EAST], Axis.HORIZONTAL)
+        session._plan.resize({0: 30})
+        resized = time.perf_counter()
+        session.cancel()
+
+        print(f'{each_size:>8} {(begun - start) * 1e3:>11.2f} {(updated - begun) / frames * 1e3:>11.2f} {(committed - updated) * 1e3:>12.2f} {(resized - committed) * 1e3:>17.2f}')
+
+
+if __name__ == '__main__':
+    """
+    Execute all benchmarks in this file
+    """
+    drag_benchmark()
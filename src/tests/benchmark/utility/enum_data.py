@@ -0,0 +1,44 @@
+import timeit
+
+from geometry.axis import AxisDataclass
+from geometry.direction.constants import *
+from utility.enum_data import enum_dataclass
+
+
+@enum_dataclass(frozen=True)
+class DataclassPair(AxisDataclass[int]):
+    ...
+
+
+@enum_dataclass(compiled=True)
+class CompiledPair(AxisDataclass[int]):
+    ...
+
+
+def per_access_benchmark(number=200_000):
+    """
+    Compares the default dataclass mode of enum_dataclass with compiled mode for the operations that sit under Vector arithmetic and corner/neighbour lookups.
+    """
+    cases = {
+        'getitem': 'target[VERTICAL]',
+        'iterate': 'tuple(target)',
+        'construct': 'cls(1, 2)',
+        'attribute': 'target.horizontal',
+        'equality': 'target == other',
+        'hash': 'hash(target)',
+        'elementwise add': 'cls(*(a + b for (a, b) in zip(target, target)))',
+    }
+    print(f'{"operation":>16} {"dataclass (ns)":>15} {"compiled (ns)":>14} {"speedup":>8}')
+    for (each_name, each_statement) in cases.items():
+        timings = []
+        for each_cls in (DataclassPair, CompiledPair):
+            namespace = {'cls': each_cls, 'target': each_cls(1, 2), 'other': each_cls(1, 2), 'VERTICAL': VERTICAL}
+            timings.append(min(timeit.repeat(each_statement, globals=namespace, number=number, repeat=5)) / number * 1e9)
+        print(f'{each_name:>16} {timings[0]:>15.1f} {timings[1]:>14.1f} {timings[0] / timings[1]:>7.1f}x')
+
+
+if __name__ == '__main__':
+    """
+    Execute all benchmarks in this file
+    """
+    per_access_benchmark()
@@ -0,0 +1,25 @@
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+
+"""
+Layouts shared by the unit tests and the benchmarks, which are built directly rather than by procedures so that procedures can be tested against them.
+"""
+
+
+def build_row(gtmInstance: GeometricTileManager, boundaries: list[int], top: int, height: int) -> list[Window]:
+    """
+    Creates a row of flush windows between each pair of consecutive boundaries, linked to one another horizontally.
+    :return: the windows from west to east.
+    """
+    row = [
+        gtmInstance.graph.create_tile(Window, Vector(start, top), Vector(end - start - 1, height))
+        for (start, end) in zip(boundaries, boundaries[1:])
+    ]
+    for (each_window, next_window) in zip(row, row[1:]):
+        for each_dir in VERTICAL.directions:
+            (each_corner, next_corner) = (each_window.sides[each_dir].b, next_window.sides[each_dir].a)
+            each_corner.neighbours[EAST] = [next_corner]
+            next_corner.neighbours[WEST] = [each_corner]
+    return row
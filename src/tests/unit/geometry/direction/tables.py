@@ -0,0 +1,44 @@
+import unittest
+
+from geometry.axis import Axis, AXIS_PERPENDICULARS
+from geometry.direction.cardinal import CardinalDirection, CARDINAL_OPPOSITES, AXIS_DIRECTIONS, CARDINAL_AXES
+from geometry.direction.diagonal import DiagonalDirection, DIAGONAL_OPPOSITES, CARDINAL_DIAGONALS
+from geometry.direction.constants import *
+
+
+class DirectionTableCases(unittest.TestCase):
+    def test_member_relationships(self):
+        self.assertIs(HORIZONTAL.perpendicular, VERTICAL)
+        self.assertIs(VERTICAL.perpendicular, HORIZONTAL)
+        self.assertEqual(HORIZONTAL.directions, (WEST, EAST))
+        self.assertEqual(VERTICAL.directions, (NORTH, SOUTH))
+
+        self.assertEqual([each.opposite for each in CardinalDirection], [SOUTH, WEST, NORTH, EAST])
+        self.assertEqual([each.opposite for each in DiagonalDirection], [SOUTH_EAST, SOUTH_WEST, NORTH_WEST, NORTH_EAST])
+
+        self.assertEqual(NORTH.diagonals, (NORTH_WEST, NORTH_EAST))
+        self.assertEqual(EAST.diagonals, (NORTH_EAST, SOUTH_EAST))
+        self.assertEqual(SOUTH.diagonals, (SOUTH_WEST, SOUTH_EAST))
+        self.assertEqual(WEST.diagonals, (NORTH_WEST, SOUTH_WEST))
+
+    def test_relationships_are_plain_attributes(self):
+        for each in (*Axis, *CardinalDirection, *DiagonalDirection):
+            for each_name in ('perpendicular', 'directions', 'opposite', 'diagonals'):
+                self.assertNotIsInstance(getattr(type(each), each_name, None), property)
+
+    def test_ordinal_tables_match_members(self):
+        axes, cardinals, diagonals = tuple(Axis), tuple(CardinalDirection), tuple(DiagonalDirection)
+
+        for each in Axis:
+            self.assertIs(axes[AXIS_PERPENDICULARS[each.ordinal]], each.perpendicular)
+            self.assertEqual(tuple(cardinals[i] for i in AXIS_DIRECTIONS[each.ordinal]), each.directions)
+        for each in CardinalDirection:
+            self.assertIs(cardinals[CARDINAL_OPPOSITES[each.ordinal]], each.opposite)
+            self.assertIs(axes[CARDINAL_AXES[each.ordinal]], each.axis)
+            self.assertEqual(tuple(diagonals[i] for i in CARDINAL_DIAGONALS[each.ordinal]), each.diagonals)
+        for each in DiagonalDirection:
+            self.assertIs(diagonals[DIAGONAL_OPPOSITES[each.ordinal]], each.opposite)
+
+
+if __name__ == '__main__':
+    unittest.main()
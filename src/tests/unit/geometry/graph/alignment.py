@@ -0,0 +1,73 @@
+import random
+import unittest
+
+from geometry.axis import Axis
+from geometry.graph.canvas import Canvas
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+from unit.geometry.graph.segmentation import l_shaped_layout
+
+
+def brute_force_aligned(gtmInstance: GeometricTileManager, axis: Axis, value: int):
+    return sorted(
+        (each_corner for each_class in (Window, Canvas) for each in gtmInstance.graph.by_type[each_class].values() for each_corner in each.corners if each_corner.location[axis] == value),
+        key=lambda each: (each.location[axis.perpendicular], each.slot)
+    )
+
+
+class AlignmentIndexCases(unittest.TestCase):
+    def test_lookup(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        alignment = gtmInstance.graph.alignment
+
+        self.assertEqual(len(alignment), 4 * 5)
+        self.assertEqual(alignment.aligned(Axis.VERTICAL, 0, 100, 300), [windows[0].corners.north_east, windows[1].corners.north_west, windows[1].corners.north_east, windows[2].corners.north_west])
+        self.assertEqual(alignment.aligned(Axis.HORIZONTAL, 100, 0, 299), [windows[0].corners.north_east])
+        self.assertEqual(alignment.aligned(Axis.HORIZONTAL, 101), [])
+        self.assertEqual(alignment.lines(Axis.HORIZONTAL, 100, 260), [100, 103, 250, 253])
+        for each_axis in Axis:
+            for each_value in (0, 100, 103, 300):
+                self.assertEqual(set(alignment.aligned(each_axis, each_value)), set(brute_force_aligned(gtmInstance, each_axis, each_value)))
+
+    def test_follows_moves(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        alignment = gtmInstance.graph.alignment
+        self.assertEqual(len(alignment.aligned(Axis.HORIZONTAL, 100)), 2)
+
+        #both single writes and vectorised writes to the coordinate store are picked up.
+        windows[0].corners.north_east.location = Vector(90, 0)
+        self.assertEqual(alignment.aligned(Axis.HORIZONTAL, 90), [windows[0].corners.north_east])
+        gtmInstance.graph.translate_tiles([windows[1]], Vector(0, 7))
+        self.assertEqual(alignment.aligned(Axis.VERTICAL, 7), [windows[1].corners.north_west, windows[1].corners.north_east])
+        self.assertNotIn(windows[1].corners.north_west, alignment.aligned(Axis.VERTICAL, 0))
+
+    def test_follows_erasure(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        alignment = gtmInstance.graph.alignment
+        gtmInstance.graph._erase_tile(windows[1].generate_tag())
+
+        self.assertEqual(len(alignment), 4 * 4)
+        self.assertEqual(alignment.aligned(Axis.VERTICAL, 0, 100, 300), [windows[0].corners.north_east, windows[2].corners.north_west])
+        self.assertEqual(alignment.lines(Axis.HORIZONTAL, 100, 260), [100, 103, 253])
+
+        #recycled slots are indexed at the location of their new vertex.
+        replacement = gtmInstance.graph.create_tile(Window, Vector(500, 500), Vector(10, 10))
+        self.assertEqual(alignment.aligned(Axis.VERTICAL, 500), [replacement.corners.north_west, replacement.corners.north_east])
+        self.assertEqual(alignment.aligned(Axis.VERTICAL, 0, 100, 300), [windows[0].corners.north_east, windows[2].corners.north_west])
+
+    def test_random_moves(self):
+        random.seed(0)
+        gtmInstance = GeometricTileManager()
+        windows = [gtmInstance.graph.create_tile(Window, Vector(random.randrange(50), random.randrange(50)), Vector(random.randrange(1, 50), random.randrange(1, 50))) for _ in range(40)]
+        for _ in range(20):
+            moved = random.sample(windows, 5)
+            gtmInstance.graph.translate_tiles(moved, Vector(random.randrange(-5, 6), random.randrange(-5, 6)))
+            for each_axis in Axis:
+                for each_value in range(-10, 110, 7):
+                    self.assertEqual(set(gtmInstance.graph.alignment.aligned(each_axis, each_value)), set(brute_force_aligned(gtmInstance, each_axis, each_value)))
+
+
+if __name__ == '__main__':
+    unittest.main()
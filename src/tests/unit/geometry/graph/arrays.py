@@ -0,0 +1,38 @@
+import unittest
+
+from geometry.axis import Axis
+from geometry.direction.cardinal import CardinalDirection
+from geometry.graph.arrays import GraphArrays
+from geometry.direction.constants import *
+from unit.geometry.graph.segmentation import l_shaped_layout
+
+
+class GraphArraysCases(unittest.TestCase):
+    def test_export(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        arrays = GraphArrays(gtmInstance.graph)
+
+        self.assertEqual(len(arrays), 4 * 5)
+        self.assertEqual(list(arrays.is_sentinel), [True, False, False, False, False])
+        for (i, each_vertex) in enumerate(arrays.vertices):
+            self.assertIs(arrays.tiles[arrays.owners[i]], each_vertex.owner)
+            self.assertIs(arrays.tiles[arrays.owners[i]].corners[arrays.roles[i]], each_vertex)
+            self.assertEqual(tuple(arrays.locations[i]), tuple(each_vertex.location[each_axis] for each_axis in Axis))
+            for each_direction in CardinalDirection:
+                neighbours = [arrays.vertices[each] for each in arrays.neighbours[each_direction.ordinal, i] if each >= 0]
+                self.assertEqual(neighbours, list(each_vertex.neighbours[each_direction]))
+                self.assertEqual(arrays.counts[each_direction.ordinal, i], len(neighbours))
+
+    def test_links_to_erased_tiles(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        gtmInstance.graph._erase_tile(windows[1].generate_tag())
+        arrays = GraphArrays(gtmInstance.graph)
+
+        self.assertEqual(len(arrays), 4 * 4)
+        i = arrays.vertices.index(windows[0].corners.north_east)
+        self.assertEqual(list(arrays.neighbours[EAST.ordinal, i]), [-2, -1])
+        self.assertEqual(arrays.counts[EAST.ordinal, i], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+
+from geometry.graph.canvas import Canvas
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from procedures.manipulation import fill_canvas_with_new_window, split_window_with_new_window
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+
+
+class CoordinateStoreCases(unittest.TestCase):
+    def test_locations_are_snapshots(self):
+        gtmInstance = GeometricTileManager()
+        first_window = gtmInstance.graph.create_tile(Window, Vector(100, 100), Vector(100, 100))
+
+        before = first_window.corners.south_east.location
+        first_window.corners.south_east.location = Vector(250, 260)
+
+        self.assertEqual(before, Vector(200, 200))
+        self.assertEqual(first_window.corners.south_east.location, Vector(250, 260))
+        self.assertEqual(gtmInstance.graph.coordinates[first_window.corners.south_east.slot], Vector(250, 260))
+
+    def test_locations_follow_bulk_writes(self):
+        gtmInstance = GeometricTileManager()
+        first_window = gtmInstance.graph.create_tile(Window, Vector(100, 100), Vector(100, 100))
+        corner = first_window.corners.south_east
+        self.assertEqual(corner.location, Vector(200, 200))
+
+        gtmInstance.graph.assign_components([first_window], [corner.slot], HORIZONTAL, [250])
+        self.assertEqual(corner.location, Vector(250, 200))
+
+        with gtmInstance.transaction() as transaction:
+            gtmInstance.graph.translate_tiles([first_window], Vector(0, 10))
+            self.assertEqual(corner.location, Vector(250, 210))
+            transaction.abort()
+        self.assertEqual(corner.location, Vector(250, 200))
+
+    def test_translate_whole_canvas(self):
+        gtmInstance = GeometricTileManager()
+        first_canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(1000, 1000))
+        first_window = fill_canvas_with_new_window(gtmInstance, first_canvas)
+        (second_window, _) = split_window_with_new_window(gtmInstance, first_window, EAST)
+        all_tiles = [first_canvas, first_window, second_window]
+        before = {each_corner: each_corner.location for each in all_tiles for each_corner in each.corners}
+        generations = [each.generation for each in all_tiles]
+
+        gtmInstance.graph.translate_tiles(all_tiles, Vector(2000, -50))
+
+        for (each_corner, each_location) in before.items():
+            self.assertEqual(each_corner.location, each_location + Vector(2000, -50))
+        for (each, each_generation) in zip(all_tiles, generations):
+            self.assertGreater(each.generation, each_generation)
+        self.assertIs(gtmInstance.graph.tile_at(second_window.corners.north_east.location), second_window)
+        self.assertIsNone(gtmInstance.graph.tile_at(Vector(500, 500)))
+
+    def test_scale_whole_canvas(self):
+        gtmInstance = GeometricTileManager()
+        first_canvas = gtmInstance.graph.create_tile(Canvas, Vector(10, 10), Vector(301, 101))
+
+        generation = first_canvas.generation
+
+        gtmInstance.graph.scale_tiles([first_canvas], Vector(10, 10), 2, 3)
+
+        self.assertEqual(first_canvas.corners.north_west.location, Vector(10, 10))
+        self.assertEqual(first_canvas.corners.south_east.location, Vector(10 + 602 // 3, 10 + 202 // 3))
+        self.assertGreater(first_canvas.generation, generation)
+
+    def test_aligned_mask(self):
+        gtmInstance = GeometricTileManager()
+        all_windows = [gtmInstance.graph.create_tile(Window, Vector(i * 10, i % 2), Vector(5, 5)) for i in range(6)]
+        slots = [each.corners.north_west.slot for each in all_windows]
+
+        self.assertListEqual(list(gtmInstance.graph.coordinates.aligned(slots, VERTICAL, 0)), [True, False] * 3)
+
+    def test_slots_are_recycled(self):
+        gtmInstance = GeometricTileManager()
+        first_window = gtmInstance.graph.create_tile(Window, Vector(0, 0), Vector(5, 5))
+        released = {each_corner.slot for each_corner in first_window.corners}
+        gtmInstance.graph._erase_tile(first_window.generate_tag())
+
+        second_window = gtmInstance.graph.create_tile(Window, Vector(50, 50), Vector(5, 5))
+
+        self.assertSetEqual({each_corner.slot for each_corner in second_window.corners}, released)
+        self.assertEqual(len(gtmInstance.graph.coordinates), 4)
+        self.assertEqual(second_window.corners.north_west.location, Vector(50, 50))
+
+    def test_store_grows(self):
+        gtmInstance = GeometricTileManager()
+        all_windows = [gtmInstance.graph.create_tile(Window, Vector(i * 10, 0), Vector(5, 5)) for i in range(100)]
+
+        self.assertEqual(len(gtmInstance.graph.coordinates), 400)
+        for (i, each_window) in enumerate(all_windows):
+            self.assertEqual(each_window.corners.south_east.location, Vector(i * 10 + 5, 5))
+
+
+if __name__ == '__main__':
+    unittest.main()
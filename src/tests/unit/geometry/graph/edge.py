@@ -0,0 +1,44 @@
+import sys
+import unittest
+
+from geometry.graph.edge import Edge
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+
+
+class EdgeCases(unittest.TestCase):
+    def test_axis_and_distance(self):
+        gtmInstance = GeometricTileManager()
+        target = gtmInstance.graph.create_tile(Window, Vector(0, 0), Vector(10, 20))
+        other = gtmInstance.graph.create_tile(Window, Vector(20, 0), Vector(10, 20))
+
+        for each_direction in VERTICAL.directions:
+            self.assertIs(target.sides[each_direction].axis, HORIZONTAL)
+            self.assertEqual(target.sides[each_direction].distance(), 10)
+        for each_direction in HORIZONTAL.directions:
+            self.assertIs(target.sides[each_direction].axis, VERTICAL)
+            self.assertEqual(target.sides[each_direction].distance(), 20)
+
+        #fake edges spanning several tiles are derived from their roles in the same way.
+        spanning = Edge(target.corners.north_west, other.corners.north_east)
+        self.assertIs(spanning.axis, HORIZONTAL)
+        self.assertEqual(spanning.distance(), 30)
+
+    def test_axis_retains_no_references(self):
+        gtmInstance = GeometricTileManager()
+        target = gtmInstance.graph.create_tile(Window, Vector(0, 0), Vector(10, 10))
+        edge = Edge(target.corners.north_west, target.corners.north_east)
+        (edge_count, vertex_count) = (sys.getrefcount(edge), sys.getrefcount(edge.a))
+
+        for _ in range(3):
+            edge.axis
+            edge.distance()
+
+        self.assertEqual(sys.getrefcount(edge), edge_count)
+        self.assertEqual(sys.getrefcount(edge.a), vertex_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
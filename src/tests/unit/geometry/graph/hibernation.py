@@ -0,0 +1,195 @@
+import os
+import tempfile
+import unittest
+
+from geometry.graph.canvas import Canvas
+from geometry.graph.snapshot import read_snapshot, write_snapshot
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from procedures.audit import audit
+from procedures.examination import is_divided
+from procedures.manipulation import fill_canvas_with_layout, fill_canvas_with_new_window
+from procedures.navigation import FocusTable, next_undivided_tile
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+from unit.geometry.graph.segmentation import l_shaped_layout
+from unit.geometry.graph.snapshot import describe
+
+
+def linked_canvases():
+    """
+    Builds two canvases side by side, the first filled by one window and the second by two, with the east side of the first linked to the west side of the second (as for monitors side by side).
+    :return: the manager and both canvases.
+    """
+    gtmInstance = GeometricTileManager()
+    (first_canvas, second_canvas) = (gtmInstance.graph.create_tile(Canvas, Vector(each, 0), Vector(100, 100)) for each in (0, 200))
+    fill_canvas_with_layout(gtmInstance, first_canvas, [(Vector(0, 0), Vector(100, 100))])
+    fill_canvas_with_layout(gtmInstance, second_canvas, [(Vector(200, 0), Vector(50, 100)), (Vector(250, 0), Vector(50, 100))])
+    for (each_outer, each_inner) in ((NORTH_EAST, NORTH_WEST), (SOUTH_EAST, SOUTH_WEST)):
+        first_canvas.corners[each_outer].neighbours[EAST] = [second_canvas.corners[each_inner]]
+        second_canvas.corners[each_inner].neighbours[WEST] = [first_canvas.corners[each_outer]]
+    return (gtmInstance, first_canvas, second_canvas)
+
+
+class HibernationCases(unittest.TestCase):
+    def test_drops_windows(self):
+        (gtmInstance, windows, _) = l_shaped_layout(4)
+        canvas = gtmInstance.graph.canvas_of(windows[0])
+        vertex_count = len(gtmInstance.graph.coordinates)
+
+        gtmInstance.graph.hibernate(canvas)
+
+        self.assertEqual(list(gtmInstance.graph.hibernating), [canvas])
+        self.assertEqual(gtmInstance.graph.by_type[Window], {})
+        self.assertEqual(gtmInstance.graph.by_type[Canvas], {})
+        self.assertIsNone(gtmInstance.graph.tile_at(Vector(50, 50)))
+        self.assertEqual(len(gtmInstance.graph.coordinates), vertex_count - 4 * len(windows))
+        self.assertEqual(audit(gtmInstance), [])
+
+    def test_window_tag_rehydrates(self):
+        (gtmInstance, windows, _) = l_shaped_layout(4)
+        gtmInstance.graph.name_tile(windows[1], 'editor')
+        canvas = gtmInstance.graph.canvas_of(windows[0])
+        expected = describe(gtmInstance)
+
+        gtmInstance.graph.hibernate(canvas)
+        result = gtmInstance.graph[windows[2].generate_tag()]
+
+        self.assertEqual(result.id, windows[2].id)
+        self.assertIsNot(result, windows[2])
+        self.assertEqual(gtmInstance.graph[windows[1].generate_tag()].name, 'editor')
+        self.assertEqual(list(gtmInstance.graph.hibernating), [])
+        self.assertEqual(describe(gtmInstance), expected)
+        self.assertEqual(audit(gtmInstance), [])
+
+    def test_canvas_tag_rehydrates(self):
+        (gtmInstance, windows, _) = l_shaped_layout(4)
+        canvas = gtmInstance.graph.canvas_of(windows[0])
+        gtmInstance.graph.name_tile(canvas, 'workspace')
+        expected = describe(gtmInstance)
+
+        gtmInstance.graph.hibernate(canvas)
+
+        self.assertIs(gtmInstance.graph[canvas.generate_tag()], canvas)
+        self.assertEqual(canvas.window_count, len(windows))
+        self.assertEqual(describe(gtmInstance), expected)
+
+    def test_windows_in_rehydrates(self):
+        (gtmInstance, windows, _) = l_shaped_layout(4)
+        canvas = gtmInstance.graph.canvas_of(windows[0])
+
+        gtmInstance.graph.hibernate(canvas)
+
+        self.assertEqual([each.id for each in gtmInstance.graph.windows_in(canvas)], [each.id for each in windows])
+
+    def test_ids_stay_unique(self):
+        gtmInstance = GeometricTileManager()
+        (first_canvas, second_canvas) = (gtmInstance.graph.create_tile(Canvas, Vector(each, 0), Vector(100, 100)) for each in (0, 200))
+        (windows, _) = fill_canvas_with_layout(gtmInstance, first_canvas, [(Vector(0, 0), Vector(100, 100))])
+
+        gtmInstance.graph.hibernate(first_canvas)
+        (new_windows, _) = fill_canvas_with_layout(gtmInstance, second_canvas, [(Vector(200, 0), Vector(100, 100))])
+        gtmInstance.graph.rehydrate(first_canvas)
+
+        self.assertEqual(len(gtmInstance.graph.by_type[Window]), 2)
+        self.assertNotEqual(new_windows[0].id, windows[0].id)
+
+    def test_slots_are_reused(self):
+        (gtmInstance, windows, _) = l_shaped_layout(4)
+        canvas = gtmInstance.graph.canvas_of(windows[0])
+        gtmInstance.graph.hibernate(canvas)
+        gtmInstance.graph.rehydrate(canvas)
+        capacity = gtmInstance.graph.coordinates.capacity
+
+        for _ in range(4):
+            gtmInstance.graph.hibernate(canvas)
+            gtmInstance.graph.rehydrate(canvas)
+
+        self.assertEqual(gtmInstance.graph.coordinates.capacity, capacity)
+        self.assertEqual(audit(gtmInstance), [])
+
+    def test_dirty_tiles_are_kept(self):
+        (gtmInstance, windows, _) = l_shaped_layout(4)
+        canvas = gtmInstance.graph.canvas_of(windows[0])
+        gtmInstance.dirty.take()
+        windows[3].touch()
+
+        gtmInstance.graph.hibernate(canvas)
+        gtmInstance.graph.rehydrate(canvas)
+
+        self.assertEqual([each.id for each in gtmInstance.dirty], [windows[3].id])
+
+    def test_navigation_rehydrates(self):
+        (gtmInstance, first_canvas, second_canvas) = linked_canvases()
+        focus = FocusTable(gtmInstance)
+        expected = focus[first_canvas, EAST].id
+
+        gtmInstance.graph.hibernate(second_canvas)
+
+        self.assertEqual(next_undivided_tile(gtmInstance, first_canvas, EAST).id, expected)
+        self.assertEqual(list(gtmInstance.graph.hibernating), [])
+
+        gtmInstance.graph.hibernate(second_canvas)
+
+        self.assertEqual(focus[first_canvas, EAST].id, expected)
+        self.assertIs(focus[first_canvas, EAST], gtmInstance.graph.by_type[Window][expected])
+
+    def test_fill_hibernating(self):
+        (gtmInstance, windows, _) = l_shaped_layout(4)
+        canvas = gtmInstance.graph.canvas_of(windows[0])
+        expected = describe(gtmInstance)
+        gtmInstance.graph.hibernate(canvas)
+
+        self.assertEqual(canvas.window_count, len(windows))
+        self.assertTrue(is_divided(canvas))
+        with self.assertRaises(ValueError):
+            fill_canvas_with_new_window(gtmInstance, canvas)
+        with self.assertRaises(ValueError):
+            fill_canvas_with_layout(gtmInstance, canvas, [(Vector(0, 0), Vector(100, 100))])
+        self.assertEqual(describe(gtmInstance), expected)
+        self.assertEqual(audit(gtmInstance), [])
+
+    def test_fill_empty_hibernating(self):
+        gtmInstance = GeometricTileManager()
+        canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(100, 100))
+        gtmInstance.graph.hibernate(canvas)
+
+        result = fill_canvas_with_new_window(gtmInstance, canvas)
+
+        self.assertEqual(list(gtmInstance.graph.hibernating), [])
+        self.assertEqual(list(gtmInstance.graph.windows_in(canvas)), [result])
+        self.assertEqual(audit(gtmInstance), [])
+
+    def test_snapshot_includes_hibernating(self):
+        (gtmInstance, windows, _) = l_shaped_layout(4)
+        canvas = gtmInstance.graph.canvas_of(windows[0])
+        expected = describe(gtmInstance)
+        gtmInstance.graph.hibernate(canvas)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'session.gtms')
+            write_snapshot(gtmInstance.graph, path)
+            restored = GeometricTileManager()
+            restored.graph = read_snapshot(path)
+
+        self.assertEqual(describe(restored), expected)
+        self.assertEqual(list(gtmInstance.graph.hibernating), [canvas])
+        self.assertEqual(gtmInstance.graph.by_type[Window], {})
+
+    def test_invalid_hibernation(self):
+        (gtmInstance, first_canvas, second_canvas) = linked_canvases()
+        outside = gtmInstance.graph.windows_in(second_canvas)
+        next(iter(gtmInstance.graph.windows_in(first_canvas))).corners.north_east.neighbours[EAST] = [next(iter(outside)).corners.north_west]
+        expected = describe(gtmInstance)
+
+        with self.assertRaises(ValueError):
+            gtmInstance.graph.hibernate(first_canvas)
+        self.assertEqual(describe(gtmInstance), expected)
+        with self.assertRaises(ValueError):
+            gtmInstance.graph.rehydrate(second_canvas)
+        with gtmInstance.transaction():
+            with self.assertRaises(ValueError):
+                gtmInstance.graph.hibernate(second_canvas)
+        gtmInstance.graph.hibernate(second_canvas)
+        with self.assertRaises(ValueError):
+            gtmInstance.graph.hibernate(second_canvas)
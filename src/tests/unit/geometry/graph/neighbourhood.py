@@ -0,0 +1,39 @@
+import unittest
+
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+
+
+class VertexNeighbourhoodCases(unittest.TestCase):
+    def test_fixed_arity_sides(self):
+        gtmInstance = GeometricTileManager()
+        first_window = gtmInstance.graph.create_tile(Window, Vector(0, 0), Vector(10, 10))
+        second_window = gtmInstance.graph.create_tile(Window, Vector(20, 0), Vector(10, 10))
+        target = first_window.corners.north_east.neighbours
+
+        self.assertSequenceEqual(target[EAST], ())
+        self.assertSequenceEqual(target.south, (first_window.corners.south_east,))
+        self.assertSequenceEqual(target[WEST], (first_window.corners.north_west,))
+
+        target[EAST] = [second_window.corners.north_west, second_window.corners.south_west]
+        self.assertSequenceEqual(target.east, (second_window.corners.north_west, second_window.corners.south_west))
+
+        target.replace(EAST, -1, second_window.corners.north_east)
+        self.assertSequenceEqual(target[EAST], (second_window.corners.north_west, second_window.corners.north_east))
+
+        target[EAST] = [second_window.corners.south_west]
+        self.assertSequenceEqual(target[EAST], (second_window.corners.south_west,))
+        with self.assertRaises(IndexError):
+            target.replace(EAST, 1, second_window.corners.north_west)
+
+        target[EAST] = []
+        self.assertSequenceEqual(target[EAST], ())
+
+        #the other sides are unaffected
+        self.assertSequenceEqual(list(target), [(), (), (first_window.corners.south_east,), (first_window.corners.north_west,)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import random
+import unittest
+
+from geometry.graph.canvas import Canvas
+from geometry.graph.tile import TileTag
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from procedures.manipulation import fill_canvas_with_new_window, split_window_with_new_window
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+
+
+def covers(target, point: Vector) -> bool:
+    return (
+        target.corners.north_west.location.horizontal <= point.horizontal <= target.corners.south_east.location.horizontal
+            and
+        target.corners.north_west.location.vertical <= point.vertical <= target.corners.south_east.location.vertical
+    )
+
+
+class SpatialLookupCases(unittest.TestCase):
+    def test_tile_at_solitary_canvas(self):
+        gtmInstance = GeometricTileManager()
+        first_canvas = gtmInstance.graph.create_tile(Canvas, Vector(100, 100), Vector(300, 300))
+
+        self.assertIsNone(gtmInstance.graph.tile_at(Vector(200, 200)))
+        self.assertIs(gtmInstance.graph.tile_at(Vector(200, 200), Canvas), first_canvas)
+
+        first_window = fill_canvas_with_new_window(gtmInstance, first_canvas)
+
+        self.assertIs(gtmInstance.graph.tile_at(Vector(200, 200)), first_window)
+        self.assertIs(gtmInstance.graph.tile_at(Vector(100, 400)), first_window)
+        self.assertIsNone(gtmInstance.graph.tile_at(Vector(99, 200)))
+        self.assertIsNone(gtmInstance.graph.tile_at(Vector(200, 401)))
+
+    def test_index_follows_splits(self):
+        gtmInstance = GeometricTileManager()
+        gtmInstance.settings.static_config.constraints.window_margin = 5
+        first_canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(2000, 1000))
+        all_windows = [fill_canvas_with_new_window(gtmInstance, first_canvas)]
+
+        rng = random.Random(3)
+        for (target, direction) in ((0, EAST), (1, SOUTH), (0, NORTH), (2, WEST), (3, EAST), (1, EAST), (4, SOUTH), (5, NORTH)):
+            (each_window, _) = split_window_with_new_window(gtmInstance, all_windows[target], direction)
+            all_windows.append(each_window)
+
+        for _ in range(500):
+            point = Vector(rng.randrange(-10, 2010), rng.randrange(-10, 1010))
+            expected = [each for each in all_windows if covers(each, point)]
+            self.assertLessEqual(len(expected), 1)
+            self.assertIs(gtmInstance.graph.tile_at(point), expected[0] if len(expected) > 0 else None)
+
+        for _ in range(100):
+            (left, right) = sorted(rng.randrange(0, 2000) for _ in range(2))
+            (top, bottom) = sorted(rng.randrange(0, 1000) for _ in range(2))
+            expected = {
+                each for each in all_windows
+                if each.corners.north_west.location.horizontal <= right and left <= each.corners.south_east.location.horizontal
+                and each.corners.north_west.location.vertical <= bottom and top <= each.corners.south_east.location.vertical
+            }
+            self.assertSetEqual(set(gtmInstance.graph.tiles_intersecting(Vector(left, top), Vector(right, bottom))), expected)
+
+        self.assertSetEqual(set(gtmInstance.graph.tiles_intersecting(first_canvas)), set(all_windows))
+
+    def test_erased_tiles_are_not_found(self):
+        gtmInstance = GeometricTileManager()
+        all_windows = [gtmInstance.graph.create_tile(Window, Vector(i * 10, 0), Vector(9, 9)) for i in range(50)]
+
+        for each_window in all_windows[::2]:
+            gtmInstance.graph._erase_tile(each_window.generate_tag())
+
+        for (i, each_window) in enumerate(all_windows):
+            self.assertIs(gtmInstance.graph.tile_at(Vector(i * 10 + 5, 5)), None if i % 2 == 0 else each_window)
+
+
+class CanvasMembershipCases(unittest.TestCase):
+    def test_windows_are_placed_in_their_canvas(self):
+        gtmInstance = GeometricTileManager()
+        canvases = [gtmInstance.graph.create_tile(Canvas, Vector(i * 400, 0), Vector(400, 300)) for i in range(2)]
+        self.assertEqual(list(gtmInstance.graph.windows_in(canvases[0])), [])
+
+        first = fill_canvas_with_new_window(gtmInstance, canvases[0])
+        (second, _) = split_window_with_new_window(gtmInstance, first, EAST)
+        third = fill_canvas_with_new_window(gtmInstance, canvases[1])
+        (fourth, _) = split_window_with_new_window(gtmInstance, third, SOUTH)
+
+        self.assertEqual(list(gtmInstance.graph.windows_in(canvases[0])), [first, second])
+        self.assertEqual(list(gtmInstance.graph.windows_in(canvases[1])), [third, fourth])
+        for (each_window, each_canvas) in zip((first, second, third, fourth), (0, 0, 1, 1)):
+            self.assertIs(gtmInstance.graph.canvas_of(each_window), canvases[each_canvas])
+
+        self.assertRaises(ValueError, gtmInstance.graph.place_window, first, canvases[1])
+        self.assertIs(gtmInstance.graph.canvas_of(gtmInstance.graph.create_tile(Window, Vector(0, 0), Vector(9, 9))), None)
+
+    def test_erased_windows_are_removed(self):
+        gtmInstance = GeometricTileManager()
+        canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(400, 300))
+        first = fill_canvas_with_new_window(gtmInstance, canvas)
+        (second, _) = split_window_with_new_window(gtmInstance, first, EAST)
+
+        gtmInstance.graph._erase_tile(first.generate_tag())
+        self.assertEqual(list(gtmInstance.graph.windows_in(canvas)), [second])
+        self.assertEqual(canvas.window_count, 1)
+        self.assertIs(gtmInstance.graph.canvas_of(first), None)
+
+        gtmInstance.graph._erase_tile(canvas.generate_tag())
+        self.assertIs(gtmInstance.graph.canvas_of(second), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
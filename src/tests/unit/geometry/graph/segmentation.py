@@ -0,0 +1,140 @@
+import unittest
+
+from geometry.axis import Axis
+from geometry.graph.canvas import Canvas
+from geometry.graph.independent import IndependentBox
+from geometry.graph.segmentation import Segment, SegmentedBox, TileSegment, segment_canvas, segment_region
+from geometry.vector import Vector
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+from procedures.manipulation import fill_canvas_with_layout
+from procedures.resizing import resize_segments
+
+
+def l_shaped_layout(margin: int):
+    """
+    A full height window on the west, then two windows side by side above a wide window on the east.
+    :return: the manager, the windows, and a box enclosing all of them.
+    """
+    gtmInstance = GeometricTileManager()
+    gtmInstance.settings.static_config.constraints.window_margin = margin
+    canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(400, 300))
+    (windows, _) = fill_canvas_with_layout(gtmInstance, canvas, [
+        (Vector(0, 0), Vector(100, 300)),
+        (Vector(100 + margin, 0), Vector(150 - margin, 100)),
+        (Vector(250 + margin, 0), Vector(150 - margin, 100)),
+        (Vector(100 + margin, 100 + margin), Vector(300 - margin, 200 - margin)),
+    ])
+    return (gtmInstance, windows, IndependentBox(windows[0].corners.north_west, windows[2].corners.north_east, windows[3].corners.south_east, windows[0].corners.south_west))
+
+
+def structure(target: Segment):
+    """
+    :return: a comparable description of a segment tree: the tile of each tile segment, and the axis and corners of each segmented box.
+    """
+    if isinstance(target, TileSegment):
+        return target.source
+    return (target.segmentation_axis, tuple(target.source.corners), tuple(structure(each) for each in target.segments))
+
+
+class SegmentedBoxCases(unittest.TestCase):
+    def test_recursive_segmentation(self):
+        for margin in (0, 3):
+            (_, windows, box) = l_shaped_layout(margin)
+            target = SegmentedBox(box, Axis.HORIZONTAL, Axis.HORIZONTAL)
+
+            (first, second) = target.segments
+            self.assertIsInstance(first, TileSegment)
+            self.assertIs(first.source, windows[0])
+            self.assertIs(second.segmentation_axis, Axis.VERTICAL)
+
+            (upper, lower) = second.segments
+            self.assertIs(upper.segmentation_axis, Axis.HORIZONTAL)
+            self.assertSequenceEqual([each.source for each in upper.segments], windows[1:3])
+            self.assertIs(lower.source, windows[3])
+
+    def test_unsegmentable_axis(self):
+        """
+        There is no clean horizontal line across the whole box, so it is segmented vertically within a single segment instead.
+        """
+        (_, windows, box) = l_shaped_layout(3)
+        target = SegmentedBox(box, Axis.VERTICAL, Axis.VERTICAL)
+        self.assertEqual(len(target.segments), 1)
+        self.assertEqual(len(target.segments[0].segments), 2)
+
+    def test_pathological(self):
+        """
+        Four windows around a central one, each overlapping the next around the corners, so that no clean line crosses the box in either direction.
+        """
+        gtmInstance = GeometricTileManager()
+        canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(300, 300))
+        (windows, problems) = fill_canvas_with_layout(gtmInstance, canvas, [
+            (Vector(0, 0), Vector(200, 100)),
+            (Vector(200, 0), Vector(100, 200)),
+            (Vector(100, 200), Vector(200, 100)),
+            (Vector(0, 100), Vector(100, 200)),
+            (Vector(100, 100), Vector(100, 100)),
+        ])
+        self.assertEqual(len(problems), 0)
+        box = IndependentBox(windows[0].corners.north_west, windows[1].corners.north_east, windows[2].corners.south_east, windows[3].corners.south_west)
+        for each_axis in Axis:
+            with self.assertRaises(ValueError):
+                SegmentedBox(box, each_axis, each_axis)
+
+
+class SegmentRegionCases(unittest.TestCase):
+    def test_matches_walk(self):
+        for margin in (0, 3):
+            (gtmInstance, _, box) = l_shaped_layout(margin)
+            for each_axis in Axis:
+                self.assertEqual(structure(segment_region(gtmInstance, box, each_axis)), structure(SegmentedBox(box, each_axis, each_axis)))
+
+    def test_offset_gaps(self):
+        """
+        The margins between the windows in each row overlap, but do not line up, so no clean line crosses the box between them.
+        """
+        gtmInstance = GeometricTileManager()
+        gtmInstance.settings.static_config.constraints.window_margin = 4
+        canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(100, 100))
+        (windows, _) = fill_canvas_with_layout(gtmInstance, canvas, [
+            (Vector(0, 0), Vector(50, 48)),
+            (Vector(54, 0), Vector(46, 48)),
+            (Vector(0, 52), Vector(47, 48)),
+            (Vector(51, 52), Vector(49, 48)),
+        ])
+        target = segment_canvas(gtmInstance, canvas, Axis.HORIZONTAL)
+        self.assertEqual(len(target.segments), 1)
+        self.assertSequenceEqual([[each.source for each in each_row.segments] for each_row in target.segments[0].segments], [windows[:2], windows[2:]])
+
+    def test_pathological(self):
+        gtmInstance = GeometricTileManager()
+        canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(300, 300))
+        fill_canvas_with_layout(gtmInstance, canvas, [
+            (Vector(0, 0), Vector(200, 100)),
+            (Vector(200, 0), Vector(100, 200)),
+            (Vector(100, 200), Vector(200, 100)),
+            (Vector(0, 100), Vector(100, 200)),
+            (Vector(100, 100), Vector(100, 100)),
+        ])
+        for each_axis in Axis:
+            with self.assertRaises(ValueError):
+                segment_canvas(gtmInstance, canvas, each_axis)
+
+    def test_cached_per_canvas(self):
+        (gtmInstance, windows, box) = l_shaped_layout(3)
+        canvas = next(iter(gtmInstance.graph.by_type[Canvas].values()))
+        target = segment_canvas(gtmInstance, canvas, Axis.HORIZONTAL)
+        self.assertEqual(structure(target), structure(SegmentedBox(box, Axis.HORIZONTAL, Axis.HORIZONTAL)))
+        self.assertIs(segment_canvas(gtmInstance, canvas, Axis.HORIZONTAL), target)
+        self.assertIsNot(segment_canvas(gtmInstance, canvas, Axis.VERTICAL), target)
+
+        #resizing touches the windows, so the tree is rebuilt from their new locations.
+        resize_segments(gtmInstance, target, {0: 150})
+        rebuilt = segment_canvas(gtmInstance, canvas, Axis.HORIZONTAL)
+        self.assertIsNot(rebuilt, target)
+        self.assertEqual(rebuilt.segments[0].source.corners.north_east.location.horizontal, 150)
+        self.assertEqual(structure(rebuilt), structure(SegmentedBox(box, Axis.HORIZONTAL, Axis.HORIZONTAL)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+
+from geometry.axis import Axis
+from geometry.graph.canvas import Canvas
+from geometry.graph.snapshot import read_snapshot, write_snapshot
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from procedures.audit import audit
+from procedures.manipulation import fill_canvas_with_layout, split_window_with_new_window
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+from unit.geometry.graph.segmentation import l_shaped_layout
+
+
+def round_trip(gtmInstance: GeometricTileManager) -> GeometricTileManager:
+    """
+    :return: a new manager with the graph of the given one, after writing it to a snapshot and reading it back.
+    """
+    result = GeometricTileManager()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'session.gtms')
+        write_snapshot(gtmInstance.graph, path)
+        result.graph = read_snapshot(path)
+    return result
+
+
+def describe(gtmInstance: GeometricTileManager):
+    """
+    :return: a comparable description of every tile in terms of tags rather than objects, so that separate graphs can be compared.
+    """
+    def tag(target):
+        return None if target is None else target.generate_tag()
+
+    graph = gtmInstance.graph
+    return [
+        (each_class, each.id, each.name, tag(graph.canvas_of(each)) if each_class is Window else each.window_count, tuple(each_corner.location for each_corner in each.corners), tuple(tuple(map(tag, each_corner.neighbours.entries)) for each_corner in each.corners))
+        for each_class in (Canvas, Window)
+        for each in sorted(graph.by_type[each_class].values(), key=lambda x: x.id)
+    ]
+
+
+class SnapshotCases(unittest.TestCase):
+    def test_round_trip(self):
+        (gtmInstance, windows, _) = l_shaped_layout(4)
+        gtmInstance.graph.name_tile(windows[1], 'términal')
+
+        restored = round_trip(gtmInstance)
+
+        self.assertEqual(describe(restored), describe(gtmInstance))
+        self.assertEqual(restored.graph[windows[1].generate_tag()].id, windows[1].id)
+        self.assertEqual(audit(restored), [])
+
+    def test_lookups_are_rebuilt(self):
+        (gtmInstance, windows, _) = l_shaped_layout(4)
+
+        restored = round_trip(gtmInstance)
+
+        for each_point in (Vector(50, 50), Vector(200, 10), Vector(300, 200), Vector(102, 50)):
+            self.assertEqual(*(None if each is None else each.generate_tag() for each in (gtmInstance.graph.tile_at(each_point), restored.graph.tile_at(each_point))))
+        for each_axis in Axis:
+            for each_value in gtmInstance.graph.alignment.lines(each_axis, 0, 400):
+                self.assertEqual(*(sorted(str(each.generate_tag()) for each in each_graph.alignment.aligned(each_axis, each_value)) for each_graph in (gtmInstance.graph, restored.graph)))
+
+    def test_restored_graph_can_be_manipulated(self):
+        (gtmInstance, windows, _) = l_shaped_layout(4)
+        restored = round_trip(gtmInstance)
+        target = restored.graph[windows[3].generate_tag()]
+
+        (new_window, problems) = split_window_with_new_window(restored, target, EAST)
+
+        self.assertEqual(problems, [])
+        self.assertGreater(new_window.id.number, max(each.id.number for each in gtmInstance.graph.by_type[Window].values()))
+        self.assertIn(new_window, restored.graph.windows_in(restored.graph.canvas_of(target)))
+        self.assertEqual(audit(restored), [])
+
+    def test_multiple_canvases(self):
+        gtmInstance = GeometricTileManager()
+        for each_offset in (0, 1000, 2000):
+            canvas = gtmInstance.graph.create_tile(Canvas, Vector(each_offset, 0), Vector(300, 200))
+            fill_canvas_with_layout(gtmInstance, canvas, [(Vector(each_offset + i * 100, 0), Vector(100, 200)) for i in range(3)])
+
+        restored = round_trip(gtmInstance)
+
+        self.assertEqual(describe(restored), describe(gtmInstance))
+        self.assertEqual([each.window_count for each in restored.graph.by_type[Canvas].values()], [3, 3, 3])
+        self.assertEqual(audit(restored), [])
+
+    def test_empty_registry(self):
+        restored = round_trip(GeometricTileManager())
+
+        self.assertEqual(describe(restored), [])
+        self.assertEqual(restored.graph.create_tile(Canvas, Vector(0, 0), Vector(10, 10)).id.number, 0)
+
+    def test_rejects_other_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'session.gtms')
+            write_snapshot(l_shaped_layout(4)[0].graph, path)
+            with open(path, 'rb') as file:
+                contents = file.read()
+            for each_contents in (b'', b'not a snapshot' * 4, contents[:-4], contents[:4] + bytes([2]) + contents[5:]):
+                with open(path, 'wb') as file:
+                    file.write(each_contents)
+                with self.assertRaises(ValueError):
+                    read_snapshot(path)
+
+    def test_write_within_transaction(self):
+        (gtmInstance, _, _) = l_shaped_layout(4)
+        with tempfile.TemporaryDirectory() as directory:
+            with gtmInstance.transaction():
+                with self.assertRaises(ValueError):
+                    write_snapshot(gtmInstance.graph, os.path.join(directory, 'session.gtms'))
@@ -0,0 +1,106 @@
+import collections
+import unittest
+
+from geometry.axis import Axis
+from geometry.direction.constants import *
+from geometry.graph.canvas import Canvas
+from geometry.vector import Vector
+from procedures.audit import audit
+from manager import GeometricTileManager
+from procedures.examination import validate_all
+from procedures.manipulation import fill_canvas_with_new_window
+from procedures.resizing import ResizeSession
+from problems.edge import BrokenEdgeProblem, NotAxisAlignedProblem, OutOfOrderProblem
+from problems.vertex import AsymmetricNeighbourProblem, NeighbourAbsenceProblem, NeighbourPlacementProblem, UnmatchedCornerProblem
+from unit.geometry.graph.segmentation import l_shaped_layout
+
+
+def described(problems):
+    """
+    :return: a comparable multiset of the type of each problem and the graph objects it refers to.
+    """
+    return collections.Counter(
+        (each.__class__, getattr(each, 'edge', None), getattr(each, 'vertex', None), getattr(each, 'direction', None), getattr(each, 'axis', None))
+        for each in problems
+    )
+
+
+class AuditCases(unittest.TestCase):
+    def test_clean_layouts(self):
+        for each_margin in (0, 3):
+            (gtmInstance, windows, _) = l_shaped_layout(each_margin)
+            self.assertEqual(audit(gtmInstance), [])
+
+            session = ResizeSession(gtmInstance)
+            session.begin(windows[3].sides[NORTH], Axis.VERTICAL)
+            session.update(-30)
+            session.commit()
+            self.assertEqual(audit(gtmInstance), [])
+
+    def test_matches_validate(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        windows[1].corners.north_east.neighbours[WEST] = []
+        windows[3].corners.south_west.neighbours[SOUTH] = []
+
+        problems = audit(gtmInstance)
+        self.assertEqual(described(each for each in problems if not isinstance(each, AsymmetricNeighbourProblem)), described(validate_all(gtmInstance)))
+        self.assertEqual(described(problems), described([
+            BrokenEdgeProblem(windows[1].sides[NORTH]),
+            NeighbourAbsenceProblem(windows[1].corners.north_east, WEST),
+            NeighbourAbsenceProblem(windows[3].corners.south_west, SOUTH),
+            #the north west corner still faces the north east corner, which no longer faces back.
+            AsymmetricNeighbourProblem(windows[1].corners.north_west, EAST, windows[1].corners.north_east),
+        ]))
+
+    def test_misaligned(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        windows[2].corners.south_east.location = Vector(390, 110)
+
+        problems = audit(gtmInstance)
+        self.assertEqual(described(each for each in problems if isinstance(each, (NotAxisAlignedProblem, OutOfOrderProblem))), described([
+            NotAxisAlignedProblem(windows[2].sides[EAST]),
+            NotAxisAlignedProblem(windows[2].sides[SOUTH]),
+            OutOfOrderProblem(windows[2].sides[EAST], Axis.HORIZONTAL),
+        ]))
+
+    def test_misplaced_links(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        #a link across a window to the one beyond it, which does not face back.
+        windows[0].corners.north_east.neighbours[EAST] = [windows[2].corners.north_west]
+        #a link to a vertex which is not aligned.
+        windows[0].corners.south_east.neighbours[EAST] = [windows[3].corners.north_west]
+
+        problems = audit(gtmInstance)
+        self.assertIn(described([AsymmetricNeighbourProblem(windows[0].corners.north_east, EAST, windows[2].corners.north_west)]), [described([each]) for each in problems])
+        self.assertIn(described([NeighbourPlacementProblem(windows[0].corners.south_east, EAST)]), [described([each]) for each in problems])
+
+    def test_unmatched_canvas_corner(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        canvas = windows[0].corners.north_west.neighbours[NORTH][0].owner
+        canvas.corners.north_west.neighbours[EAST] = [windows[1].corners.north_west]
+
+        self.assertIn(described([UnmatchedCornerProblem(canvas.corners.north_west, EAST)]), [described([each]) for each in audit(gtmInstance)])
+
+    def test_empty_canvas(self):
+        gtmInstance = GeometricTileManager()
+        canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(100, 100))
+        self.assertEqual(audit(gtmInstance), validate_all(gtmInstance))
+        self.assertEqual(audit(gtmInstance), [])
+
+        #a canvas which is only partly linked along its sides is not empty.
+        fill_canvas_with_new_window(gtmInstance, canvas)
+        canvas.corners.north_west.neighbours[EAST] = [canvas.corners.north_east]
+        problems = audit(gtmInstance)
+        self.assertEqual(described(each for each in problems if isinstance(each, UnmatchedCornerProblem)), described([UnmatchedCornerProblem(canvas.corners.north_west, EAST)]))
+
+    def test_cyclic_side(self):
+        #the path along the north side of the second window leads back into the first, and never reaches its north east corner.
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        windows[1].corners.north_west.neighbours[EAST] = [windows[0].corners.north_east]
+
+        problems = audit(gtmInstance)
+        self.assertIn(described([BrokenEdgeProblem(windows[1].sides[NORTH])]), [described([each]) for each in problems])
+
+
+if __name__ == '__main__':
+    unittest.main()
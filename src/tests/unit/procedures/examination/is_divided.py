@@ -0,0 +1,66 @@
+import unittest
+
+from geometry.direction.constants import *
+from geometry.graph.canvas import Canvas
+from geometry.graph.neighbourhood import InteriorCanvasNeighbourhood
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from manager import GeometricTileManager
+from procedures.examination import is_divided
+from procedures.manipulation import fill_canvas_with_layout, fill_canvas_with_new_window, split_window_with_new_window, split_window_with_new_windows
+from unit.geometry.graph.segmentation import l_shaped_layout
+
+
+class IsDividedCases(unittest.TestCase):
+    def test_fill_and_split(self):
+        gtmInstance = GeometricTileManager()
+        canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(400, 300))
+        self.assertFalse(is_divided(canvas))
+        self.assertEqual(canvas.window_count, 0)
+        self.assertEqual(InteriorCanvasNeighbourhood(canvas)[NORTH], ())
+
+        window = fill_canvas_with_new_window(gtmInstance, canvas)
+        self.assertTrue(is_divided(canvas))
+        self.assertEqual(canvas.window_count, 1)
+        self.assertRaises(ValueError, fill_canvas_with_new_window, gtmInstance, canvas)
+
+        split_window_with_new_window(gtmInstance, window, EAST)
+        split_window_with_new_windows(gtmInstance, window, SOUTH, 3)
+        self.assertEqual(canvas.window_count, 5)
+        self.assertEqual(canvas.window_count, len(gtmInstance.graph.by_type[Window]))
+
+    def test_layout(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        canvas = gtmInstance.graph.canvas_of(windows[0])
+        self.assertEqual(canvas.window_count, 4)
+        self.assertTrue(is_divided(canvas))
+        self.assertRaises(ValueError, fill_canvas_with_layout, gtmInstance, canvas, [])
+
+    def test_linked_directly(self):
+        #the window is linked to the corners of the canvas without being placed within it.
+        gtmInstance = GeometricTileManager()
+        canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(400, 300))
+        window = gtmInstance.graph.create_tile(Window, Vector(0, 0), Vector(400, 300))
+        for (each_corner, each_direction) in ((NORTH_WEST, EAST), (NORTH_EAST, WEST), (SOUTH_EAST, WEST), (SOUTH_WEST, EAST)):
+            canvas.corners[each_corner].neighbours[each_direction] = [window.corners[each_corner]]
+
+        self.assertEqual(canvas.window_count, 0)
+        self.assertTrue(is_divided(canvas))
+        self.assertFalse(is_divided(window))
+
+    def test_adjacent_canvases(self):
+        #the east side of the first canvas is the west side of the second, so windows along it touch both.
+        gtmInstance = GeometricTileManager()
+        canvases = [gtmInstance.graph.create_tile(Canvas, Vector(i * 400, 0), Vector(400, 300)) for i in range(2)]
+        (first, second) = (fill_canvas_with_new_window(gtmInstance, each) for each in canvases)
+        split_window_with_new_window(gtmInstance, first, EAST)
+        split_window_with_new_window(gtmInstance, second, WEST)
+        split_window_with_new_window(gtmInstance, second, EAST)
+
+        self.assertEqual([each.window_count for each in canvases], [2, 3])
+        self.assertIs(gtmInstance.graph.canvas_of(first), canvases[0])
+        self.assertIs(gtmInstance.graph.canvas_of(second), canvases[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+from geometry.axis import Axis
+from geometry.direction.constants import *
+from geometry.vector import Vector
+from procedures.examination import validate, validate_all, validate_dirty
+from procedures.manipulation import split_window_with_new_window
+from procedures.resizing import ResizeSession
+from problems.vertex import NeighbourAbsenceProblem
+from unit.geometry.graph.segmentation import l_shaped_layout
+
+
+class ValidateDirtyCases(unittest.TestCase):
+    def test_created_tiles_are_dirty(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        self.assertEqual(set(gtmInstance.dirty), {*windows, windows[0].corners.north_west.neighbours[WEST][0].owner})
+
+        self.assertEqual(validate_dirty(gtmInstance), [])
+        self.assertEqual(len(gtmInstance.dirty), 0)
+        self.assertEqual(validate_dirty(gtmInstance), [])
+
+    def test_only_touched_tiles_are_dirty(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        validate_all(gtmInstance)
+
+        (new_window, problems) = split_window_with_new_window(gtmInstance, windows[2], SOUTH)
+        self.assertEqual(problems, [])
+        self.assertIn(new_window, gtmInstance.dirty)
+        self.assertIn(windows[2], gtmInstance.dirty)
+        self.assertNotIn(windows[0], gtmInstance.dirty)
+        self.assertEqual(validate_dirty(gtmInstance), [])
+
+        session = ResizeSession(gtmInstance)
+        session.begin(windows[0].sides[EAST], Axis.HORIZONTAL)
+        session.update(20)
+        session.commit()
+        self.assertIn(windows[0], gtmInstance.dirty)
+        self.assertEqual(validate_dirty(gtmInstance), [])
+
+    def test_moved_tiles_are_dirty(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        canvas = gtmInstance.graph.canvas_of(windows[0])
+        validate_all(gtmInstance)
+
+        gtmInstance.graph.translate_tiles([canvas, *windows], Vector(1000, 0))
+        self.assertEqual(set(gtmInstance.dirty), {canvas, *windows})
+        self.assertEqual(validate_dirty(gtmInstance), [])
+
+        gtmInstance.graph.scale_tiles([canvas], canvas.corners.north_west.location, 1, 1)
+        self.assertEqual(set(gtmInstance.dirty), {canvas})
+        validate_dirty(gtmInstance)
+
+        slots = [each.slot for each in windows[1].sides[EAST]]
+        gtmInstance.graph.assign_components([windows[1]], slots, Axis.HORIZONTAL, [each.location[Axis.HORIZONTAL] for each in windows[1].sides[EAST]])
+        self.assertEqual(set(gtmInstance.dirty), {windows[1]})
+
+    def test_neighbours_are_validated(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        validate_all(gtmInstance)
+
+        #corrupt a neighbour of the touched window, and a window that is not adjacent to it.
+        windows[1].corners.north_west.neighbours[NORTH] = []
+        windows[2].corners.north_east.neighbours[NORTH] = []
+        windows[0].touch()
+
+        problems = validate_dirty(gtmInstance)
+        self.assertEqual([(each.__class__, each.vertex) for each in problems], [(NeighbourAbsenceProblem, windows[1].corners.north_west)])
+        self.assertEqual(len(validate_all(gtmInstance)), 2)
+
+    def test_erased_tiles_are_forgotten(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        validate_all(gtmInstance)
+        windows[1].touch()
+        gtmInstance.graph._erase_tile(windows[1].generate_tag())
+        self.assertEqual(len(gtmInstance.dirty), 0)
+
+        #the links of the neighbours still lead to the erased window, but it is not validated.
+        windows[0].touch()
+        self.assertEqual(validate_dirty(gtmInstance), validate(windows[0]) + validate(windows[3]))
+
+
+if __name__ == '__main__':
+    unittest.main()
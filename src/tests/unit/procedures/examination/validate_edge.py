@@ -0,0 +1,61 @@
+import unittest
+
+from geometry.axis import Axis
+from geometry.direction.constants import *
+from geometry.graph.edge import Edge
+from geometry.vector import Vector
+from procedures.examination import validate
+from problems.edge import BrokenEdgeProblem, NotAxisAlignedProblem, OutOfOrderProblem
+from unit.geometry.graph.segmentation import l_shaped_layout
+
+
+class ValidateEdgeCases(unittest.TestCase):
+    def test_intact(self):
+        for each_margin in (0, 3):
+            (gtmInstance, windows, _) = l_shaped_layout(each_margin)
+            canvas = windows[0].corners.north_west.neighbours[WEST][0].owner
+            for each_tile in (canvas, *windows):
+                for each_side in each_tile.sides:
+                    self.assertEqual(validate(each_side), [])
+
+    def test_not_axis_aligned(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        windows[2].corners.north_east.location = Vector(400, 10)
+
+        problems = validate(windows[2].sides[NORTH])
+        self.assertEqual([each.__class__ for each in problems], [NotAxisAlignedProblem])
+        problems = validate(windows[2].sides[EAST])
+        self.assertEqual(problems, [])
+
+        windows[2].corners.north_east.location = Vector(240, 0)
+        problems = validate(windows[2].sides[NORTH])
+        self.assertEqual([(each.__class__, each.axis) for each in problems], [(OutOfOrderProblem, Axis.HORIZONTAL)])
+
+    def test_leaves_line(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        windows[0].corners.north_west.neighbours[EAST] = [windows[0].corners.south_east]
+
+        problems = validate(windows[0].sides[NORTH])
+        self.assertEqual([each.__class__ for each in problems], [BrokenEdgeProblem])
+
+    def test_cycle(self):
+        #without margins, the north east corner of the first window lies at the same location as the north west corner of the second, so a link back between them is a cycle along the north side of the canvas which never advances.
+        (gtmInstance, windows, _) = l_shaped_layout(0)
+        canvas = windows[0].corners.north_west.neighbours[WEST][0].owner
+        windows[1].corners.north_west.neighbours[EAST] = [windows[0].corners.north_east]
+
+        problems = validate(canvas.sides[NORTH])
+        self.assertEqual([each.__class__ for each in problems], [BrokenEdgeProblem])
+
+    def test_cycle_backward(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        windows[1].corners.north_west.neighbours[EAST] = [windows[0].corners.north_west]
+
+        problems = validate(windows[1].sides[NORTH])
+        self.assertEqual([each.__class__ for each in problems], [BrokenEdgeProblem])
+        problems = validate(Edge(windows[0].corners.north_west, windows[1].corners.north_east))
+        self.assertEqual([each.__class__ for each in problems], [BrokenEdgeProblem])
+
+
+if __name__ == '__main__':
+    unittest.main()
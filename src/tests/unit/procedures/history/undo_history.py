@@ -0,0 +1,182 @@
+import os
+import tempfile
+import unittest
+
+from geometry.axis import Axis
+from geometry.direction.constants import *
+from geometry.graph.snapshot import write_snapshot
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from procedures.audit import audit
+from procedures.history import UndoHistory
+from procedures.manipulation import split_window_with_new_window, split_window_with_new_windows
+from procedures.preview import preview
+from procedures.resizing import ResizeSession
+from unit.geometry.graph.hibernation import linked_canvases
+from unit.geometry.graph.segmentation import l_shaped_layout
+from unit.geometry.graph.snapshot import describe
+from unit.procedures.transaction.transaction import snapshot
+
+
+class UndoHistoryCases(unittest.TestCase):
+    def test_undo_and_redo(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        gtmInstance.history = UndoHistory(gtmInstance)
+        states = [snapshot(gtmInstance)]
+
+        with gtmInstance.transaction():
+            split_window_with_new_window(gtmInstance, windows[3], EAST)
+        states.append(snapshot(gtmInstance))
+        with gtmInstance.transaction():
+            session = ResizeSession(gtmInstance)
+            session.begin(windows[1].sides[EAST], Axis.HORIZONTAL)
+            session.update(-40)
+            session.commit()
+        states.append(snapshot(gtmInstance))
+        with gtmInstance.transaction():
+            split_window_with_new_windows(gtmInstance, windows[0], SOUTH, 2)
+            gtmInstance.graph._erase_tile(windows[2].generate_tag())
+        states.append(snapshot(gtmInstance))
+        self.assertEqual(len(gtmInstance.history), 3)
+
+        for each_state in reversed(states[:-1]):
+            self.assertIsNotNone(gtmInstance.history.undo())
+            self.assertEqual(snapshot(gtmInstance), each_state)
+        self.assertIsNone(gtmInstance.history.undo())
+        self.assertEqual(audit(gtmInstance), [])
+
+        for each_state in states[1:]:
+            self.assertIsNotNone(gtmInstance.history.redo())
+            self.assertEqual(snapshot(gtmInstance), each_state)
+        self.assertIsNone(gtmInstance.history.redo())
+
+    def test_recording_discards_redo(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        gtmInstance.history = UndoHistory(gtmInstance)
+        changes = []
+        gtmInstance.listeners.append(changes.append)
+
+        with gtmInstance.transaction():
+            (new_window, _) = split_window_with_new_window(gtmInstance, windows[3], EAST)
+        change = gtmInstance.history.undo()
+        self.assertEqual(changes[-1], change)
+        self.assertIs(gtmInstance.graph.tile_at(Vector(350, 200)), windows[3])
+        self.assertTrue(gtmInstance.history.can_redo)
+
+        with gtmInstance.transaction():
+            split_window_with_new_window(gtmInstance, windows[3], SOUTH)
+        self.assertFalse(gtmInstance.history.can_redo)
+        self.assertEqual(len(gtmInstance.history), 1)
+        self.assertEqual(audit(gtmInstance), [])
+
+    def test_budget(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        gtmInstance.history = UndoHistory(gtmInstance, budget=20000)
+
+        target = windows[3]
+        for _ in range(10):
+            with gtmInstance.transaction():
+                (target, _) = split_window_with_new_window(gtmInstance, target, EAST)
+            self.assertLessEqual(gtmInstance.history.nbytes, gtmInstance.history.budget)
+        self.assertLess(len(gtmInstance.history), 10)
+        self.assertGreater(len(gtmInstance.history), 0)
+
+        while gtmInstance.history.can_undo:
+            gtmInstance.history.undo()
+        self.assertEqual(audit(gtmInstance), [])
+
+        gtmInstance.history.clear()
+        self.assertEqual(gtmInstance.history.nbytes, 0)
+
+    def test_manipulated_outside_transaction(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        gtmInstance.history = UndoHistory(gtmInstance)
+        with gtmInstance.transaction():
+            split_window_with_new_window(gtmInstance, windows[3], EAST)
+        split_window_with_new_window(gtmInstance, windows[0], SOUTH)
+        expected = snapshot(gtmInstance)
+
+        self.assertFalse(gtmInstance.history.can_undo)
+        self.assertIsNone(gtmInstance.history.undo())
+        self.assertEqual(snapshot(gtmInstance), expected)
+        self.assertEqual(len(gtmInstance.history), 0)
+
+        #manipulations recorded from then on can be undone as usual.
+        with gtmInstance.transaction():
+            split_window_with_new_window(gtmInstance, windows[1], SOUTH)
+        self.assertIsNotNone(gtmInstance.history.undo())
+        self.assertEqual(snapshot(gtmInstance), expected)
+
+    def test_moved_outside_transaction(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        gtmInstance.history = UndoHistory(gtmInstance)
+        with gtmInstance.transaction():
+            split_window_with_new_window(gtmInstance, windows[3], EAST)
+        all_tiles = [gtmInstance.graph.canvas_of(windows[0]), *gtmInstance.graph.by_type[Window].values()]
+        gtmInstance.graph.translate_tiles(all_tiles, Vector(1000, 0))
+        expected = snapshot(gtmInstance)
+
+        self.assertFalse(gtmInstance.history.can_undo)
+        self.assertIsNone(gtmInstance.history.undo())
+        self.assertEqual(snapshot(gtmInstance), expected)
+        self.assertEqual(audit(gtmInstance), [])
+
+    def test_rollback_is_not_a_manipulation(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        gtmInstance.history = UndoHistory(gtmInstance)
+        expected = snapshot(gtmInstance)
+        with gtmInstance.transaction():
+            split_window_with_new_window(gtmInstance, windows[3], EAST)
+        with gtmInstance.transaction() as transaction:
+            split_window_with_new_window(gtmInstance, windows[0], SOUTH)
+            transaction.abort()
+        preview(gtmInstance, split_window_with_new_window, windows[1], SOUTH)
+
+        self.assertIsNotNone(gtmInstance.history.undo())
+        self.assertEqual(snapshot(gtmInstance), expected)
+
+    def test_hibernation_is_not_a_manipulation(self):
+        (gtmInstance, first_canvas, second_canvas) = linked_canvases()
+        gtmInstance.history = UndoHistory(gtmInstance)
+        expected = describe(gtmInstance)
+        with gtmInstance.transaction():
+            split_window_with_new_window(gtmInstance, next(iter(gtmInstance.graph.windows_in(first_canvas))), SOUTH)
+
+        gtmInstance.graph.hibernate(second_canvas)
+        gtmInstance.graph[second_canvas.generate_tag()]
+        gtmInstance.graph.hibernate(second_canvas)
+        with tempfile.TemporaryDirectory() as directory:
+            write_snapshot(gtmInstance.graph, os.path.join(directory, 'session.gtms'))
+        self.assertTrue(gtmInstance.history.can_undo)
+
+        gtmInstance.graph.rehydrate(second_canvas)
+        self.assertIsNotNone(gtmInstance.history.undo())
+        self.assertEqual(describe(gtmInstance), expected)
+        self.assertEqual(audit(gtmInstance), [])
+
+    def test_hibernated_tiles_are_not_restored(self):
+        (gtmInstance, first_canvas, second_canvas) = linked_canvases()
+        gtmInstance.history = UndoHistory(gtmInstance)
+        with gtmInstance.transaction():
+            split_window_with_new_window(gtmInstance, next(iter(gtmInstance.graph.windows_in(second_canvas))), SOUTH)
+
+        gtmInstance.graph.hibernate(second_canvas)
+        gtmInstance.graph.rehydrate(second_canvas)
+        expected = snapshot(gtmInstance)
+
+        self.assertFalse(gtmInstance.history.can_undo)
+        self.assertIsNone(gtmInstance.history.undo())
+        self.assertEqual(snapshot(gtmInstance), expected)
+        self.assertEqual(len(gtmInstance.history), 0)
+
+    def test_within_transaction(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        gtmInstance.history = UndoHistory(gtmInstance)
+        with gtmInstance.transaction():
+            split_window_with_new_window(gtmInstance, windows[3], EAST)
+        with gtmInstance.transaction():
+            self.assertRaises(ValueError, gtmInstance.history.undo)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from geometry.graph.canvas import Canvas
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from procedures.manipulation import connect_facing_vertex_lines, fill_canvas_with_new_window, split_window_with_new_window, split_window_with_new_windows
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+
+
+def stacked_pair(gtmInstance, left):
+    """
+    Creates two windows of height 50, one above the other, meeting at a height of 50 with no margin.
+    :return: the upper and lower windows.
+    """
+    return tuple(gtmInstance.graph.create_tile(Window, Vector(left, each), Vector(100, 50)) for each in (0, 50))
+
+
+class ConnectFacingVertexLinesCases(unittest.TestCase):
+    def test_coincident_prefers_same_side(self):
+        gtmInstance = GeometricTileManager()
+        (upper_west, lower_west) = stacked_pair(gtmInstance, 0)
+        (upper_east, lower_east) = stacked_pair(gtmInstance, 100)
+        west_line = [upper_west.corners.north_east, upper_west.corners.south_east, lower_west.corners.north_east, lower_west.corners.south_east]
+        east_line = [upper_east.corners.north_west, upper_east.corners.south_west, lower_east.corners.north_west, lower_east.corners.south_west]
+
+        connect_facing_vertex_lines(east_line, west_line, WEST)
+
+        #the end of the upper side faces the end of the other upper side, and the start of the lower side the start of the other lower side.
+        self.assertSequenceEqual(upper_east.corners.south_west.neighbours[WEST], [upper_west.corners.south_east])
+        self.assertSequenceEqual(lower_east.corners.north_west.neighbours[WEST], [lower_west.corners.north_east])
+        self.assertSequenceEqual(upper_east.corners.north_west.neighbours[WEST], [upper_west.corners.north_east])
+        self.assertSequenceEqual(lower_east.corners.south_west.neighbours[WEST], [lower_west.corners.south_east])
+
+    def test_coincident_on_other_line_only(self):
+        gtmInstance = GeometricTileManager()
+        (upper_west, lower_west) = stacked_pair(gtmInstance, 0)
+        east = gtmInstance.graph.create_tile(Window, Vector(100, 50), Vector(100, 50))
+        west_line = [upper_west.corners.north_east, upper_west.corners.south_east, lower_west.corners.north_east, lower_west.corners.south_east]
+
+        connect_facing_vertex_lines([east.corners.north_west, east.corners.south_west], west_line, WEST)
+
+        self.assertSequenceEqual(east.corners.north_west.neighbours[WEST], [lower_west.corners.north_east])
+        self.assertSequenceEqual(east.corners.south_west.neighbours[WEST], [lower_west.corners.south_east])
+
+    def test_split_links_coincident_corners(self):
+        gtmInstance = GeometricTileManager()
+        gtmInstance.settings.static_config.constraints.window_margin = 0
+        canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(200, 100))
+        west = fill_canvas_with_new_window(gtmInstance, canvas)
+        (east, _) = split_window_with_new_window(gtmInstance, west, EAST)
+        ((lower_west,), _) = split_window_with_new_windows(gtmInstance, west, SOUTH, 1)
+        ((lower_east,), _) = split_window_with_new_windows(gtmInstance, east, SOUTH, 1)
+
+        self.assertSequenceEqual(east.corners.south_west.neighbours[WEST], [west.corners.south_east])
+        self.assertSequenceEqual(lower_east.corners.north_west.neighbours[WEST], [lower_west.corners.north_east])
+        self.assertSequenceEqual(west.corners.south_east.neighbours[EAST], [east.corners.south_west])
+        self.assertSequenceEqual(lower_west.corners.north_east.neighbours[EAST], [lower_east.corners.north_west])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+from geometry.graph.canvas import Canvas
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+from procedures.manipulation import fill_canvas_with_layout, fill_canvas_with_new_window, split_window_with_new_window
+
+
+def neighbour_locations(gtmInstance: GeometricTileManager) -> set:
+    """
+    Describes every neighbour relationship by location and role, so that layouts built in different ways can be compared.
+    """
+    describe = lambda vertex: (vertex.owner.__class__, vertex.role, vertex.location)
+    return {
+        (describe(each_corner), each_direction, tuple(map(describe, each_corner.neighbours[each_direction])))
+        for each_class in (Window, Canvas)
+        for each_tile in gtmInstance.graph.by_type[each_class].values()
+        for each_corner in each_tile.corners
+        for each_direction in (NORTH, EAST, SOUTH, WEST)
+    }
+
+
+class FillCanvasWithLayoutCases(unittest.TestCase):
+    def test_matches_incremental_splits(self):
+        for margin in (0, 3):
+            incremental = GeometricTileManager()
+            incremental.settings.static_config.constraints.window_margin = margin
+            canvas = incremental.graph.create_tile(Canvas, Vector(0, 0), Vector(100, 100))
+            first = fill_canvas_with_new_window(incremental, canvas)
+            (second, _) = split_window_with_new_window(incremental, first, EAST)
+            split_window_with_new_window(incremental, second, SOUTH)
+
+            bulk = GeometricTileManager()
+            bulk.settings.static_config.constraints.window_margin = margin
+            (windows, problems) = fill_canvas_with_layout(bulk, bulk.graph.create_tile(Canvas, Vector(0, 0), Vector(100, 100)), [
+                (each.corners.north_west.location, each.corners.south_east.location - each.corners.north_west.location)
+                for each in incremental.graph.by_type[Window].values()
+            ])
+
+            self.assertEqual(len(problems), 0)
+            self.assertEqual(len(windows), 3)
+            self.assertEqual(neighbour_locations(bulk), neighbour_locations(incremental))
+
+    def test_staggered_rows(self):
+        """
+        Rows of windows whose boundaries are offset from each other, so that corners face gaps and the middle of other windows' sides.
+        """
+        gtmInstance = GeometricTileManager()
+        canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(400, 300))
+        rows = ([0, 150, 250, 400], [0, 100, 200, 300, 400], [0, 150, 250, 400])
+        rectangles = [
+            (Vector(start + (0 if start == 0 else 1), row_index * 100 + (0 if row_index == 0 else 1)), Vector(end - start - (0 if start == 0 else 1), 99 if row_index != 1 else 98))
+            for (row_index, boundaries) in enumerate(rows)
+            for (start, end) in zip(boundaries, boundaries[1:])
+        ]
+        (windows, problems) = fill_canvas_with_layout(gtmInstance, canvas, rectangles)
+        self.assertEqual(len(problems), 0)
+
+        (top_left, top_middle, top_right, middle_first, middle_second) = windows[:5]
+        self.assertSequenceEqual(top_left.corners.north_west.neighbours[NORTH], [canvas.corners.north_west])
+        self.assertSequenceEqual(top_middle.corners.north_west.neighbours[NORTH], [canvas.corners.north_west, canvas.corners.north_east])
+        self.assertSequenceEqual(canvas.corners.north_east.neighbours[SOUTH], [top_right.corners.north_east])
+        #corners facing the middle of a side are bracketed by its corners.
+        self.assertSequenceEqual(middle_first.corners.north_east.neighbours[NORTH], [top_left.corners.south_west, top_left.corners.south_east])
+        self.assertSequenceEqual(middle_second.corners.north_east.neighbours[NORTH], [top_middle.corners.south_west, top_middle.corners.south_east])
+        self.assertSequenceEqual(top_left.corners.south_east.neighbours[EAST], [top_middle.corners.south_west])
+
+    def test_divided_canvas(self):
+        gtmInstance = GeometricTileManager()
+        canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(100, 100))
+        fill_canvas_with_new_window(gtmInstance, canvas)
+        with self.assertRaises(ValueError):
+            fill_canvas_with_layout(gtmInstance, canvas, [(Vector(0, 0), Vector(100, 100))])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,7 @@ from geometry.vector import Vector
 from procedures.manipulation import establish_connections_along_injection_axis, \
     repair_connections_along_perpendicular_axis
 from geometry.direction.constants import *
+from layouts import build_row
 from manager import GeometricTileManager
 
 
@@ -78,6 +79,41 @@ class MyTestCase(unittest.TestCase):
         for each_vertex in lower_inner_vertices:
             self.assertSequenceEqual(each_vertex.neighbours.south, first_canvas.sides.south)
 
+    def test_staggered_rows_between_windows(self):
+        """
+        A row of windows is repaired against rows above and below it which are offset by half a window, so that every inner vertex lies between two vertices of the facing line.
+        """
+        gtmInstance = GeometricTileManager()
+
+        upper = build_row(gtmInstance, [0, 150, 250, 401], 0, 99)
+        middle = build_row(gtmInstance, [0, 100, 200, 300, 401], 100, 99)
+        lower = build_row(gtmInstance, [0, 150, 250, 401], 200, 99)
+
+        repair_connections_along_perpendicular_axis(VERTICAL,
+                                                    Edge(upper[0].corners.south_west, upper[-1].corners.south_east),
+                                                    Edge(middle[0].corners.north_west, middle[-1].corners.north_east),
+                                                    Edge(lower[0].corners.north_west, lower[-1].corners.north_east),
+                                                    Edge(middle[0].corners.south_west, middle[-1].corners.south_east))
+
+        for (each_direction, each_outer_row) in ((NORTH, upper), (SOUTH, lower)):
+            outer_line = [each_corner for each_window in each_outer_row for each_corner in each_window.sides[each_direction.opposite]]
+            inner_line = [each_corner for each_window in middle for each_corner in each_window.sides[each_direction]]
+
+            #the ends are aligned, everything else lies strictly between the nearest vertices on the opposite line.
+            self.assertSequenceEqual(inner_line[0].neighbours[each_direction], [outer_line[0]])
+            self.assertSequenceEqual(inner_line[-1].neighbours[each_direction], [outer_line[-1]])
+            self.assertSequenceEqual(outer_line[0].neighbours[each_direction.opposite], [inner_line[0]])
+            self.assertSequenceEqual(outer_line[-1].neighbours[each_direction.opposite], [inner_line[-1]])
+
+            for (targets, others, facing_direction) in ((inner_line[1:-1], outer_line, each_direction), (outer_line[1:-1], inner_line, each_direction.opposite)):
+                for each_target in targets:
+                    position = each_target.location.horizontal
+                    expected = [
+                        max((each for each in others if each.location.horizontal < position), key=lambda x: x.location.horizontal),
+                        min((each for each in others if each.location.horizontal > position), key=lambda x: x.location.horizontal)
+                    ]
+                    self.assertSequenceEqual(each_target.neighbours[facing_direction], expected)
+
 
 if __name__ == '__main__':
     unittest.main()
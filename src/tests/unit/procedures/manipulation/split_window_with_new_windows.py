@@ -0,0 +1,92 @@
+import unittest
+
+from geometry.graph.canvas import Canvas
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+from problems.box import BoxTooSmallForMarginsProblem
+from procedures.manipulation import allocate_segments, fill_canvas_with_layout, fill_canvas_with_new_window, split_window_with_new_window, split_window_with_new_windows
+from unit.procedures.manipulation.fill_canvas_with_layout import neighbour_locations
+
+
+class AllocateSegmentsCases(unittest.TestCase):
+    def test_residual_to_first_segments(self):
+        (segments, fits) = allocate_segments(100, 3, 5)
+        self.assertTrue(fits)
+        self.assertSequenceEqual(segments, [(0, 30), (35, 65), (70, 100)])
+
+        (segments, fits) = allocate_segments(103, 4, 3)
+        self.assertTrue(fits)
+        self.assertSequenceEqual(segments, [(0, 24), (27, 51), (54, 77), (80, 103)])
+
+    def test_exact_fill(self):
+        for space in range(16, 200):
+            for count in range(1, 17):
+                (segments, fits) = allocate_segments(space, count, 0 if count == 1 else min(7, (space - count) // (count - 1)))
+                self.assertTrue(fits)
+                self.assertEqual(segments[0][0], 0)
+                self.assertEqual(segments[-1][1], space)
+                sizes = [end - start for (start, end) in segments]
+                self.assertLessEqual(max(sizes) - min(sizes), 1)
+                self.assertSequenceEqual(sizes, sorted(sizes, reverse=True))
+
+    def test_too_small_for_margins(self):
+        (segments, fits) = allocate_segments(10, 3, 5)
+        self.assertFalse(fits)
+        self.assertSequenceEqual(segments, [(0, 1), (5, 6), (9, 10)])
+
+    def test_too_small_for_segments(self):
+        (segments, fits) = allocate_segments(2, 3, 5)
+        self.assertFalse(fits)
+        self.assertSequenceEqual(segments, [(0, 2)] * 3)
+
+
+class SplitWindowWithNewWindowsCases(unittest.TestCase):
+    def test_matches_layout(self):
+        for margin in (0, 3):
+            for direction in (NORTH, EAST, SOUTH, WEST):
+                gtmInstance = GeometricTileManager()
+                gtmInstance.settings.static_config.constraints.window_margin = margin
+                canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(300, 200))
+                first = fill_canvas_with_new_window(gtmInstance, canvas)
+                (bottom, _) = split_window_with_new_window(gtmInstance, first, SOUTH)
+                (created, problems) = split_window_with_new_windows(gtmInstance, first, direction, 7)
+                self.assertEqual(len(problems), 0)
+                self.assertEqual(len(created), 7)
+
+                #the new windows are created in order moving away from the old window.
+                for (each_window, next_window) in zip((first, *created), created):
+                    self.assertSequenceEqual(each_window.sides[direction].a.neighbours[direction], [next_window.sides[direction.opposite].a])
+
+                expected = GeometricTileManager()
+                expected.settings.static_config.constraints.window_margin = margin
+                (_, problems) = fill_canvas_with_layout(expected, expected.graph.create_tile(Canvas, Vector(0, 0), Vector(300, 200)), [
+                    (each.corners.north_west.location, each.corners.south_east.location - each.corners.north_west.location)
+                    for each in gtmInstance.graph.by_type[Window].values()
+                ])
+                self.assertEqual(len(problems), 0)
+                self.assertEqual(neighbour_locations(gtmInstance), neighbour_locations(expected))
+
+    def test_too_small_for_margins(self):
+        gtmInstance = GeometricTileManager()
+        gtmInstance.settings.static_config.constraints.window_margin = 5
+        canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(10, 100))
+        first = fill_canvas_with_new_window(gtmInstance, canvas)
+        (created, problems) = split_window_with_new_windows(gtmInstance, first, EAST, 2)
+        self.assertIsInstance(problems[0], BoxTooSmallForMarginsProblem)
+        self.assertSequenceEqual(
+            [each.corners.north_west.location.horizontal for each in (first, *created)],
+            [0, 5, 9]
+        )
+
+    def test_invalid_count(self):
+        gtmInstance = GeometricTileManager()
+        canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(100, 100))
+        first = fill_canvas_with_new_window(gtmInstance, canvas)
+        with self.assertRaises(ValueError):
+            split_window_with_new_windows(gtmInstance, first, EAST, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from unittest import mock
+
+from geometry.direction.cardinal import CardinalDirection
+from geometry.graph.canvas import Canvas
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+from procedures.manipulation import fill_canvas_with_new_window, split_window_with_new_window
+from procedures.navigation import FocusTable, next_tile, next_undivided_tile
+
+
+class FocusTableCases(unittest.TestCase):
+    def assertMatchesNavigation(self, gtmInstance: GeometricTileManager, tables: tuple[FocusTable, FocusTable]):
+        (undivided_table, plain_table) = tables
+        for each_tile in (*gtmInstance.graph.by_type[Window].values(), *gtmInstance.graph.by_type[Canvas].values()):
+            for each_direction in CardinalDirection:
+                self.assertIs(undivided_table[each_tile, each_direction], next_undivided_tile(gtmInstance, each_tile, each_direction))
+                self.assertIs(plain_table[each_tile, each_direction], next_tile(gtmInstance, each_tile, each_direction))
+
+    def test_follows_manipulations(self):
+        gtmInstance = GeometricTileManager()
+        canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(120, 120))
+        tables = (FocusTable(gtmInstance), FocusTable(gtmInstance, undivided=False))
+
+        first = fill_canvas_with_new_window(gtmInstance, canvas)
+        self.assertMatchesNavigation(gtmInstance, tables)
+
+        (second, _) = split_window_with_new_window(gtmInstance, first, EAST)
+        self.assertMatchesNavigation(gtmInstance, tables)
+        self.assertIs(tables[0][first, EAST], second)
+
+        (third, _) = split_window_with_new_window(gtmInstance, second, SOUTH)
+        self.assertMatchesNavigation(gtmInstance, tables)
+        self.assertIs(tables[0][third, WEST], first)
+
+        split_window_with_new_window(gtmInstance, first, SOUTH)
+        self.assertMatchesNavigation(gtmInstance, tables)
+
+    def test_three_columns(self):
+        gtmInstance = GeometricTileManager()
+        canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(300, 100))
+        tables = (FocusTable(gtmInstance), FocusTable(gtmInstance, undivided=False))
+        first = fill_canvas_with_new_window(gtmInstance, canvas)
+        (second, _) = split_window_with_new_window(gtmInstance, first, EAST)
+        (third, _) = split_window_with_new_window(gtmInstance, second, EAST)
+
+        self.assertMatchesNavigation(gtmInstance, tables)
+        self.assertIsNone(tables[0][second, NORTH])
+        self.assertIs(tables[1][second, SOUTH], canvas)
+
+    def test_lookups_do_not_recompute(self):
+        gtmInstance = GeometricTileManager()
+        canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(100, 100))
+        first = fill_canvas_with_new_window(gtmInstance, canvas)
+        (second, _) = split_window_with_new_window(gtmInstance, first, EAST)
+        table = FocusTable(gtmInstance)
+        table.refresh((first, second))
+
+        with mock.patch.object(FocusTable, '_compute', autospec=True, side_effect=FocusTable._compute) as compute:
+            for _ in range(3):
+                self.assertIs(table[first, EAST], second)
+                self.assertIs(table[second, WEST], first)
+            compute.assert_not_called()
+
+            split_window_with_new_window(gtmInstance, second, SOUTH)
+            self.assertIs(table[first, EAST], second)
+            compute.assert_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from geometry.graph.canvas import Canvas
+from geometry.graph.neighbourhood import NarrowTileNeighbourhood, WideTileNeighbourhood
+from geometry.vector import Vector
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+from procedures.manipulation import fill_canvas_with_layout, fill_canvas_with_new_window, split_window_with_new_window
+from procedures.navigation import next_tile
+
+
+class NextTileCases(unittest.TestCase):
+    def setUp(self):
+        self.gtmInstance = GeometricTileManager()
+        self.canvas = self.gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(100, 100))
+        self.left = fill_canvas_with_new_window(self.gtmInstance, self.canvas)
+        (self.right, _) = split_window_with_new_window(self.gtmInstance, self.left, EAST)
+
+    def test_navigates_between_siblings(self):
+        self.assertIs(next_tile(self.gtmInstance, self.left, EAST), self.right)
+        self.assertIs(next_tile(self.gtmInstance, self.right, WEST), self.left)
+        self.assertIs(next_tile(self.gtmInstance, self.left, WEST), self.canvas)
+        self.assertIsNone(next_tile(self.gtmInstance, self.canvas, WEST))
+
+    def test_sides_within_a_gap(self):
+        for (margin, left) in ((0, 200), (1, 600)):
+            self.gtmInstance.settings.static_config.constraints.window_margin = margin
+            canvas = self.gtmInstance.graph.create_tile(Canvas, Vector(left, 0), Vector(300, 200))
+            (windows, _) = fill_canvas_with_layout(self.gtmInstance, canvas, [
+                (Vector(left, 0), Vector(300, 100 - margin)),
+                *((Vector(left + each, 100), Vector(100 - margin, 100)) for each in (0, 100)),
+                (Vector(left + 200, 100), Vector(100, 100)),
+            ])
+
+            self.assertIs(next_tile(self.gtmInstance, windows[2], NORTH), windows[0])
+            self.assertIs(next_tile(self.gtmInstance, windows[2], SOUTH), canvas)
+            for each_variant in (NarrowTileNeighbourhood, WideTileNeighbourhood):
+                self.assertSequenceEqual(each_variant(windows[2])[NORTH], [windows[0]])
+                self.assertSequenceEqual(each_variant(windows[2])[SOUTH], [canvas])
+
+    def test_repeated_lookups_are_cached(self):
+        for each_variant in (NarrowTileNeighbourhood, WideTileNeighbourhood):
+            first = each_variant(self.left)[EAST]
+            self.assertIs(each_variant(self.left)[EAST], first)
+
+        #variants with different tiebreaking are cached separately.
+        self.assertIsNot(NarrowTileNeighbourhood(self.left)[NORTH], WideTileNeighbourhood(self.left)[NORTH])
+
+    def test_manipulations_invalidate_dependent_tiles(self):
+        untouched_generation = self.left.generation
+        self.assertSequenceEqual(NarrowTileNeighbourhood(self.left)[EAST], [self.right])
+
+        (lower, _) = split_window_with_new_window(self.gtmInstance, self.right, SOUTH)
+
+        self.assertGreater(self.right.generation, untouched_generation)
+        self.assertSequenceEqual(NarrowTileNeighbourhood(self.left)[EAST], [self.right, lower])
+        self.assertIs(next_tile(self.gtmInstance, lower, WEST), self.left)
+        self.assertIs(next_tile(self.gtmInstance, self.left, EAST), self.right)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+
+from geometry.axis import Axis
+from geometry.direction.constants import *
+from geometry.vector import Vector
+from procedures.audit import audit
+from procedures.examination import validate_all
+from procedures.history import UndoHistory
+from procedures.manipulation import split_window_with_new_window
+from procedures.navigation import FocusTable
+from procedures.preview import preview
+from procedures.resizing import ResizeSession
+from unit.geometry.graph.segmentation import l_shaped_layout
+from unit.procedures.transaction.transaction import snapshot
+
+
+def drag(manager, target, axis, offset):
+    session = ResizeSession(manager)
+    session.begin(target, axis)
+    session.update(offset)
+    session.commit()
+
+
+class CountingFocusTable(FocusTable):
+    """
+    Counts how many entries have been computed rather than found in the table.
+    """
+    __slots__ = ('computed',)
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.computed = 0
+
+    def _compute(self, initial, direction):
+        self.computed += 1
+        return super()._compute(initial, direction)
+
+
+class PreviewCases(unittest.TestCase):
+    def test_split(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        gtmInstance.history = UndoHistory(gtmInstance)
+        changes = []
+        gtmInstance.listeners.append(changes.append)
+        validate_all(gtmInstance)
+        before = snapshot(gtmInstance)
+
+        result = preview(gtmInstance, split_window_with_new_window, windows[3], EAST)
+        (new_window, problems) = result.result
+        self.assertEqual(result.created, [new_window])
+        self.assertEqual(result.problems, [])
+
+        self.assertEqual(snapshot(gtmInstance), before)
+        self.assertEqual(changes, [])
+        self.assertEqual(len(gtmInstance.history), 0)
+        self.assertEqual(len(gtmInstance.dirty), 0)
+        self.assertIs(gtmInstance.graph.tile_at(Vector(350, 200)), windows[3])
+        self.assertEqual(audit(gtmInstance), [])
+
+        #the preview matches the split once it is actually made.
+        (actual, _) = split_window_with_new_window(gtmInstance, windows[3], EAST)
+        self.assertEqual(result.corners[windows[3]], tuple(each.location for each in windows[3].corners))
+        self.assertEqual(result.corners[new_window], tuple(each.location for each in actual.corners))
+
+    def test_caches_kept(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        focus = CountingFocusTable(gtmInstance)
+        keys = [(windows[0], EAST), (windows[1], SOUTH), (windows[2], WEST), (windows[3], NORTH), (windows[3], WEST)]
+        targets = [focus[each] for each in keys]
+        (computed, generations) = (focus.computed, [each.generation for each in windows])
+
+        result = preview(gtmInstance, split_window_with_new_window, windows[3], EAST)
+
+        self.assertEqual([focus[each] for each in keys], targets)
+        self.assertEqual(focus.computed, computed)
+        self.assertEqual([each.generation for each in windows], generations)
+        #the ids taken by the preview are given back.
+        (new_window, _) = split_window_with_new_window(gtmInstance, windows[3], EAST)
+        self.assertEqual(new_window.id, result.created[0].id)
+        self.assertIs(focus[windows[3], EAST], new_window)
+
+    def test_resize(self):
+        (gtmInstance, windows, _) = l_shaped_layout(0)
+        before = snapshot(gtmInstance)
+
+        result = preview(gtmInstance, drag, windows[1].sides[EAST], Axis.HORIZONTAL, -40)
+        self.assertEqual(result.corners[windows[1]][1], Vector(210, 0))
+        self.assertEqual(result.corners[windows[2]][0], Vector(210, 0))
+        self.assertEqual(result.created, [])
+        self.assertEqual(snapshot(gtmInstance), before)
+
+    def test_exception(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        before = snapshot(gtmInstance)
+
+        def failing(manager):
+            split_window_with_new_window(manager, windows[3], EAST)
+            raise RuntimeError()
+
+        self.assertRaises(RuntimeError, preview, gtmInstance, failing)
+        self.assertEqual(snapshot(gtmInstance), before)
+        self.assertFalse(gtmInstance.graph.journal.active)
+
+
+if __name__ == '__main__':
+    unittest.main()
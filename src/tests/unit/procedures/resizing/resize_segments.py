@@ -0,0 +1,101 @@
+import unittest
+
+import numpy as np
+
+from geometry.axis import Axis
+from geometry.graph.canvas import Canvas
+from geometry.graph.independent import IndependentBox
+from geometry.graph.segmentation import SegmentedBox
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+from problems.box import BoxTooSmallForConstraintsProblem
+from procedures.examination import validate
+from procedures.manipulation import fill_canvas_with_layout
+from procedures.resizing import ResizePlan, resize_segments, scale_sizes
+from unit.geometry.graph.segmentation import l_shaped_layout
+from unit.procedures.manipulation.fill_canvas_with_layout import neighbour_locations
+
+
+def bounds(target: Window) -> tuple[int, int, int, int]:
+    (north_west, south_east) = (target.corners.north_west.location, target.corners.south_east.location)
+    return (north_west.horizontal, north_west.vertical, south_east.horizontal, south_east.vertical)
+
+
+class ScaleSizesCases(unittest.TestCase):
+    def test_exact(self):
+        self.assertSequenceEqual(scale_sizes(10, np.array([1, 1, 1])).tolist(), [4, 3, 3])
+        self.assertSequenceEqual(scale_sizes(100, np.array([10, 20, 30])).tolist(), [17, 33, 50])
+        self.assertSequenceEqual(scale_sizes(7, np.array([0, 0])).tolist(), [4, 3])
+
+    def test_remainder_to_smaller_segments(self):
+        #both have a fractional part of 1/2, so the smaller one is rounded up.
+        self.assertSequenceEqual(scale_sizes(5, np.array([6, 4])).tolist(), [3, 2])
+        self.assertSequenceEqual(scale_sizes(5, np.array([4, 6])).tolist(), [2, 3])
+        self.assertSequenceEqual(scale_sizes(3, np.array([4, 2])).tolist(), [2, 1])
+
+
+class ResizeSegmentsCases(unittest.TestCase):
+    def test_scales_remaining_segments(self):
+        for margin in (0, 3):
+            (gtmInstance, windows, box) = l_shaped_layout(margin)
+            problems = resize_segments(gtmInstance, SegmentedBox(box, Axis.HORIZONTAL, Axis.HORIZONTAL), {0: 200})
+            self.assertEqual(len(problems), 0)
+
+            self.assertEqual(bounds(windows[0]), (0, 0, 200, 300))
+            #the remaining 200 - margin is shared by the upper windows in proportion to their old sizes, with the margin between them preserved.
+            remaining = 200 - margin
+            upper_sizes = scale_sizes(remaining - margin, np.array([150 - margin, 150 - margin])).tolist()
+            self.assertEqual(bounds(windows[1]), (200 + margin, 0, 200 + margin + upper_sizes[0], 100))
+            self.assertEqual(bounds(windows[2]), (400 - upper_sizes[1], 0, 400, 100))
+            self.assertEqual(bounds(windows[3]), (200 + margin, 100 + margin, 400, 300))
+
+            for each_window in windows:
+                self.assertEqual(len(validate(each_window)), 0)
+
+    def test_matches_layout(self):
+        """
+        Resizing moves vertices past others on the lines parallel to the axis, so they must be re-linked to match a layout built from scratch.
+        """
+        for margin in (0, 4):
+            gtmInstance = GeometricTileManager()
+            gtmInstance.settings.static_config.constraints.window_margin = margin
+            canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(300, 200))
+            (windows, _) = fill_canvas_with_layout(gtmInstance, canvas, [
+                (Vector(0, 0), Vector(60, 100)),
+                (Vector(60 + margin, 0), Vector(90 - margin, 100)),
+                (Vector(150 + margin, 0), Vector(150 - margin, 100)),
+                (Vector(0, 100 + margin), Vector(140, 100 - margin)),
+                (Vector(140 + margin, 100 + margin), Vector(160 - margin, 100 - margin)),
+            ])
+            target = SegmentedBox(IndependentBox(*(windows[index].corners[each] for (index, each) in ((0, NORTH_WEST), (2, NORTH_EAST), (4, SOUTH_EAST), (3, SOUTH_WEST)))), Axis.VERTICAL, Axis.VERTICAL)
+            plan = ResizePlan(gtmInstance, target)
+            for each_size in (30, 150, 100 - margin):
+                self.assertEqual(len(plan.resize({0: each_size})), 0)
+
+            #shrink the first window of the lower row until its side passes those of the upper row.
+            lower = target.segments[1]
+            problems = ResizePlan(gtmInstance, SegmentedBox(lower.source, Axis.HORIZONTAL, Axis.HORIZONTAL)).resize({0: 20})
+            self.assertEqual(len(problems), 0)
+
+            expected = GeometricTileManager()
+            expected.settings.static_config.constraints.window_margin = margin
+            (_, problems) = fill_canvas_with_layout(expected, expected.graph.create_tile(Canvas, Vector(0, 0), Vector(300, 200)), [
+                (each.corners.north_west.location, each.corners.south_east.location - each.corners.north_west.location)
+                for each in windows
+            ])
+            self.assertEqual(len(problems), 0)
+            self.assertEqual(neighbour_locations(gtmInstance), neighbour_locations(expected))
+
+    def test_conflicting_requests(self):
+        (gtmInstance, windows, box) = l_shaped_layout(3)
+        problems = resize_segments(gtmInstance, SegmentedBox(box, Axis.HORIZONTAL, Axis.HORIZONTAL), {0: 398})
+        self.assertIsInstance(problems[0], BoxTooSmallForConstraintsProblem)
+        #the outer dimensions are still met exactly.
+        self.assertEqual(bounds(windows[2])[2], 400)
+        self.assertEqual(bounds(windows[0])[0], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import unittest
+
+from geometry.axis import Axis
+from geometry.graph.canvas import Canvas
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from geometry.direction.constants import *
+from manager import GeometricTileManager
+from procedures.examination import validate
+from procedures.manipulation import fill_canvas_with_layout, fill_canvas_with_new_window
+from procedures.resizing import ResizeSession
+from unit.geometry.graph.segmentation import l_shaped_layout
+from unit.procedures.manipulation.fill_canvas_with_layout import neighbour_locations
+from unit.procedures.resizing.resize_segments import bounds
+
+
+def rebuilt_relationships(gtmInstance: GeometricTileManager, margin: int):
+    """
+    :return: the neighbour relationships of a fresh layout with the same windows, for comparison with one that has been manipulated.
+    """
+    rebuilt = GeometricTileManager()
+    rebuilt.settings.static_config.constraints.window_margin = margin
+    canvas = next(iter(gtmInstance.graph.by_type[Canvas].values()))
+    rebuilt_canvas = rebuilt.graph.create_tile(Canvas, canvas.corners.north_west.location, canvas.corners.south_east.location - canvas.corners.north_west.location)
+    fill_canvas_with_layout(rebuilt, rebuilt_canvas, [
+        (each.corners.north_west.location, each.corners.south_east.location - each.corners.north_west.location)
+        for each in gtmInstance.graph.by_type[Window].values()
+    ])
+    return neighbour_locations(rebuilt)
+
+
+class ResizeSessionCases(unittest.TestCase):
+    def test_drag_into_column(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        session = ResizeSession(gtmInstance)
+        session.begin(windows[0].sides[EAST], Axis.HORIZONTAL)
+        #each update is relative to where the drag began.
+        for each_offset in (80, -20, 50):
+            self.assertEqual(len(session.update(each_offset)), 0)
+        session.commit()
+
+        self.assertFalse(session.is_active)
+        self.assertEqual(bounds(windows[0]), (0, 0, 150, 300))
+        self.assertEqual(bounds(windows[3])[::2], (153, 400))
+        self.assertEqual(neighbour_locations(gtmInstance), rebuilt_relationships(gtmInstance, 3))
+
+    def test_drag_row_boundary(self):
+        """
+        The south side of the second window borders a wider window, so both windows above it are dragged along with it.
+        """
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        session = ResizeSession(gtmInstance)
+        session.begin(windows[1].sides[SOUTH], Axis.VERTICAL)
+        session.update(40)
+        session.commit()
+
+        self.assertEqual([bounds(each)[3] for each in windows[1:3]], [140, 140])
+        self.assertEqual(bounds(windows[3])[1], 143)
+        self.assertEqual(bounds(windows[0]), (0, 0, 100, 300))
+        self.assertEqual(neighbour_locations(gtmInstance), rebuilt_relationships(gtmInstance, 3))
+
+    def test_drag_clamped(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        session = ResizeSession(gtmInstance)
+        session.begin(windows[3].sides[NORTH], Axis.VERTICAL)
+        self.assertEqual(len(session.update(-1000)), 0)
+        session.commit()
+
+        self.assertEqual([bounds(each)[3] for each in windows[1:3]], [1, 1])
+        self.assertEqual(bounds(windows[3])[1], 4)
+        for each_window in windows:
+            self.assertEqual(len(validate(each_window)), 0)
+
+    def test_links_unchanged_until_commit(self):
+        """
+        Two windows above two others, with the boundaries between them offset. Dragging the boundary above past the one below changes which vertices face each other.
+        """
+        gtmInstance = GeometricTileManager()
+        gtmInstance.settings.static_config.constraints.window_margin = 2
+        canvas = gtmInstance.graph.create_tile(Canvas, Vector(0, 0), Vector(300, 200))
+        (windows, _) = fill_canvas_with_layout(gtmInstance, canvas, [
+            (Vector(0, 0), Vector(100, 99)),
+            (Vector(102, 0), Vector(198, 99)),
+            (Vector(0, 101), Vector(200, 99)),
+            (Vector(202, 101), Vector(98, 99)),
+        ])
+        links = lambda: [tuple(each_corner.neighbours) for each_window in windows for each_corner in each_window.corners]
+        initial_links = links()
+
+        session = ResizeSession(gtmInstance)
+        session.begin(windows[0].sides[EAST], Axis.HORIZONTAL)
+        session.update(150)
+        self.assertEqual(links(), initial_links)
+        session.commit()
+
+        self.assertEqual(bounds(windows[0]), (0, 0, 250, 99))
+        self.assertNotEqual(links(), initial_links)
+        self.assertEqual(neighbour_locations(gtmInstance), rebuilt_relationships(gtmInstance, 2))
+
+    def test_canvas_sharing_border(self):
+        """
+        Another canvas shares the north border of the canvas, so it also intersects the windows along that border. Either canvas may be created first.
+        """
+        for above_first in (True, False):
+            gtmInstance = GeometricTileManager()
+            gtmInstance.settings.static_config.constraints.window_margin = 3
+            canvases = {each: gtmInstance.graph.create_tile(Canvas, Vector(0, each), Vector(400, 300)) for each in ((-300, 0) if above_first else (0, -300))}
+            (above, canvas) = (canvases[-300], canvases[0])
+            fill_canvas_with_new_window(gtmInstance, above)
+            (windows, _) = fill_canvas_with_layout(gtmInstance, canvas, [
+                (Vector(0, 0), Vector(100, 300)),
+                (Vector(103, 0), Vector(147, 100)),
+                (Vector(253, 0), Vector(147, 100)),
+                (Vector(103, 103), Vector(297, 197)),
+            ])
+
+            session = ResizeSession(gtmInstance)
+            session.begin(windows[1].sides[SOUTH], Axis.VERTICAL)
+            session.update(40)
+            session.commit()
+
+            self.assertEqual([bounds(each)[3] for each in windows[1:3]], [140, 140])
+            self.assertEqual(bounds(windows[3])[1], 143)
+
+    def test_cancel(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        (initial_bounds, initial_relationships) = ([bounds(each) for each in windows], neighbour_locations(gtmInstance))
+        session = ResizeSession(gtmInstance)
+        session.begin(windows[2].sides[WEST], Axis.HORIZONTAL)
+        session.update(-120)
+        session.cancel()
+
+        self.assertEqual([bounds(each) for each in windows], initial_bounds)
+        self.assertEqual(neighbour_locations(gtmInstance), initial_relationships)
+
+    def test_invalid(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        session = ResizeSession(gtmInstance)
+        with self.assertRaises(ValueError):
+            session.update(10)
+        with self.assertRaises(ValueError):
+            session.begin(windows[0].sides[WEST], Axis.HORIZONTAL)
+        with self.assertRaises(ValueError):
+            session.begin(windows[0].sides[EAST], Axis.VERTICAL)
+
+        session.begin(windows[0].sides[EAST], Axis.HORIZONTAL)
+        with self.assertRaises(ValueError):
+            session.begin(windows[1].sides[SOUTH], Axis.VERTICAL)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from geometry.axis import Axis
+from geometry.direction.constants import *
+from procedures.resizing import ResizeSession
+from procedures.selection import find_parallel_end
+from unit.geometry.graph.segmentation import l_shaped_layout
+
+
+class FindParallelEndCases(unittest.TestCase):
+    def test_clean_column(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        self.assertEqual(find_parallel_end(gtmInstance, windows[0].sides[EAST], EAST), (windows[2].corners.north_east, windows[3].corners.south_east))
+        self.assertEqual(find_parallel_end(gtmInstance, windows[3].sides[NORTH], NORTH), (windows[1].corners.north_west, windows[2].corners.north_east))
+        self.assertEqual(find_parallel_end(gtmInstance, windows[2].sides[WEST], WEST), (windows[1].corners.north_west, windows[1].corners.south_west))
+
+    def test_no_clean_column(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        #the south side of the second window borders the wider window beneath it.
+        self.assertIsNone(find_parallel_end(gtmInstance, windows[1].sides[SOUTH], SOUTH))
+        #the west side of the first window borders the canvas.
+        self.assertIsNone(find_parallel_end(gtmInstance, windows[0].sides[WEST], WEST))
+
+    def test_without_margin(self):
+        #the corners of neighbouring tiles coincide, and tiles on both sides of each line have corners on it.
+        (gtmInstance, windows, _) = l_shaped_layout(0)
+        self.assertEqual(find_parallel_end(gtmInstance, windows[0].sides[EAST], EAST), (windows[2].corners.north_east, windows[3].corners.south_east))
+        self.assertEqual(find_parallel_end(gtmInstance, windows[3].sides[NORTH], NORTH), (windows[1].corners.north_west, windows[2].corners.north_east))
+        self.assertIsNone(find_parallel_end(gtmInstance, windows[1].sides[SOUTH], SOUTH))
+
+    def test_after_resize(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        session = ResizeSession(gtmInstance)
+        session.begin(windows[0].sides[EAST], Axis.HORIZONTAL)
+        session.update(40)
+        session.commit()
+        self.assertEqual(find_parallel_end(gtmInstance, windows[0].sides[EAST], EAST), (windows[2].corners.north_east, windows[3].corners.south_east))
+        self.assertEqual(find_parallel_end(gtmInstance, windows[2].sides[WEST], WEST), (windows[1].corners.north_west, windows[1].corners.south_west))
+
+
+if __name__ == '__main__':
+    unittest.main()
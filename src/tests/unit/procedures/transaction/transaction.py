@@ -0,0 +1,102 @@
+import unittest
+
+from geometry.axis import Axis
+from geometry.direction.constants import *
+from geometry.graph.canvas import Canvas
+from geometry.graph.window import Window
+from geometry.vector import Vector
+from procedures.audit import audit
+from procedures.manipulation import split_window_with_new_window, split_window_with_new_windows
+from procedures.resizing import ResizeSession
+from unit.geometry.graph.segmentation import l_shaped_layout
+
+
+def snapshot(gtmInstance):
+    """
+    :return: a comparable description of every tile: its corners' locations and neighbours, and its canvas membership. Tiles are listed by id, since restored tiles are listed after the others by the registry.
+    """
+    graph = gtmInstance.graph
+    (canvases, windows) = (sorted(graph.by_type[each].values(), key=lambda x: x.id) for each in (Canvas, Window))
+    return (
+        [(each, each.window_count, sorted(graph.windows_in(each), key=lambda x: x.id), tuple(each_corner.location for each_corner in each.corners)) for each in canvases],
+        [(each, graph.canvas_of(each), tuple(each_corner.location for each_corner in each.corners), tuple(each_corner.neighbours.entries for each_corner in each.corners)) for each in windows],
+        [tuple(each_corner.neighbours.entries for each_corner in each.corners) for each in canvases],
+    )
+
+
+class TransactionCases(unittest.TestCase):
+    def test_commit_notifies_once(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        changes = []
+        gtmInstance.listeners.append(changes.append)
+
+        with gtmInstance.transaction() as transaction:
+            (new_window, _) = split_window_with_new_window(gtmInstance, windows[3], EAST)
+            split_window_with_new_windows(gtmInstance, windows[0], SOUTH, 2)
+            self.assertEqual(changes, [])
+
+        self.assertEqual(changes, [transaction.change])
+        self.assertEqual(transaction.change.problems, [])
+        self.assertIn(new_window, transaction.change.tiles)
+        self.assertIn(windows[0], transaction.change.tiles)
+        self.assertFalse(gtmInstance.graph.journal.active)
+        self.assertEqual(audit(gtmInstance), [])
+
+    def test_exception_rolls_back(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        changes = []
+        gtmInstance.listeners.append(changes.append)
+        before = snapshot(gtmInstance)
+
+        with self.assertRaises(RuntimeError):
+            with gtmInstance.transaction():
+                split_window_with_new_window(gtmInstance, windows[3], EAST)
+                session = ResizeSession(gtmInstance)
+                session.begin(windows[1].sides[EAST], Axis.HORIZONTAL)
+                session.update(-40)
+                session.commit()
+                raise RuntimeError()
+
+        self.assertEqual(snapshot(gtmInstance), before)
+        self.assertEqual(changes, [])
+        self.assertEqual(audit(gtmInstance), [])
+        self.assertIs(gtmInstance.graph.tile_at(Vector(200, 50)), windows[1])
+        self.assertEqual(set(gtmInstance.graph.alignment.aligned(Axis.HORIZONTAL, 250)), {windows[1].corners.north_east, windows[1].corners.south_east})
+
+    def test_abort(self):
+        (gtmInstance, windows, _) = l_shaped_layout(0)
+        before = snapshot(gtmInstance)
+
+        with gtmInstance.transaction() as transaction:
+            split_window_with_new_windows(gtmInstance, windows[2], SOUTH, 3)
+            gtmInstance.graph.create_tile(Canvas, Vector(500, 0), Vector(100, 100))
+            transaction.abort()
+            self.assertRaises(ValueError, transaction.commit)
+
+        self.assertEqual(snapshot(gtmInstance), before)
+        self.assertIs(transaction.change, None)
+
+    def test_restrictions(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        with gtmInstance.transaction():
+            with self.assertRaises(ValueError):
+                with gtmInstance.transaction():
+                    pass
+
+    def test_erasure_rolls_back(self):
+        (gtmInstance, windows, _) = l_shaped_layout(3)
+        gtmInstance.graph.name_tile(windows[1], 'second')
+        before = snapshot(gtmInstance)
+
+        with gtmInstance.transaction() as transaction:
+            gtmInstance.graph._erase_tile(windows[1].generate_tag())
+            self.assertIs(gtmInstance.graph.tile_at(Vector(200, 50)), None)
+            transaction.abort()
+
+        self.assertEqual(snapshot(gtmInstance), before)
+        self.assertIs(gtmInstance.graph[windows[1].generate_tag()], windows[1])
+        self.assertIs(gtmInstance.graph.tile_at(Vector(200, 50)), windows[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import copy
+import dataclasses
+import pickle
+import unittest
+
+from geometry.axis import AxisDataclass
+from geometry.graph.box import Box
+from geometry.vector import Vector
+from geometry.direction.constants import *
+from utility.enum_data import enum_dataclass
+
+
+class CompiledEnumDataclassCases(unittest.TestCase):
+    def test_access_by_member_name_and_iteration(self):
+        target = Vector(3, 4)
+
+        self.assertEqual(target[HORIZONTAL], 3)
+        self.assertEqual(target[VERTICAL], 4)
+        self.assertEqual(target.horizontal, 3)
+        self.assertEqual(target.vertical, 4)
+        self.assertListEqual(list(target), [3, 4])
+        self.assertEqual(Vector(horizontal=3, vertical=4), target)
+        self.assertEqual(Vector._make({VERTICAL: 4, HORIZONTAL: 3}), target)
+        self.assertEqual(repr(target), 'Vector(horizontal=3, vertical=4)')
+
+    def test_immutable_and_hashable(self):
+        target = Vector(3, 4)
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            target[HORIZONTAL] = 5
+        with self.assertRaises(AttributeError):
+            target.horizontal = 5
+        self.assertFalse(hasattr(target, '__dict__'))
+        self.assertEqual(len({target, Vector(3, 4), Vector(4, 3)}), 2)
+
+    def test_not_a_tuple(self):
+        target = Vector(3, 4)
+
+        self.assertNotEqual(target, (3, 4))
+        self.assertNotEqual((3, 4), target)
+        self.assertNotEqual(Box.Corners(1, 2, 3, 4), (1, 2, 3, 4))
+        with self.assertRaises(TypeError):
+            target < Vector(4, 3)
+        with self.assertRaises(TypeError):
+            (3, 4) <= target
+        with self.assertRaises(TypeError):
+            Box.Corners(1, 2, 3, 4) + Box.Corners(1, 2, 3, 4)
+        with self.assertRaises(TypeError):
+            2 * Box.Corners(1, 2, 3, 4)
+        self.assertEqual(2 * target, Vector(6, 8))
+
+    def test_replace_and_copy(self):
+        target = Vector(3, 4)
+
+        self.assertEqual(target._replace({VERTICAL: 7}), Vector(3, 7))
+        self.assertIsInstance(target._replace({VERTICAL: 7}), Vector)
+        self.assertDictEqual(target._as_dict(), {HORIZONTAL: 3, VERTICAL: 4})
+        self.assertEqual(copy.deepcopy(target), target)
+        self.assertEqual(pickle.loads(pickle.dumps(target)), target)
+
+    def test_nested_class(self):
+        self.assertEqual(Box.Corners.__qualname__, 'Box.Corners')
+        self.assertListEqual(list(Box.Corners(1, 2, 3, 4)), [1, 2, 3, 4])
+        self.assertEqual(Box.Corners(1, 2, 3, 4)[SOUTH_EAST], 3)
+
+    def test_rejects_mutable_configuration(self):
+        with self.assertRaises(TypeError):
+            @enum_dataclass(compiled=True, frozen=False)
+            class MutablePair(AxisDataclass[int]):
+                ...
+
+
+if __name__ == '__main__':
+    unittest.main()
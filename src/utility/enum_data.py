@@ -5,6 +5,12 @@ from typing import Final, Generic, no_type_check_decorator, Type, TypeVar
 
 from utility.helpers import resolve_type_arguments
 
+try:
+    # the same C accelerated field descriptor used by collections.namedtuple
+    from _collections import _tuplegetter
+except ImportError:
+    _tuplegetter = lambda index, doc: property(lambda self: tuple.__getitem__(self, index), doc=doc)
+
 
 T = TypeVar('T')
 VT = TypeVar('VT')
@@ -12,16 +18,24 @@ VT = TypeVar('VT')
 class DataEnum(Enum):
     """
     provides a snake_case_name member string for each enum member, which is more suitable for member names in corresponding dataclasses.
+    Also provides the ordinal (declaration index) of each member, for indexing compact storage. Members can be used directly as sequence indices via __index__ (e.g. by compiled EnumDataclasses).
     """
 
     snake_case_name: Final[str]
+    ordinal: Final[int]
 
     def __init__(self, *args):
         self.snake_case_name = self.name.lower()
+        self.ordinal = len(self.__class__._member_names_)
+
+    def __index__(self) -> int:
+        return self.ordinal
 
 DCEnumT = TypeVar('DCEnumT', bound=DataEnum)
 
 class EnumDataclass(Generic[DCEnumT, T]):
+    __slots__ = ()
+
     @singledispatchmethod
     @classmethod
     def _make(cls, *args, **kwargs):
@@ -59,8 +73,101 @@ class EnumDataclass(Generic[DCEnumT, T]):
         return iter(map(lambda x: getattr(self, x.name), dataclasses.fields(self)))
 
 
+def _unsupported(symbol: str, reflected: bool = False):
+    """
+    Builds a binary operator which raises the TypeError that an operator without any implementation would, e.g. to stop compiled EnumDataclasses from being concatenated or repeated as tuples.
+    """
+    def method(self, other):
+        (left, right) = (other, self) if reflected else (self, other)
+        raise TypeError(f"unsupported operand type(s) for {symbol}: '{left.__class__.__name__}' and '{right.__class__.__name__}'")
+    return method
+
+def _unordered(symbol: str):
+    """
+    Builds a comparison which raises the TypeError that comparing unordered objects would, since compiled EnumDataclasses are unordered like dataclasses, rather than ordered like tuples.
+    """
+    def method(self, other):
+        raise TypeError(f"'{symbol}' not supported between instances of '{self.__class__.__name__}' and '{other.__class__.__name__}'")
+    return method
+
+def _compile(cls, enum: Type[DCEnumT]):
+    """
+    Builds the tuple-backed equivalent of an EnumDataclass subclass, in the same spirit as collections.namedtuple.
+    Values are stored in enum declaration order, so they can be accessed by each member's ordinal without any string attribute lookup, and indexing, iteration and hashing are those of tuple itself.
+    Otherwise it behaves as the equivalent frozen dataclass rather than as a tuple: it is only equal to instances of the same class, it is unordered, and it cannot be concatenated or repeated (unless the class defines those operators itself, e.g. Vector).
+    """
+    field_names = tuple(each.snake_case_name for each in enum)
+    arguments = ', '.join(field_names)
+    generated = {'_tuple_new': tuple.__new__}
+    exec(
+        f'def __new__(_cls, {arguments}):\n'
+        f'    return _tuple_new(_cls, ({arguments},))\n',
+        generated
+    )
+
+    def __setitem__(self, item: DCEnumT, value):
+        raise dataclasses.FrozenInstanceError(f'cannot assign to field {item.snake_case_name!r}')
+
+    def __repr__(self):
+        return f'{self.__class__.__qualname__}({", ".join(f"{name}={value!r}" for (name, value) in zip(field_names, self))})'
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    def _replace(self, data: dict[DCEnumT, VT]):
+        values = list(self)
+        for (key, value) in data.items():
+            values[key.ordinal] = value
+        return tuple.__new__(self.__class__, values)
+
+    def _as_dict(self) -> dict[DCEnumT, VT]:
+        return dict(zip(enum, self))
+
+    def __eq__(self, other):
+        if other.__class__ is self.__class__:
+            return tuple.__eq__(self, other)
+        #other tuples would otherwise compare equal through their own (reflected) __eq__.
+        return False if isinstance(other, tuple) else NotImplemented
+
+    def __ne__(self, other):
+        result = __eq__(self, other)
+        return result if result is NotImplemented else not result
+
+    namespace = {
+        key: value for (key, value) in cls.__dict__.items()
+        if key not in ('__dict__', '__weakref__')
+    }
+    namespace.update({
+        '__qualname__': cls.__qualname__,
+        '__slots__': (),
+        '__new__': generated['__new__'],
+        #tuple.__getitem__ still converts each member through DataEnum.__index__, but skips looking up the attribute by name.
+        '__getitem__': tuple.__getitem__,
+        '__setitem__': __setitem__,
+        '__iter__': tuple.__iter__,
+        '__len__': tuple.__len__,
+        '__repr__': __repr__,
+        '__getnewargs__': __getnewargs__,
+        '__match_args__': field_names,
+        '_fields': field_names,
+        '_replace': _replace,
+        '_as_dict': _as_dict,
+        '__eq__': __eq__,
+        '__ne__': __ne__,
+        '__hash__': tuple.__hash__,
+    })
+    for (each_name, each_method) in (
+            ('__lt__', _unordered('<')), ('__le__', _unordered('<=')), ('__gt__', _unordered('>')), ('__ge__', _unordered('>=')),
+            ('__add__', _unsupported('+')), ('__radd__', _unsupported('+', True)), ('__mul__', _unsupported('*')), ('__rmul__', _unsupported('*', True)),
+    ):
+        namespace.setdefault(each_name, each_method)
+    for (each_member, each_name) in zip(enum, field_names):
+        namespace[each_name] = _tuplegetter(each_member.ordinal, f'Value for {each_member!r}')
+    return type(cls)(cls.__name__, (*cls.__bases__, tuple), namespace)
+
+
 @no_type_check_decorator
-def enum_dataclass(cls=None, /, **kwargs):
+def enum_dataclass(cls=None, /, *, compiled=False, **kwargs):
     """
     Companion decorator for turning subclasses of EnumDataclass into actual dataclasses, allowing them to separately specific other parameters like frozen.
     Similar to a dataclass, except that the fields are deduced from the type parameters of EnumDataclass instead of from annotations (annotations may be provided for autocomplete/DE hinting but have no effect on the runtime dataclass.)
@@ -68,7 +175,9 @@ def enum_dataclass(cls=None, /, **kwargs):
     :param cls: the class to decorate.
     :param enum: the enum whose members act as dataclass fields. These are not inferred from the inherited classes of the decorated class at this time, although they should match to ensure proper hinting.
     :param value: the value type (can be a real type or generic alias)
-    :param kwargs: these arguments are forwarded to the call to dataclasses.dataclass
+    :param compiled: if true, generates a tuple-backed class instead of a dataclass, whose values are stored and indexed by enum ordinal. This is much faster for indexing by enum member, iterating and construction, and should be used for the value types in hot paths (e.g. Vector).
+        Compiled classes are always immutable, and compare and hash like frozen dataclasses (see _compile).
+    :param kwargs: these arguments are forwarded to the call to dataclasses.dataclass (only frozen=True is accepted in compiled mode, since it is implied)
     :return:
     """
     def wrap(cls):
@@ -80,8 +189,13 @@ def enum_dataclass(cls=None, /, **kwargs):
             original_annotations = cls.__annotations__
         except AttributeError:
             original_annotations = {}
-        cls.__annotations__ = {key.snake_case_name: value for key in enum}
-        result = dataclasses.dataclass(cls, **kwargs)
+        if compiled:
+            if any(key != 'frozen' or not value for (key, value) in kwargs.items()):
+                raise TypeError(f'Compiled enum dataclasses are always frozen and do not accept {kwargs}')
+            result = _compile(cls, enum)
+        else:
+            cls.__annotations__ = {key.snake_case_name: value for key in enum}
+            result = dataclasses.dataclass(cls, **kwargs)
         result.__annotations__ = {**original_annotations, **new_annotations}
 
         return result